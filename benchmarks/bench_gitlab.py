@@ -0,0 +1,214 @@
+"""End-to-end benchmark of ``dataextractor -g`` against a local GitLab stand-in.
+
+Each scenario starts a FakeGitLabServer and runs the real CLI in a child
+process, reading its stdout to time the first ``Project:`` row. Peak memory
+is the child's own RSS high-water mark (VmHWM), so interpreter start-up is
+included but the parent's footprint is not.
+
+    python -m benchmarks.bench_gitlab                 # compare with baselines
+    python -m benchmarks.bench_gitlab --record        # overwrite baselines
+    python -m benchmarks.bench_gitlab -s concurrent --projects 20000
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from benchmarks.fake_gitlab import ACCESS_LEVELS, FakeGitLabServer, ServerOptions
+
+ROOT = Path(__file__).resolve().parent.parent
+PEAK_RSS_MARKER = "bench-peak-rss-kib="
+
+# ru_maxrss survives exec on Linux, so a child would report the parent's
+# peak; VmHWM belongs to the new address space and starts from zero.
+CHILD_BOOTSTRAP = f"""
+import atexit, runpy, sys
+
+def report_peak_rss():
+    with open("/proc/self/status", encoding="ascii") as status:
+        for line in status:
+            if line.startswith("VmHWM:"):
+                print("{PEAK_RSS_MARKER}" + line.split()[1], file=sys.stderr)
+
+atexit.register(report_peak_rss)
+sys.argv[0] = "dataextractor"
+runpy.run_module("dataextractor", run_name="__main__", alter_sys=True)
+"""
+BASELINES_FILE = Path(__file__).resolve().parent / "baselines.json"
+
+
+@dataclass
+class Scenario:
+    name: str
+    args: list[str]
+    rate_limit: int = 0  # requests per rate_window, 0 = unlimited
+    rate_window: float = 60.0  # seconds
+    # Runs before the measured one, e.g. to warm an on-disk cache
+    warmup_runs: int = 0
+    access_levels: tuple[int, ...] = ACCESS_LEVELS  # levels dealt out to the projects
+
+
+SCENARIOS = [
+    Scenario("sequential", []),
+    Scenario("concurrent", ["--git-concurrency", "8"]),
+    Scenario("lean", ["--lean", "--git-concurrency", "8"]),
+    # Developer everywhere: the lean listing needs no Reporter or Guest pass
+    Scenario("lean-developer", ["--lean", "--git-concurrency", "8"], access_levels=(30,)),
+    Scenario("graphql", ["--git-backend", "graphql"]),
+    Scenario("skip-auth", ["--skip-auth", "--git-concurrency", "8"]),
+    Scenario("http-cache", ["--http-cache", "--git-concurrency", "8"], warmup_runs=1),
+    Scenario("rate-limited", ["--git-concurrency", "8"], rate_limit=50, rate_window=10.0),
+]
+
+
+@dataclass
+class Result:  # pylint: disable=too-many-instance-attributes
+    wall_time: float  # seconds
+    time_to_first_row: float | None  # seconds
+    rows: int
+    requests: int
+    requests_per_second: float
+    peak_rss_mb: float
+    response_mb: float  # response bodies sent by the server
+    throttled: int = 0
+
+
+def run_cli(url: str, args: list[str], env: dict[str, str]) -> tuple[float, float | None, int, int]:
+    """Run ``dataextractor -g`` once; return wall time, TTFR, rows and peak RSS in KiB."""
+    command = [
+        sys.executable, "-c", CHILD_BOOTSTRAP, "-g", "--no-env",
+        "--git-url", url, "--git-token", "bench-token", *args,
+    ]
+    start = time.perf_counter()
+    first_row = None
+    rows = 0
+    with tempfile.TemporaryFile() as stderr:
+        with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=stderr, env=env, cwd=ROOT) as process:
+            for line in process.stdout:
+                if line.startswith(b"Project:"):
+                    if first_row is None:
+                        first_row = time.perf_counter() - start
+                    rows += 1
+        wall_time = time.perf_counter() - start
+        stderr.seek(0)
+        errors = stderr.read().decode("utf-8", "replace")
+
+    if process.returncode:
+        raise RuntimeError(f"dataextractor exited with {process.returncode}:\n{errors}")
+    peak_rss = [line.removeprefix(PEAK_RSS_MARKER) for line in errors.splitlines() if line.startswith(PEAK_RSS_MARKER)]
+    return wall_time, first_row, rows, int(peak_rss[-1]) if peak_rss else 0
+
+
+def _child_env() -> dict[str, str]:
+    return {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(filter(None, [str(ROOT / "src"), os.environ.get("PYTHONPATH")])),
+        # Rows must reach the pipe as they are printed for TTFR to mean anything
+        "PYTHONUNBUFFERED": "1",
+    }
+
+
+def run_scenario(scenario: Scenario, projects: int, latency: float) -> Result:
+    options = ServerOptions(
+        projects=projects,
+        latency=latency,
+        rate_limit=scenario.rate_limit,
+        rate_window=scenario.rate_window,
+        access_levels=scenario.access_levels,
+    )
+    with tempfile.TemporaryDirectory() as workdir, FakeGitLabServer(options) as server:
+        args = [*scenario.args, "--git-state-dir", workdir, "--http-cache-dir", workdir]
+        for _ in range(scenario.warmup_runs):
+            run_cli(server.url, args, _child_env())
+
+        before = (server.requests, server.throttled, server.bytes_sent)
+        wall_time, first_row, rows, max_rss_kib = run_cli(server.url, args, _child_env())
+        requests, throttled, bytes_sent = (
+            server.requests - before[0],
+            server.throttled - before[1],
+            server.bytes_sent - before[2],
+        )
+
+    if rows != projects:
+        raise RuntimeError(f"{scenario.name}: expected {projects} rows, got {rows}")
+    return Result(
+        wall_time=round(wall_time, 3),
+        time_to_first_row=round(first_row, 3) if first_row is not None else None,
+        rows=rows,
+        requests=requests,
+        requests_per_second=round(requests / wall_time, 1),
+        peak_rss_mb=round(max_rss_kib / 1024, 1),
+        response_mb=round(bytes_sent / 1024 / 1024, 2),
+        throttled=throttled,
+    )
+
+
+def compare(name: str, result: Result, baseline: dict, tolerance: float) -> list[str]:
+    """Regressions of `result` against `baseline`, as printable messages."""
+    regressions = []
+    for metric in ("wall_time", "time_to_first_row", "peak_rss_mb", "requests", "response_mb"):
+        before, after = baseline.get(metric), getattr(result, metric)
+        if before and after is not None and after > before * (1 + tolerance):
+            regressions.append(f"{name}: {metric} {before} -> {after} (+{after / before - 1:.0%})")
+    return regressions
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "-s", "--scenario", action="append", choices=[s.name for s in SCENARIOS],
+        help="Scenario to run (repeatable; default: all)",
+    )
+    parser.add_argument("--projects", type=int, default=5000, help="Synthetic projects served")
+    parser.add_argument("--latency", type=float, default=0.02, help="Seconds added to every response")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown before failing")
+    parser.add_argument("--baselines", type=Path, default=BASELINES_FILE, help="Baselines JSON file")
+    parser.add_argument("--record", action="store_true", help="Store results as the new baselines")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    selected = [s for s in SCENARIOS if not args.scenario or s.name in args.scenario]
+    key = f"projects={args.projects},latency={args.latency}"
+
+    baselines = json.loads(args.baselines.read_text()) if args.baselines.exists() else {}
+    recorded = baselines.get(key, {})
+
+    regressions = []
+    print(
+        f"{'scenario':<14}{'wall s':>9}{'ttfr s':>9}{'req':>7}{'req/s':>9}"
+        f"{'rss MB':>9}{'resp MB':>9}{'429s':>6}"
+    )
+    for scenario in selected:
+        result = run_scenario(scenario, args.projects, args.latency)
+        ttfr = f"{result.time_to_first_row:.3f}" if result.time_to_first_row is not None else "-"
+        print(
+            f"{scenario.name:<14}{result.wall_time:>9.3f}{ttfr:>9}{result.requests:>7}"
+            f"{result.requests_per_second:>9.1f}{result.peak_rss_mb:>9.1f}"
+            f"{result.response_mb:>9.2f}{result.throttled:>6}"
+        )
+        if scenario.name in recorded:
+            regressions += compare(scenario.name, result, recorded[scenario.name], args.tolerance)
+        if args.record:
+            recorded[scenario.name] = asdict(result)
+
+    if args.record:
+        baselines[key] = recorded
+        args.baselines.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        print(f"Baselines written to {args.baselines}")
+        return 0
+
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,311 @@
+"""A local GitLab stand-in serving synthetic membership projects.
+
+Only what dataextractor touches is implemented: ``/user`` for the auth
+probe, ``/projects`` with offset pagination, ``simple``,
+``min_access_level``, ``last_activity_after``, ETags and RateLimit headers,
+``/projects/:id`` by id or URL-encoded path, ``/projects/:id/repository/commits``
+with ``since``, and the GraphQL ``projects`` query (variables only; the
+query text is not parsed).
+"""
+
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlencode, urlsplit
+
+ACCESS_LEVELS = (10, 20, 30, 40, 50)
+MAX_PER_PAGE = 100
+# GitLab stops reporting totals above this many results
+TOTALS_LIMIT = 10_000
+BASE_ACTIVITY = datetime(2024, 1, 1, tzinfo=timezone.utc)
+NOT_FOUND = b'{"message":"404 Project Not Found"}'
+# Stand-in for the many fields of a full project payload that we never read
+PADDING = "x" * 2048
+
+
+@dataclass
+class ServerOptions:
+    projects: int = 1000
+    latency: float = 0.0  # seconds added to every response
+    rate_limit: int = 0  # requests per window, 0 = unlimited
+    rate_window: float = 60.0  # seconds
+    commits: int = 20  # history length of every project
+    access_levels: tuple[int, ...] = ACCESS_LEVELS  # dealt out to projects in turn
+
+
+def _project(project_id: int, host: str, access_levels: tuple[int, ...] = ACCESS_LEVELS) -> dict:
+    namespace = f"group-{project_id % 50}/team-{project_id % 7}"
+    path = f"project-{project_id}"
+    return {
+        "id": project_id,
+        "name": path,
+        "path": path,
+        "path_with_namespace": f"{namespace}/{path}",
+        "http_url_to_repo": f"{host}/{namespace}/{path}.git",
+        "web_url": f"{host}/{namespace}/{path}",
+        "last_activity_at": (BASE_ACTIVITY + timedelta(minutes=project_id)).isoformat().replace(
+            "+00:00", "Z"
+        ),
+        "access_level": access_levels[project_id % len(access_levels)],
+    }
+
+
+def _full_view(project: dict) -> dict:
+    view = {k: v for k, v in project.items() if k != "access_level"}
+    view["description"] = PADDING
+    view["permissions"] = {
+        "project_access": {"access_level": project["access_level"]},
+        "group_access": None,
+    }
+    return view
+
+
+def _simple_view(project: dict) -> dict:
+    return {k: v for k, v in project.items() if k != "access_level"}
+
+
+def _flag(query: dict[str, str], name: str) -> bool:
+    # GitLab accepts any casing; python-gitlab sends simple=True
+    return query.get(name, "").lower() == "true"
+
+
+def _commit(project: dict, number: int, date: datetime) -> dict:
+    sha = hashlib.sha1(f"{project['id']}-{date.isoformat()}".encode()).hexdigest()
+    stamp = date.isoformat().replace("+00:00", "Z")
+    return {
+        "id": sha,
+        "short_id": sha[:8],
+        "title": f"Commit {number} of {project['name']}",
+        "author_name": "Bench Author",
+        "author_email": "author@example.com",
+        "authored_date": stamp,
+        "committer_name": "Bench Committer",
+        "committer_email": "committer@example.com",
+        "committed_date": stamp,
+        "parent_ids": [],
+    }
+
+
+class FakeGitLabServer:  # pylint: disable=too-many-instance-attributes
+    def __init__(self, options: ServerOptions | None = None):
+        self.options = options or ServerOptions()
+        self.requests = 0
+        self.bytes_sent = 0
+        self.throttled = 0
+        self._lock = threading.Lock()
+        self._window_start = time.time()
+        self._window_count = 0
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self.url = f"http://127.0.0.1:{self._server.server_port}"
+        self._projects = [
+            _project(i, self.url, self.options.access_levels) for i in range(1, self.options.projects + 1)
+        ]
+        self._by_reference = {str(p["id"]): p for p in self._projects}
+        self._by_reference.update((p["path_with_namespace"], p) for p in self._projects)
+        self._pages: dict[str, tuple[bytes, dict[str, str]]] = {}
+
+    def __enter__(self) -> "FakeGitLabServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def rate_limit_headers(self) -> tuple[dict[str, str], bool]:
+        """Account one request; return the headers and whether it is allowed."""
+        if not self.options.rate_limit:
+            return {}, True
+        with self._lock:
+            now = time.time()
+            if now - self._window_start >= self.options.rate_window:
+                self._window_start = now
+                self._window_count = 0
+            self._window_count += 1
+            remaining = self.options.rate_limit - self._window_count
+            reset = self._window_start + self.options.rate_window
+        headers = {
+            "RateLimit-Limit": str(self.options.rate_limit),
+            "RateLimit-Remaining": str(max(remaining, 0)),
+            "RateLimit-Reset": str(int(reset)),
+        }
+        if remaining < 0:
+            headers["Retry-After"] = str(max(int(reset - now), 1))
+            return headers, False
+        return headers, True
+
+    def render_projects(self, query: dict[str, str]) -> tuple[bytes, dict[str, str]]:
+        key = urlencode(sorted(query.items()))
+        cached = self._pages.get(key)
+        if cached is not None:
+            return cached
+
+        projects = self._projects
+        if query.get("min_access_level"):
+            level = int(query["min_access_level"])
+            projects = [p for p in projects if p["access_level"] >= level]
+        if query.get("last_activity_after"):
+            since = query["last_activity_after"]
+            projects = [p for p in projects if p["last_activity_at"] >= since]
+
+        page = int(query.get("page", 1))
+        per_page = min(int(query.get("per_page", 20)), MAX_PER_PAGE)
+        start = (page - 1) * per_page
+        view = _simple_view if _flag(query, "simple") else _full_view
+        body = json.dumps([view(p) for p in projects[start:start + per_page]]).encode("utf-8")
+
+        total_pages = max(-(-len(projects) // per_page), 1)
+        headers = {
+            "X-Page": str(page),
+            "X-Per-Page": str(per_page),
+            "ETag": f'W/"{hashlib.sha1(body).hexdigest()}"',
+        }
+        if len(projects) <= TOTALS_LIMIT:
+            headers["X-Total"] = str(len(projects))
+            headers["X-Total-Pages"] = str(total_pages)
+        if start + per_page < len(projects):
+            headers["X-Next-Page"] = str(page + 1)
+            next_query = urlencode({**query, "page": page + 1})
+            headers["Link"] = f'<{self.url}/api/v4/projects?{next_query}>; rel="next"'
+
+        self._pages[key] = (body, headers)
+        return body, headers
+
+    def render_commits(self, reference: str, query: dict[str, str]) -> tuple[int, bytes, dict[str, str]]:
+        project = self._by_reference.get(unquote(reference))
+        if project is None:
+            return 404, NOT_FOUND, {}
+        # Newest first, one hour apart, ending at the project's last activity
+        last = datetime.fromisoformat(project["last_activity_at"])
+        dates = [last - timedelta(hours=n) for n in range(self.options.commits)]
+        if query.get("since"):
+            since = datetime.fromisoformat(query["since"])
+            dates = [d for d in dates if d >= since]
+
+        page = int(query.get("page", 1))
+        per_page = min(int(query.get("per_page", 20)), MAX_PER_PAGE)
+        start = (page - 1) * per_page
+        commits = [_commit(project, n, d) for n, d in enumerate(dates[start:start + per_page], start)]
+        headers = {"X-Page": str(page), "X-Per-Page": str(per_page), "X-Total": str(len(dates))}
+        if start + per_page < len(dates):
+            headers["X-Next-Page"] = str(page + 1)
+            next_query = urlencode({**query, "page": page + 1})
+            headers["Link"] = f'<{self.url}/api/v4/projects/{reference}/repository/commits?{next_query}>; rel="next"'
+        return 200, json.dumps(commits).encode("utf-8"), headers
+
+    def render_project(self, reference: str) -> tuple[int, bytes, dict[str, str]]:
+        project = self._by_reference.get(unquote(reference))
+        if project is None:
+            return 404, NOT_FOUND, {}
+        return 200, json.dumps(_full_view(project)).encode("utf-8"), {}
+
+    def render_graphql(self, variables: dict) -> bytes:
+        projects = self._projects
+        # Like GitLab, both filters apply at once
+        if variables.get("fullPaths") is not None:
+            paths = set(variables["fullPaths"])
+            projects = [p for p in projects if p["path_with_namespace"] in paths]
+        if variables.get("ids") is not None:
+            ids = {i.rpartition("/")[2] for i in variables["ids"]}
+            projects = [p for p in projects if str(p["id"]) in ids]
+
+        start = int(variables.get("after") or 0)
+        end = start + min(int(variables.get("first", 100)), MAX_PER_PAGE)
+        nodes = [
+            {
+                "id": f"gid://gitlab/Project/{p['id']}",
+                "name": p["name"],
+                "fullPath": p["path_with_namespace"],
+                "httpUrlToRepo": p["http_url_to_repo"],
+                "lastActivityAt": p["last_activity_at"],
+                "maxAccessLevel": {"integerValue": p["access_level"]},
+                "repository": {"rootRef": "main"},
+            }
+            for p in projects[start:end]
+        ]
+        page_info = {"hasNextPage": end < len(projects), "endCursor": str(end)}
+        return json.dumps({"data": {"projects": {"pageInfo": page_info, "nodes": nodes}}}).encode("utf-8")
+
+    def respond_get(self, path: str, if_none_match: str | None) -> tuple[int, bytes, dict[str, str]]:
+        url = urlsplit(path)
+        if url.path == "/api/v4/user":
+            return 200, b'{"id": 1, "username": "bench"}', {}
+        if url.path == "/api/v4/projects":
+            body, headers = self.render_projects({k: v[0] for k, v in parse_qs(url.query).items()})
+            if if_none_match == headers["ETag"]:
+                return 304, b"", headers
+            return 200, body, headers
+        if url.path.startswith("/api/v4/projects/"):
+            reference = url.path.removeprefix("/api/v4/projects/")
+            if reference.endswith("/repository/commits"):
+                query = {k: v[0] for k, v in parse_qs(url.query).items()}
+                return self.render_commits(reference.removesuffix("/repository/commits"), query)
+            return self.render_project(reference)
+        return 404, b'{"message":"404 Not Found"}', {}
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; without this every
+            # keep-alive response waits out the client's delayed ACK.
+            disable_nagle_algorithm = True
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                headers = self._admit()
+                if headers is None:
+                    return
+
+                status, body, response_headers = server.respond_get(
+                    self.path, self.headers.get("If-None-Match")
+                )
+                self._send(status, body, {**headers, **response_headers})
+
+            def do_POST(self):  # pylint: disable=invalid-name
+                request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                headers = self._admit()
+                if headers is None:
+                    return
+                if urlsplit(self.path).path == "/api/graphql":
+                    self._send(200, server.render_graphql(request.get("variables") or {}), headers)
+                else:
+                    self._send(404, b'{"message":"404 Not Found"}', headers)
+
+            def _admit(self) -> dict[str, str] | None:
+                """Count, delay and rate-limit one request; None if it got a 429."""
+                with server._lock:  # pylint: disable=protected-access
+                    server.requests += 1
+                if server.options.latency:
+                    time.sleep(server.options.latency)
+
+                headers, allowed = server.rate_limit_headers()
+                if not allowed:
+                    with server._lock:  # pylint: disable=protected-access
+                        server.throttled += 1
+                    self._send(429, b'{"message":"429 Too Many Requests"}', headers)
+                    return None
+                return headers
+
+            def _send(self, status: int, body: bytes, headers: dict[str, str]) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                if body:
+                    self.wfile.write(body)
+                with server._lock:  # pylint: disable=protected-access
+                    server.bytes_sent += len(body)
+
+            def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+                pass
+
+        return Handler
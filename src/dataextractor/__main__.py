@@ -4,10 +4,319 @@ try:
 except ImportError:
     pass  # Not on Windows or package not installed
 
+import io
+import math
+import sys
+import threading
+from argparse import Namespace
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from itertools import chain
+from typing import Any, NamedTuple, TextIO
+
 from dataextractor.cli import CliHandler
 from dataextractor.config import Settings
-from dataextractor.core.use_cases import ListProjectsUseCase
-from dataextractor.infrastructure.gitlab import GitLabProjectRepository
+from dataextractor.config.env import STATE_DIR_NAME, resolve_project_path
+from dataextractor.core.entities import CommitInfo, IssueInfo, ProjectInfo, TransitionInfo, WorklogInfo
+from dataextractor.core.interfaces import CommitRepository, ProjectRepository, RowSink, SyncResult
+from dataextractor.core.use_cases import (
+    CommitExtractionResult,
+    ExtractCommitsUseCase,
+    ExtractIssueLogsUseCase,
+    ListProjectsUseCase,
+    Pipeline,
+    StageMetrics,
+    SyncIssuesUseCase,
+    SyncProjectsUseCase,
+)
+from dataextractor.core.use_cases.pipeline import batched, merge
+from dataextractor.infrastructure.git import GitMirrorCommitRepository
+from dataextractor.infrastructure.gitlab import (
+    GitLabCommitRepository,
+    GitLabConnection,
+    GitLabProjectRepository,
+    GraphQLGitLabProjectRepository,
+)
+from dataextractor.infrastructure.http import token_identity
+from dataextractor.infrastructure.jira import JiraIssueLogRepository, JiraIssueRepository, JiraProjectRepository
+from dataextractor.infrastructure.output import SharedSink, create_sink, writes_rows_to_stdout
+from dataextractor.infrastructure.state import JsonProjectStateStore, JsonWatermarkStore
+
+
+def _create_git_repository(settings: Settings) -> ProjectRepository:
+    if settings.git.backend == "graphql":
+        return GraphQLGitLabProjectRepository(settings)
+    return GitLabProjectRepository(settings)
+
+
+class _GitListing(NamedTuple):
+    settings: Settings  # for this instance
+    repository: ProjectRepository
+    batches: Iterable[Sequence[ProjectInfo]]
+    pipeline: Pipeline | None
+
+
+def _list_git_projects(settings: Settings, full_refresh: bool) -> _GitListing:
+    """Set up one instance's listing; nothing is fetched until `batches` is iterated."""
+    repository = _create_git_repository(settings)
+    if not (settings.git.incremental or full_refresh):
+        pipeline = ListProjectsUseCase(repository).pipeline(
+            batch_size=settings.git.per_page,
+            fetch_workers=settings.git.concurrency,
+            transform_workers=settings.git.transform_workers,
+            queue_size=settings.git.queue_size,
+        )
+        return _GitListing(settings, repository, pipeline, pipeline)
+    return _GitListing(settings, repository, _iter_synced_projects(settings, repository, full_refresh), None)
+
+
+def _iter_synced_projects(
+    settings: Settings, repository: ProjectRepository, full_refresh: bool
+) -> Iterator[list[ProjectInfo]]:
+    # Incremental sync merges into the previous snapshot, so it needs the
+    # complete list before anything can be emitted.
+    state_dir = resolve_project_path(settings.git.state_dir or STATE_DIR_NAME)
+    # Snapshots of other tokens or allowlists list other projects
+    scope = [token_identity(settings.git.token), *sorted(set(settings.git.projects))]
+    store = JsonProjectStateStore(state_dir, settings.git.url, scope)
+    projects = SyncProjectsUseCase(repository, store).execute(full_refresh=full_refresh)
+    yield from batched(projects, settings.git.per_page)
+
+
+def _source_label(settings: Settings) -> str:
+    return f"[{settings.git.source}] " if settings.git.source else ""
+
+
+def _print_stage_metrics(listing: _GitListing, status: TextIO) -> None:
+    pipeline = listing.pipeline
+    label = _source_label(listing.settings)
+    metrics: list[StageMetrics] = pipeline.metrics()
+    rate = metrics[-1].items / pipeline.elapsed if pipeline.elapsed else 0.0
+    print(
+        f"{label}Pipeline: {metrics[-1].items} items in {pipeline.elapsed:.2f}s ({rate:.1f} items/s)",
+        file=status,
+    )
+    for stage in metrics:
+        # A stage busy for about the whole run is the bottleneck; full
+        # queues in front of it show the stages it is holding back.
+        print(
+            f"{label}Stage {stage.name}: {stage.workers} worker(s), {stage.items} items in {stage.batches} batches, "
+            f"busy {stage.busy_seconds:.2f}s, max queue {stage.max_queue_depth}/{pipeline.queue_size}",
+            file=status,
+        )
+
+
+def _print_scheduler_metrics(listing: _GitListing, status: TextIO) -> None:
+    metrics = listing.repository.scheduler.metrics()
+    rate = "unbounded" if math.isinf(metrics.current_rate) else f"{metrics.current_rate:.1f} req/s"
+    print(
+        f"{_source_label(listing.settings)}Requests: {metrics.requests} sent, {metrics.throttled} throttled, "
+        f"{metrics.retries} retried, rate {rate}",
+        file=status,
+    )
+
+
+def _format_project(project: ProjectInfo) -> str:
+    return f"Project: {project.path_with_namespace} Access Level: {project.access_level_name}"
+
+
+def _write_projects(
+    settings: Settings, sink: RowSink, projects: Iterator[ProjectInfo], listings: Sequence[_GitListing]
+) -> SyncResult:
+    # Database outputs skip unchanged rows either way, but only drop the
+    # projects that are gone from instances listed in full in this run: a
+    # git_projects allowlist (and any entry of it that did not resolve)
+    # says nothing about the rest, and other instances were not listed.
+    complete = {listing.settings.git.source for listing in listings if not listing.settings.git.projects}
+    return sink.sync(settings.outputs.git_table_name or "git_data", projects, sources=complete)
+
+
+def _format_commit(commit: CommitInfo) -> str:
+    return f"Commit: {commit.project_path} {commit.sha[:12]} {commit.committed_date} {commit.title}"
+
+
+def _create_commit_repository(settings: Settings) -> CommitRepository:
+    if settings.git.mirror:
+        mirror_dir = resolve_project_path(settings.git.mirror_dir or f"{STATE_DIR_NAME}/mirrors")
+        return GitMirrorCommitRepository(settings, mirror_dir)
+    # API history always comes through REST; the listing backend only picks projects
+    return GitLabCommitRepository(GitLabConnection(settings))
+
+
+def _extract_git_logs(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    settings: Settings, sink: RowSink, listings: list[_GitListing], full_refresh: bool, status: TextIO
+) -> None:
+    # Each instance extracts on its own thread, like the listings they come
+    # from, so the run takes as long as the slowest instance; they take
+    # turns on the sink.
+    shared = SharedSink(sink) if len(listings) > 1 else sink
+    with ThreadPoolExecutor(max_workers=len(listings), thread_name_prefix="git-logs") as executor:
+        futures = [
+            executor.submit(_extract_instance_logs, settings, shared, listing, full_refresh) for listing in listings
+        ]
+    results = [future.result() for future in futures]
+    for listing, result in zip(listings, results):
+        for path, error in result.failed.items():
+            print(f"Failed project: {_source_label(listing.settings)}{path} ({error})", file=sys.stderr)
+
+    rows = sum(r.rows for r in results)
+    projects = sum(r.projects for r in results)
+    print(f"Total commits: {rows} from {projects} repositories", file=status)
+
+
+def _extract_instance_logs(
+    settings: Settings, sink: RowSink, listing: _GitListing, full_refresh: bool
+) -> CommitExtractionResult:
+    source = listing.settings
+    state_dir = resolve_project_path(source.git.state_dir or STATE_DIR_NAME)
+    return ExtractCommitsUseCase(
+        _create_commit_repository(source),
+        sink,
+        JsonWatermarkStore(state_dir, source.git.url, "commits"),
+        table=settings.outputs.logs_git_table_name or "git_logs",
+        concurrency=source.git.concurrency,
+    ).execute(chain.from_iterable(listing.batches), full_refresh=full_refresh)
+
+
+def _format_issue(issue: IssueInfo) -> str:
+    return f"Issue: {issue.key} [{issue.status}] {issue.summary}"
+
+
+def _format_transition(transition: TransitionInfo) -> str:
+    return f"Transition: {transition.issue_key} {transition.created} {transition.from_status} -> {transition.to_status}"
+
+
+def _format_worklog(worklog: WorklogInfo) -> str:
+    return f"Worklog: {worklog.issue_key} {worklog.started} {worklog.time_spent_seconds}s {worklog.author}"
+
+
+_FORMATTERS: dict[type, Callable] = {
+    ProjectInfo: _format_project,
+    CommitInfo: _format_commit,
+    IssueInfo: _format_issue,
+    TransitionInfo: _format_transition,
+    WorklogInfo: _format_worklog,
+}
+
+
+def _format_jira_project(project: ProjectInfo) -> str:
+    return f"Project: {project.path_with_namespace} {project.name}"
+
+
+def _row_formatter(settings: Settings) -> Callable[[str, Any], str]:
+    # Jira projects are ProjectInfo too, so the table picks their format
+    jira_table = settings.outputs.jira_table_name or "jira_data"
+
+    def format_row(table: str, row: Any) -> str:
+        if table == jira_table:
+            return _format_jira_project(row)
+        return _FORMATTERS[type(row)](row)
+
+    return format_row
+
+
+class _LabelledStatus(io.TextIOBase):
+    """Status stream that starts every line with its extraction's name.
+
+    Lines are written whole, so with -g -j the two extractions interleave
+    line by line and each line says which one it came from.
+    """
+
+    _lock = threading.Lock()  # shared by every label writing to the stream
+
+    def __init__(self, label: str, stream: TextIO):
+        super().__init__()
+        self._label = label
+        self._stream = stream
+        self._pending = ""
+
+    def write(self, s: str) -> int:
+        *lines, self._pending = (self._pending + s).split("\n")
+        if lines:
+            with self._lock:
+                self._stream.write("".join(f"{self._label}: {line}\n" for line in lines))
+        return len(s)
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+
+def _print_changes(result: SyncResult, status: TextIO) -> None:
+    print(
+        f"Changes: {result.inserted} inserted, {result.updated} updated, "
+        f"{result.deleted} deleted, {result.unchanged} unchanged",
+        file=status,
+    )
+
+
+def _extract_jira_logs(settings: Settings, sink: RowSink, full_refresh: bool, status: TextIO) -> None:
+    repository = JiraProjectRepository(settings)
+    projects = repository.get_all_projects()
+    table = settings.outputs.logs_jira_table_name or "jira_logs"
+    state_dir = resolve_project_path(settings.jira.state_dir or STATE_DIR_NAME)
+    result = ExtractIssueLogsUseCase(
+        JiraIssueLogRepository(JiraIssueRepository(repository)),
+        sink,
+        JsonWatermarkStore(state_dir, settings.jira.url, "issue-logs"),
+        tables=(table, f"{table}_worklogs"),
+        overlap=timedelta(minutes=settings.jira.overlap_minutes),
+    ).execute(projects, full_refresh=full_refresh or not settings.jira.incremental)
+    print(f"Total transitions: {result.transitions}, worklogs: {result.worklogs}", file=status)
+
+
+def _extract_jira(settings: Settings, sink: RowSink, full_refresh: bool, status: TextIO) -> None:
+    repository = JiraProjectRepository(settings)
+    projects = repository.get_all_projects()
+    table = settings.outputs.jira_table_name or "jira_data"
+    state_dir = resolve_project_path(settings.jira.state_dir or STATE_DIR_NAME)
+    result = sink.sync(table, projects)
+    print(f"Total projects: {result.total}", file=status)
+    _print_changes(result, status)
+    # Issues stream into the sink as their search pages arrive; a
+    # non-incremental run still records watermarks for the next one.
+    issue_repository = JiraIssueRepository(repository)
+    issues = SyncIssuesUseCase(
+        issue_repository,
+        sink,
+        JsonWatermarkStore(state_dir, settings.jira.url, "issues"),
+        table=f"{table}_issues",
+        overlap=timedelta(minutes=settings.jira.overlap_minutes),
+    ).execute(projects, full_refresh=full_refresh or not settings.jira.incremental)
+    if issues.incremental:
+        print(f"Issues updated since last run: {issues.rows}", file=status)
+    else:
+        print(f"Total issues: {issues.rows}", file=status)
+        _print_changes(issues.changes, status)
+    for name in issue_repository.get_unresolved_fields():
+        print(f"Unresolved field: {name}", file=sys.stderr)
+
+
+def _run_git(settings: Settings, args: Namespace, sink: RowSink, status: TextIO) -> None:
+    listings = [_list_git_projects(s, args.full_refresh) for s in settings.for_each_git_source()]
+    if args.logs:
+        _extract_git_logs(settings, sink, listings, full_refresh=args.full_refresh, status=status)
+    else:
+        # Each instance is listed on its own thread into the one sink
+        batches = merge([listing.batches for listing in listings], settings.git.queue_size)
+        result = _write_projects(settings, sink, chain.from_iterable(batches), listings)
+        print(f"Total repositories: {result.total}", file=status)
+        _print_changes(result, status)
+
+    for listing in listings:
+        if settings.git.pipeline_stats:
+            if listing.pipeline is not None:
+                _print_stage_metrics(listing, status)
+            _print_scheduler_metrics(listing, status)
+        for entry, reason in listing.repository.get_unresolved_projects().items():
+            print(f"Unresolved project: {_source_label(listing.settings)}{entry} ({reason})", file=sys.stderr)
+
+
+def _run_jira(settings: Settings, args: Namespace, sink: RowSink, status: TextIO) -> None:
+    if args.logs:
+        _extract_jira_logs(settings, sink, args.full_refresh, status)
+    else:
+        _extract_jira(settings, sink, args.full_refresh, status)
 
 
 def main():
@@ -15,20 +324,25 @@ def main():
     args = cli.parse()
 
     settings = Settings.load(cli_args=args)
+    # Keep stdout clean when it carries the extracted rows
+    status = sys.stderr if writes_rows_to_stdout(settings.outputs) else sys.stdout
+    runs = [(name, run) for selected, name, run in ((args.g, "git", _run_git), (args.j, "jira", _run_jira)) if selected]
 
-    if args.g:
-        print("git")
-        repository = GitLabProjectRepository(settings)
-        use_case = ListProjectsUseCase(repository)
-        projects = use_case.execute()
-
-        print(f"Total repositories: {len(projects)}")
-        for project in projects:
-            print(f"Project: {project.path_with_namespace} Access Level: {project.access_level_name}")
-
-    elif args.j:
-        print("jira")
-        print("Jira integration not yet implemented")
+    with create_sink(settings.outputs, _row_formatter(settings)) as sink:
+        if len(runs) == 1:
+            name, run = runs[0]
+            print(name, file=status)
+            run(settings, args, sink, status)
+            return
+        # -g -j: both extractions at once, so the run takes as long as the
+        # slower one. They wait on different hosts and take turns on the sink.
+        shared = SharedSink(sink)
+        with ThreadPoolExecutor(max_workers=len(runs), thread_name_prefix="extract") as executor:
+            futures = [
+                executor.submit(run, settings, args, shared, _LabelledStatus(name, status)) for name, run in runs
+            ]
+        for future in futures:
+            future.result()
 
 
 if __name__ == "__main__":
@@ -10,8 +10,8 @@ class CliHandler:
         self.args = None
 
     def _setup_arguments(self):
-        # Source selection (mutually exclusive)
-        group = self.parser.add_mutually_exclusive_group(required=True)
+        # Source selection (at least one; both run concurrently)
+        group = self.parser.add_argument_group("Sources")
         group.add_argument(
             "-g",
             action="store_true",
@@ -20,7 +20,7 @@ class CliHandler:
         group.add_argument(
             "-j",
             action="store_true",
-            help="Extract data from Jira"
+            help="Extract data from Jira (with -g, both run at once into the same output)"
         )
 
         # Configuration options
@@ -60,6 +60,115 @@ class CliHandler:
             nargs="*",
             help="List of Git project URLs"
         )
+        git_group.add_argument(
+            "--git-concurrency",
+            type=int,
+            help="Number of project pages fetched in parallel"
+        )
+        git_group.add_argument(
+            "--git-per-page",
+            type=int,
+            help="Number of projects requested per page (at most 100, GitLab's limit)"
+        )
+        git_group.add_argument(
+            "--git-backend",
+            type=str,
+            choices=["rest", "async", "graphql"],
+            help="GitLab client backend (rest drives all pages from one event loop, async is the same; graphql fetches only the needed fields)"
+        )
+        git_group.add_argument(
+            "--graphql-extras",
+            action="store_true",
+            default=None,
+            help="With the graphql backend, also fetch each project's last activity and default branch"
+        )
+        git_group.add_argument(
+            "--git-transform-workers",
+            type=int,
+            help="Threads converting fetched records while the next pages download"
+        )
+        git_group.add_argument(
+            "--git-queue-size",
+            type=int,
+            help="Batches buffered between pipeline stages before a slow stage blocks the one before it"
+        )
+        git_group.add_argument(
+            "--pipeline-stats",
+            action="store_true",
+            default=None,
+            help="Print per-stage throughput, queue depth and API request counts after listing projects"
+        )
+        git_group.add_argument(
+            "--git-max-rate",
+            type=float,
+            help="Ceiling for API requests per second (default: follow server rate-limit headers)"
+        )
+        git_group.add_argument(
+            "--skip-auth",
+            action="store_true",
+            default=None,
+            help="Skip the upfront /user token check before the first request"
+        )
+        git_group.add_argument(
+            "--http2",
+            action="store_true",
+            default=None,
+            help="Use HTTP/2 for REST listings (requires the http2 extra)"
+        )
+        git_group.add_argument(
+            "--lean",
+            action="store_true",
+            default=None,
+            help="List projects with the simple representation and resolve access levels in bulk (less transfer, more requests)"
+        )
+        git_group.add_argument(
+            "--incremental",
+            action="store_true",
+            default=None,
+            help="Only fetch projects active since the last run and merge them in"
+        )
+        git_group.add_argument(
+            "--full-refresh",
+            action="store_true",
+            help="Ignore the stored watermark and re-list every project"
+        )
+        git_group.add_argument(
+            "--logs",
+            action="store_true",
+            help="Extract history into the logs table: Git commits, or Jira status transitions and worklogs"
+        )
+        git_group.add_argument(
+            "--mirror",
+            action="store_true",
+            default=None,
+            help="With --logs, read history from local bare mirrors updated with git fetch"
+        )
+        git_group.add_argument(
+            "--git-mirror-dir",
+            type=str,
+            help="Directory for the bare mirrors used by --mirror"
+        )
+        git_group.add_argument(
+            "--git-state-dir",
+            type=str,
+            help="Directory for incremental sync state"
+        )
+        git_group.add_argument(
+            "--http-cache",
+            action="store_true",
+            default=None,
+            help="Cache API responses on disk and revalidate them with ETags"
+        )
+        git_group.add_argument(
+            "--http-cache-dir",
+            type=str,
+            help="Directory for the HTTP response cache"
+        )
+        git_group.add_argument(
+            "--http-cache-max-mb",
+            type=int,
+            help="Size limit of the HTTP response cache; least recently used entries are evicted"
+        )
 
         # Jira input parameters
         jira_group = self.parser.add_argument_group("Jira Options")
@@ -78,13 +187,35 @@ class CliHandler:
             type=str,
             help="Jira authentication token"
         )
+        jira_group.add_argument(
+            "--jira-page-size",
+            type=int,
+            help="Number of issues requested per search page"
+        )
+        jira_group.add_argument(
+            "--jira-concurrency",
+            type=int,
+            help="Number of issue search pages fetched in parallel"
+        )
+        jira_group.add_argument(
+            "--jira-fields",
+            type=str,
+            nargs="*",
+            help="Extra issue fields to extract, by name (e.g. 'Story Points') or id"
+        )
+        jira_group.add_argument(
+            "--jira-incremental",
+            action="store_true",
+            default=None,
+            help="Only fetch issues updated since the last run and merge them in"
+        )
 
         # Output parameters
         output_group = self.parser.add_argument_group("Output Options")
         output_group.add_argument(
             "--output-type",
             type=str,
-            help="Output type (e.g., postgres, mysql)"
+            help="Output type: console (default), ndjson, sqlite, postgres, parquet or arrow"
         )
         output_group.add_argument(
             "--db-url",
@@ -111,7 +242,14 @@ class CliHandler:
             type=str,
             help="Table name for Jira logs"
         )
+        output_group.add_argument(
+            "--output-compression",
+            choices=["none", "gzip", "zstd"],
+            help="Compression for ndjson output"
+        )
 
     def parse(self, args=None):
         self.args = self.parser.parse_args(args)
+        if not (self.args.g or self.args.j):
+            self.parser.error("one of the arguments -g -j is required")
         return self.args
@@ -15,22 +15,81 @@ def _find_project_root() -> Path:
 
 
 PROJECT_ROOT: Path = _find_project_root()
+STATE_DIR_NAME = ".dataextractor"
+
+
+def resolve_project_path(path: str | Path) -> Path:
+    """Resolve a configured path against the project root unless absolute."""
+    path = Path(path)
+    if not path.is_absolute():
+        path = PROJECT_ROOT / path
+    return path
+
+
+@dataclass
+class GitSourceInputs:
+    """One entry of `git_sources`; unset keys fall back to the git_* keys."""
+
+    name: str = ""
+    git_url: str = ""
+    git_version: str = ""
+    git_type: str = ""
+    git_token: str = ""
+    git_projects: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "GitSourceInputs":
+        return cls(
+            name=data.get("name", "") or "",
+            git_url=data.get("git_url", "") or "",
+            git_version=data.get("git_version", "") or "",
+            git_type=data.get("git_type", "") or "",
+            git_token=data.get("git_token", "") or "",
+            git_projects=data.get("git_projects", []) or [],
+        )
 
 
 @dataclass
-class GitInputs:
+class GitInputs:  # pylint: disable=too-many-instance-attributes
     git_url: str = ""
     git_version: str = ""
     git_type: str = ""
     git_token: str = ""
     git_projects: list[str] = field(default_factory=list)
+    git_concurrency: int = 1
+    git_per_page: int = 100
+    git_backend: str = "rest"
+    git_graphql_extras: bool = False
+    git_lean: bool = False
+    git_max_rate: float = 0.0
+    git_max_retries: int = 5
+    git_skip_auth: bool = False
+    git_http2: bool = False
+    git_incremental: bool = False
+    git_state_dir: str = ""
+    git_http_cache: bool = False
+    git_http_cache_dir: str = ""
+    git_http_cache_max_mb: int = 256
+    git_mirror: bool = False
+    git_mirror_dir: str = ""
+    git_transform_workers: int = 1
+    git_queue_size: int = 4
+    git_pipeline_stats: bool = False
+    git_sources: list[GitSourceInputs] = field(default_factory=list)
 
 
 @dataclass
-class JiraInputs:
+class JiraInputs:  # pylint: disable=too-many-instance-attributes
     jira_url: str = ""
     jira_version: str = ""
     jira_token: str = ""
+    jira_page_size: int = 100
+    jira_concurrency: int = 1
+    jira_incremental: bool = False
+    jira_overlap_minutes: int = 5
+    jira_state_dir: str = ""
+    jira_fields: list[str] = field(default_factory=list)
+    jira_field_cache_ttl_hours: float = 24.0
 
 
 @dataclass
@@ -47,11 +106,38 @@ class Inputs:
                 git_type=data.get("git_type", "") or "",
                 git_token=data.get("git_token", "") or "",
                 git_projects=data.get("git_projects", []) or [],
+                git_concurrency=int(data.get("git_concurrency", 1) or 1),
+                git_per_page=int(data.get("git_per_page", 100) or 100),
+                git_backend=data.get("git_backend", "rest") or "rest",
+                git_graphql_extras=bool(data.get("git_graphql_extras", False)),
+                git_lean=bool(data.get("git_lean", False)),
+                git_max_rate=float(data.get("git_max_rate", 0) or 0),
+                git_max_retries=int(data.get("git_max_retries", 5) or 0),
+                git_skip_auth=bool(data.get("git_skip_auth", False)),
+                git_http2=bool(data.get("git_http2", False)),
+                git_incremental=bool(data.get("git_incremental", False)),
+                git_state_dir=data.get("git_state_dir", "") or "",
+                git_http_cache=bool(data.get("git_http_cache", False)),
+                git_http_cache_dir=data.get("git_http_cache_dir", "") or "",
+                git_http_cache_max_mb=int(data.get("git_http_cache_max_mb", 256) or 256),
+                git_mirror=bool(data.get("git_mirror", False)),
+                git_mirror_dir=data.get("git_mirror_dir", "") or "",
+                git_transform_workers=int(data.get("git_transform_workers", 1) or 1),
+                git_queue_size=int(data.get("git_queue_size", 4) or 4),
+                git_pipeline_stats=bool(data.get("git_pipeline_stats", False)),
+                git_sources=[GitSourceInputs.from_dict(s) for s in data.get("git_sources", []) or []],
             ),
             jira=JiraInputs(
                 jira_url=data.get("jira_url", "") or "",
                 jira_version=data.get("jira_version", "") or "",
                 jira_token=data.get("jira_token", "") or "",
+                jira_page_size=int(data.get("jira_page_size", 100) or 100),
+                jira_concurrency=int(data.get("jira_concurrency", 1) or 1),
+                jira_incremental=bool(data.get("jira_incremental", False)),
+                jira_overlap_minutes=int(data.get("jira_overlap_minutes", 5) or 0),
+                jira_state_dir=data.get("jira_state_dir", "") or "",
+                jira_fields=data.get("jira_fields", []) or [],
+                jira_field_cache_ttl_hours=float(data.get("jira_field_cache_ttl_hours", 24) or 0),
             ),
         )
 
@@ -64,6 +150,7 @@ class Outputs:
     jira_table_name: str = ""
     logs_git_table_name: str = ""
     logs_jira_table_name: str = ""
+    compression: str = ""
 
     @classmethod
     def from_dict(cls, data: dict) -> "Outputs":
@@ -74,6 +161,7 @@ class Outputs:
             jira_table_name=data.get("jira_table_name", "") or "",
             logs_git_table_name=data.get("logs_git_table_name", "") or "",
             logs_jira_table_name=data.get("logs_jira_table_name", "") or "",
+            compression=data.get("compression", "") or "",
         )
 
 
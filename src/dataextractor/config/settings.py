@@ -1,12 +1,49 @@
 from argparse import Namespace
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
+from urllib.parse import urlsplit
 
 from dataextractor.config.env import EnvConfig
 
+# GitLab silently serves at most this many items per page (REST and GraphQL)
+MAX_PER_PAGE = 100
+
+
+@dataclass
+class GitSettings:  # pylint: disable=too-many-instance-attributes
+    url: str = ""
+    version: str = ""
+    type: str = ""
+    token: str = ""
+    projects: list[str] = field(default_factory=list)
+    concurrency: int = 1
+    per_page: int = 100
+    backend: str = "rest"
+    graphql_extras: bool = False  # graphql backend: also fetch last activity and default branch
+    lean: bool = False
+    max_rate: float = 0.0  # requests per second, 0 = follow the server's limits only
+    max_retries: int = 5
+    skip_auth: bool = False
+    http2: bool = False  # REST listing only; needs the http2 extra
+    incremental: bool = False
+    state_dir: str = ""
+    http_cache: bool = False
+    http_cache_dir: str = ""
+    http_cache_max_mb: int = 256
+    mirror: bool = False  # read history from local bare mirrors instead of the API
+    mirror_dir: str = ""
+    # Listing pipeline: threads converting records, batches buffered between stages
+    transform_workers: int = 1
+    queue_size: int = 4
+    pipeline_stats: bool = False
+    source: str = ""  # tag on extracted rows; set per entry of Settings.git_sources
+
 
 @dataclass
-class GitSettings:
+class GitSource:
+    """Connection details of one of several git instances."""
+
+    name: str = ""
     url: str = ""
     version: str = ""
     type: str = ""
@@ -15,10 +52,17 @@ class GitSettings:
 
 
 @dataclass
-class JiraSettings:
+class JiraSettings:  # pylint: disable=too-many-instance-attributes
     url: str = ""
     version: str = ""
     token: str = ""
+    page_size: int = 100  # issues per search page; Jira may cap it lower
+    concurrency: int = 1  # search pages fetched in parallel
+    incremental: bool = False  # only fetch issues updated since the last run
+    overlap_minutes: int = 5  # searches start this far before each watermark
+    state_dir: str = ""
+    fields: list[str] = field(default_factory=list)  # extra issue fields, by name or id
+    field_cache_ttl_hours: float = 24.0
 
 
 # pylint: disable=duplicate-code
@@ -30,6 +74,7 @@ class OutputSettings:
     jira_table_name: str = ""
     logs_git_table_name: str = ""
     logs_jira_table_name: str = ""
+    compression: str = ""  # ndjson output: "", "gzip" or "zstd"
 # pylint: enable=duplicate-code
 
 
@@ -38,6 +83,34 @@ class Settings:
     git: GitSettings = field(default_factory=GitSettings)
     jira: JiraSettings = field(default_factory=JiraSettings)
     outputs: OutputSettings = field(default_factory=OutputSettings)
+    git_sources: list[GitSource] = field(default_factory=list)
+
+    def for_each_git_source(self) -> list["Settings"]:
+        """One Settings per configured git source, or just this one.
+
+        Each source's connection replaces the one in `git`; everything
+        else (tuning, state and cache dirs, outputs) is shared. Sources
+        without a token use `git.token`; `--git-projects` on the command
+        line replaces every source's own project list.
+        """
+        if not self.git_sources:
+            return [self]
+        return [
+            replace(
+                self,
+                git=replace(
+                    self.git,
+                    url=source.url,
+                    version=source.version or self.git.version,
+                    type=source.type or self.git.type,
+                    token=source.token or self.git.token,
+                    projects=source.projects,
+                    source=source.name or urlsplit(source.url).netloc,
+                ),
+                git_sources=[],
+            )
+            for source in self.git_sources
+        ]
 
     @classmethod
     def load(cls, config_path: str | Path | None = None, cli_args: Namespace | None = None) -> "Settings":
@@ -56,11 +129,37 @@ class Settings:
                         type=env_config.inputs.git.git_type,
                         token=env_config.inputs.git.git_token,
                         projects=env_config.inputs.git.git_projects,
+                        concurrency=env_config.inputs.git.git_concurrency,
+                        per_page=env_config.inputs.git.git_per_page,
+                        backend=env_config.inputs.git.git_backend,
+                        graphql_extras=env_config.inputs.git.git_graphql_extras,
+                        lean=env_config.inputs.git.git_lean,
+                        max_rate=env_config.inputs.git.git_max_rate,
+                        max_retries=env_config.inputs.git.git_max_retries,
+                        skip_auth=env_config.inputs.git.git_skip_auth,
+                        http2=env_config.inputs.git.git_http2,
+                        incremental=env_config.inputs.git.git_incremental,
+                        state_dir=env_config.inputs.git.git_state_dir,
+                        http_cache=env_config.inputs.git.git_http_cache,
+                        http_cache_dir=env_config.inputs.git.git_http_cache_dir,
+                        http_cache_max_mb=env_config.inputs.git.git_http_cache_max_mb,
+                        mirror=env_config.inputs.git.git_mirror,
+                        mirror_dir=env_config.inputs.git.git_mirror_dir,
+                        transform_workers=env_config.inputs.git.git_transform_workers,
+                        queue_size=env_config.inputs.git.git_queue_size,
+                        pipeline_stats=env_config.inputs.git.git_pipeline_stats,
                     ),
                     jira=JiraSettings(
                         url=env_config.inputs.jira.jira_url,
                         version=env_config.inputs.jira.jira_version,
                         token=env_config.inputs.jira.jira_token,
+                        page_size=env_config.inputs.jira.jira_page_size,
+                        concurrency=env_config.inputs.jira.jira_concurrency,
+                        incremental=env_config.inputs.jira.jira_incremental,
+                        overlap_minutes=env_config.inputs.jira.jira_overlap_minutes,
+                        state_dir=env_config.inputs.jira.jira_state_dir,
+                        fields=env_config.inputs.jira.jira_fields,
+                        field_cache_ttl_hours=env_config.inputs.jira.jira_field_cache_ttl_hours,
                     ),
                     outputs=OutputSettings(
                         type=env_config.outputs.type,
@@ -69,7 +168,19 @@ class Settings:
                         jira_table_name=env_config.outputs.jira_table_name,
                         logs_git_table_name=env_config.outputs.logs_git_table_name,
                         logs_jira_table_name=env_config.outputs.logs_jira_table_name,
+                        compression=env_config.outputs.compression,
                     ),
+                    git_sources=[
+                        GitSource(
+                            name=s.name,
+                            url=s.git_url,
+                            version=s.git_version,
+                            type=s.git_type,
+                            token=s.git_token,
+                            projects=s.git_projects,
+                        )
+                        for s in env_config.inputs.git.git_sources
+                    ],
                 )
             except FileNotFoundError:
                 # If env file doesn't exist, start with empty settings
@@ -80,16 +191,22 @@ class Settings:
         if cli_args:
             settings._apply_cli_overrides(cli_args)
 
+        # A larger page size would make every full page look like the last one
+        settings.git.per_page = min(settings.git.per_page, MAX_PER_PAGE)
         return settings
 
     def _apply_cli_overrides(self, args: Namespace):
         self._apply_git_overrides(args)
+        self._apply_git_tuning_overrides(args)
+        self._apply_git_state_overrides(args)
         self._apply_jira_overrides(args)
         self._apply_output_overrides(args)
 
     def _apply_git_overrides(self, args: Namespace):
         if getattr(args, "git_url", None) is not None:
             self.git.url = args.git_url
+            # An instance named on the command line replaces configured sources
+            self.git_sources = []
         if getattr(args, "git_version", None) is not None:
             self.git.version = args.git_version
         if getattr(args, "git_type", None) is not None:
@@ -98,6 +215,49 @@ class Settings:
             self.git.token = args.git_token
         if getattr(args, "git_projects", None) is not None:
             self.git.projects = args.git_projects
+            # A command-line allowlist also replaces each source's own
+            for source in self.git_sources:
+                source.projects = args.git_projects
+
+    def _apply_git_tuning_overrides(self, args: Namespace):
+        if getattr(args, "git_concurrency", None) is not None:
+            self.git.concurrency = args.git_concurrency
+        if getattr(args, "git_per_page", None) is not None:
+            self.git.per_page = args.git_per_page
+        if getattr(args, "git_backend", None) is not None:
+            self.git.backend = args.git_backend
+        if getattr(args, "graphql_extras", None) is not None:
+            self.git.graphql_extras = args.graphql_extras
+        if getattr(args, "lean", None) is not None:
+            self.git.lean = args.lean
+        if getattr(args, "git_max_rate", None) is not None:
+            self.git.max_rate = args.git_max_rate
+        if getattr(args, "skip_auth", None) is not None:
+            self.git.skip_auth = args.skip_auth
+        if getattr(args, "http2", None) is not None:
+            self.git.http2 = args.http2
+        if getattr(args, "git_transform_workers", None) is not None:
+            self.git.transform_workers = args.git_transform_workers
+        if getattr(args, "git_queue_size", None) is not None:
+            self.git.queue_size = args.git_queue_size
+        if getattr(args, "pipeline_stats", None) is not None:
+            self.git.pipeline_stats = args.pipeline_stats
+
+    def _apply_git_state_overrides(self, args: Namespace):
+        if getattr(args, "incremental", None) is not None:
+            self.git.incremental = args.incremental
+        if getattr(args, "git_state_dir", None) is not None:
+            self.git.state_dir = args.git_state_dir
+        if getattr(args, "http_cache", None) is not None:
+            self.git.http_cache = args.http_cache
+        if getattr(args, "http_cache_dir", None) is not None:
+            self.git.http_cache_dir = args.http_cache_dir
+        if getattr(args, "http_cache_max_mb", None) is not None:
+            self.git.http_cache_max_mb = args.http_cache_max_mb
+        if getattr(args, "mirror", None) is not None:
+            self.git.mirror = args.mirror
+        if getattr(args, "git_mirror_dir", None) is not None:
+            self.git.mirror_dir = args.git_mirror_dir
 
     def _apply_jira_overrides(self, args: Namespace):
         if getattr(args, "jira_url", None) is not None:
@@ -106,6 +266,14 @@ class Settings:
             self.jira.version = args.jira_version
         if getattr(args, "jira_token", None) is not None:
             self.jira.token = args.jira_token
+        if getattr(args, "jira_page_size", None) is not None:
+            self.jira.page_size = args.jira_page_size
+        if getattr(args, "jira_concurrency", None) is not None:
+            self.jira.concurrency = args.jira_concurrency
+        if getattr(args, "jira_incremental", None) is not None:
+            self.jira.incremental = args.jira_incremental
+        if getattr(args, "jira_fields", None) is not None:
+            self.jira.fields = args.jira_fields
 
     def _apply_output_overrides(self, args: Namespace):
         if getattr(args, "output_type", None) is not None:
@@ -120,3 +288,5 @@ class Settings:
             self.outputs.logs_git_table_name = args.logs_git_table_name
         if getattr(args, "logs_jira_table_name", None) is not None:
             self.outputs.logs_jira_table_name = args.logs_jira_table_name
+        if getattr(args, "output_compression", None) is not None:
+            self.outputs.compression = args.output_compression
@@ -1,3 +1,18 @@
-from dataextractor.core.entities.project import ProjectInfo
+from dataextractor.core.entities.commit import CommitInfo
+from dataextractor.core.entities.issue import IssueInfo
+from dataextractor.core.entities.project import ACCESS_LEVEL_NAMES, ProjectInfo
+from dataextractor.core.entities.project_batch import ProjectBatch
+from dataextractor.core.entities.snapshot import ProjectSnapshot
+from dataextractor.core.entities.transition import TransitionInfo
+from dataextractor.core.entities.worklog import WorklogInfo
 
-__all__ = ["ProjectInfo"]
+__all__ = [
+    "ACCESS_LEVEL_NAMES",
+    "CommitInfo",
+    "IssueInfo",
+    "ProjectBatch",
+    "ProjectInfo",
+    "ProjectSnapshot",
+    "TransitionInfo",
+    "WorklogInfo",
+]
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class CommitInfo:  # pylint: disable=too-many-instance-attributes
+    project_id: int
+    project_path: str
+    sha: str
+    title: str
+    author_name: str
+    author_email: str
+    authored_date: str
+    committer_name: str
+    committer_email: str
+    committed_date: str
+    parent_ids: tuple[str, ...] = ()
+    source: str = ""
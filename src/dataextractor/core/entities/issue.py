@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class IssueInfo:  # pylint: disable=too-many-instance-attributes
+    id: int
+    key: str
+    project_key: str
+    summary: str
+    issue_type: str
+    status: str
+    created: str
+    updated: str
+    priority: str | None = None
+    assignee: str | None = None
+    reporter: str | None = None
+    resolved: str | None = None
+    labels: tuple[str, ...] = ()
+    custom_fields: dict[str, Any] | None = None  # configured extra fields, by name
@@ -1,22 +1,34 @@
 from dataclasses import dataclass
 
-@dataclass
-class ProjectInfo:
+ACCESS_LEVEL_NAMES = {
+    10: "Guest",
+    20: "Reporter",
+    30: "Developer",
+    40: "Maintainer",
+    50: "Owner",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectInfo:  # pylint: disable=too-many-instance-attributes
     id: int
     name: str
     path_with_namespace: str
     http_url: str
     access_level: int | None = None
+    last_activity_at: str | None = None
+    default_branch: str | None = None
+    source: str = ""  # name of the git instance, when several are extracted
+
+    @property
+    def namespace(self) -> str:
+        return self.path_with_namespace.rpartition("/")[0]
 
     @property
     def access_level_name(self) -> str:
-        access_names = {
-            10: "Guest",
-            20: "Reporter",
-            30: "Developer",
-            40: "Maintainer",
-            50: "Owner",
-        }
         if self.access_level is None:
             return "None"
-        return access_names.get(self.access_level, f"Unknown ({self.access_level})")
+        name = ACCESS_LEVEL_NAMES.get(self.access_level)
+        if name is None:
+            return f"Unknown ({self.access_level})"
+        return name
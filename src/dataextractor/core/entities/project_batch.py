@@ -0,0 +1,108 @@
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+
+from dataextractor.core.entities.project import ProjectInfo
+
+_NO_ACCESS = 0
+
+
+class ProjectBatch:  # pylint: disable=too-many-instance-attributes
+    """Columnar store for large project catalogs.
+
+    Ids and access levels live in typed arrays, and each namespace and
+    source is kept once (interned) and referenced by index, so a
+    100k-project catalog costs a handful of lists instead of 100k objects.
+    """
+
+    __slots__ = (
+        "ids",
+        "access_levels",
+        "names",
+        "paths",
+        "namespace_codes",
+        "namespaces",
+        "http_urls",
+        "last_activity_at",
+        "default_branches",
+        "source_codes",
+        "sources",
+        "_namespace_index",
+        "_source_index",
+    )
+
+    def __init__(self):
+        self.ids = array("q")
+        self.access_levels = array("H")  # 0 stands for "no access level"
+        self.names: list[str] = []
+        self.paths: list[str] = []  # last path segment, without the namespace
+        self.namespace_codes = array("I")
+        self.namespaces: list[str] = []
+        self.http_urls: list[str] = []
+        self.last_activity_at: list[str | None] = []
+        self.default_branches: list[str | None] = []
+        self.source_codes = array("I")
+        self.sources: list[str] = []
+        self._namespace_index: dict[str, int] = {}
+        self._source_index: dict[str, int] = {}
+
+    @classmethod
+    def from_projects(cls, projects: Iterable[ProjectInfo]) -> "ProjectBatch":
+        batch = cls()
+        batch.extend(projects)
+        return batch
+
+    def append(self, project: ProjectInfo) -> None:
+        namespace, _, path = project.path_with_namespace.rpartition("/")
+        self.ids.append(project.id)
+        self.access_levels.append(
+            _NO_ACCESS if project.access_level is None else project.access_level
+        )
+        self.names.append(project.name)
+        self.paths.append(path)
+        self.namespace_codes.append(_intern(namespace, self.namespaces, self._namespace_index))
+        self.http_urls.append(project.http_url)
+        self.last_activity_at.append(project.last_activity_at)
+        self.default_branches.append(project.default_branch)
+        self.source_codes.append(_intern(project.source, self.sources, self._source_index))
+
+    def extend(self, projects: Iterable[ProjectInfo]) -> None:
+        for project in projects:
+            self.append(project)
+
+    def path_with_namespace(self, index: int) -> str:
+        namespace = self.namespaces[self.namespace_codes[index]]
+        if not namespace:
+            return self.paths[index]
+        return f"{namespace}/{self.paths[index]}"
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: int) -> ProjectInfo:
+        access_level = self.access_levels[index]
+        return ProjectInfo(
+            id=self.ids[index],
+            name=self.names[index],
+            path_with_namespace=self.path_with_namespace(index),
+            http_url=self.http_urls[index],
+            access_level=None if access_level == _NO_ACCESS else access_level,
+            last_activity_at=self.last_activity_at[index],
+            default_branch=self.default_branches[index],
+            source=self.sources[self.source_codes[index]],
+        )
+
+    def __iter__(self) -> Iterator[ProjectInfo]:
+        for index in range(len(self)):
+            yield self[index]
+
+
+def _intern(value: str, values: list[str], index: dict[str, int]) -> int:
+    """The code of `value` in `values`, adding it on first sight."""
+    code = index.get(value)
+    if code is None:
+        code = len(values)
+        value = sys.intern(value)
+        values.append(value)
+        index[value] = code
+    return code
@@ -0,0 +1,11 @@
+from dataclasses import dataclass, field
+
+from dataextractor.core.entities.project import ProjectInfo
+
+
+@dataclass
+class ProjectSnapshot:
+    """The project list from the last run and the activity watermark it reached."""
+
+    watermark: str | None = None
+    projects: list[ProjectInfo] = field(default_factory=list)
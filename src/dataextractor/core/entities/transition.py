@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class TransitionInfo:
+    """One status change of an issue, from its changelog."""
+
+    issue_id: int
+    issue_key: str
+    history_id: int
+    created: str
+    from_status: str | None = None
+    to_status: str | None = None
+    author: str | None = None
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class WorklogInfo:  # pylint: disable=too-many-instance-attributes
+    id: int
+    issue_id: int
+    issue_key: str
+    started: str
+    time_spent_seconds: int
+    created: str
+    updated: str
+    author: str | None = None
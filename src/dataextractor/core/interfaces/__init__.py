@@ -1,3 +1,17 @@
-from dataextractor.core.interfaces.repository import ProjectRepository
+from dataextractor.core.interfaces.commits import CommitRepository
+from dataextractor.core.interfaces.issues import IssueLogRepository, IssueRepository
+from dataextractor.core.interfaces.repository import AsyncProjectRepository, ProjectRepository
+from dataextractor.core.interfaces.sink import RowSink, SyncResult
+from dataextractor.core.interfaces.state import ProjectStateStore, WatermarkStore
 
-__all__ = ["ProjectRepository"]
+__all__ = [
+    "AsyncProjectRepository",
+    "CommitRepository",
+    "IssueLogRepository",
+    "IssueRepository",
+    "ProjectRepository",
+    "ProjectStateStore",
+    "RowSink",
+    "SyncResult",
+    "WatermarkStore",
+]
@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+
+from dataextractor.core.entities import CommitInfo, ProjectInfo
+
+
+class CommitRepository(ABC):
+    @abstractmethod
+    def iter_commits(self, project: ProjectInfo, since: str | None = None) -> Iterator[CommitInfo]:
+        """Yield the project's commits, newest first, committed at or after `since`.
+
+        Implementations must be safe to call from several threads at once,
+        one project per thread.
+        """
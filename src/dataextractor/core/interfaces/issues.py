@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterator, Mapping, Sequence
+
+from dataextractor.core.entities import IssueInfo, ProjectInfo, TransitionInfo, WorklogInfo
+
+
+class IssueRepository(ABC):
+    @abstractmethod
+    def iter_issues(
+        self, projects: Sequence[ProjectInfo], since: Mapping[str, str] | None = None
+    ) -> Iterator[IssueInfo]:
+        """Yield the issues of `projects`, oldest first, as pages arrive.
+
+        `since` maps project keys (`path_with_namespace`) to an ISO 8601
+        time; those projects only yield issues updated at or after it,
+        possibly with some earlier ones as well.
+        """
+
+
+class IssueLogRepository(ABC):
+    @abstractmethod
+    def iter_logs(
+        self, projects: Sequence[ProjectInfo], since: Mapping[str, str] | None = None
+    ) -> Iterator[TransitionInfo | WorklogInfo]:
+        """Yield the status transitions and worklogs of the issues of `projects`.
+
+        `since` works as in `IssueRepository.iter_issues`, selecting the
+        issues whose history is read. Rows come in no particular order.
+        """
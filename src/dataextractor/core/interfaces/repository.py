@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
 
 from dataextractor.core.entities import ProjectInfo
 
@@ -7,3 +9,59 @@ class ProjectRepository(ABC):
     @abstractmethod
     def get_all_projects(self) -> list[ProjectInfo]:
         pass
+
+    def iter_projects(self) -> Iterator[ProjectInfo]:
+        """Yield projects as they are fetched.
+
+        Streaming repositories override this; the default materializes
+        `get_all_projects` first.
+        """
+        yield from self.get_all_projects()
+
+    def iter_records(self) -> Iterator[Any]:
+        """The listing as raw records, before conversion.
+
+        Together with `to_project_info` this lets callers run fetching and
+        conversion on separate threads. Repositories without a separate
+        raw form yield finished ProjectInfo values.
+        """
+        return self.iter_projects()
+
+    def to_project_info(self, record: Any) -> ProjectInfo:
+        """Convert one record from `iter_records`."""
+        return record
+
+    def get_projects_changed_since(self, since: str) -> list[ProjectInfo]:  # pylint: disable=unused-argument
+        """Projects with activity at or after `since` (ISO 8601).
+
+        Repositories without server-side filtering return everything, which
+        is a correct (if slower) superset.
+        """
+        return self.get_all_projects()
+
+    def get_unresolved_projects(self) -> dict[str, str]:
+        """Configured project entries the last listing could not resolve.
+
+        Maps each entry to the reason; repositories that only list
+        memberships never leave anything unresolved.
+        """
+        return {}
+
+
+class AsyncProjectRepository(ABC):
+    @abstractmethod
+    async def get_all_projects(self) -> list[ProjectInfo]:
+        pass
+
+    async def iter_projects(self) -> AsyncIterator[ProjectInfo]:
+        for project in await self.get_all_projects():
+            yield project
+
+    async def get_projects_changed_since(self, since: str) -> list[ProjectInfo]:  # pylint: disable=unused-argument
+        return await self.get_all_projects()
+
+    def get_unresolved_projects(self) -> dict[str, str]:
+        return {}
+
+    async def aclose(self) -> None:
+        """Release pooled connections; the default has nothing to release."""
@@ -0,0 +1,63 @@
+from abc import ABC, abstractmethod
+from collections.abc import Collection, Iterable, Sequence
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any
+
+
+@dataclass
+class SyncResult:
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+
+    @property
+    def total(self) -> int:
+        """Rows in the synced listing (deleted rows are not part of it)."""
+        return self.inserted + self.updated + self.unchanged
+
+
+class RowSink(ABC):
+    """Destination for extracted rows, written in batches per table.
+
+    Rows are dataclass instances; sinks derive their columns from the
+    dataclass fields. Writes always come from a single thread.
+    """
+
+    SYNC_BATCH_SIZE = 100
+
+    @abstractmethod
+    def write(self, table: str, rows: Sequence[Any]) -> None:
+        pass
+
+    def sync(  # pylint: disable=unused-argument
+        self,
+        table: str,
+        rows: Iterable[Any],
+        prune: bool = True,
+        sources: Collection[str] | None = None,
+    ) -> SyncResult:
+        """Make `table` hold exactly `rows`, a complete listing.
+
+        Sinks that can see what they wrote last time only touch the rows
+        that changed; the default just writes everything as new. A partial
+        listing is passed with `prune` false, so stored rows it does not
+        mention are kept; `sources` narrows pruning to rows whose `source`
+        is one of those the listing covers.
+        """
+        result = SyncResult()
+        rows = iter(rows)
+        while batch := list(islice(rows, self.SYNC_BATCH_SIZE)):
+            self.write(table, batch)
+            result.inserted += len(batch)
+        return result
+
+    def close(self) -> None:
+        """Flush buffered rows and release resources; the default has none."""
+
+    def __enter__(self) -> "RowSink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
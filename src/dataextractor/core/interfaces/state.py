@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+
+from dataextractor.core.entities import ProjectSnapshot
+
+
+class ProjectStateStore(ABC):
+    @abstractmethod
+    def load(self) -> ProjectSnapshot | None:
+        pass
+
+    @abstractmethod
+    def save(self, snapshot: ProjectSnapshot) -> None:
+        pass
+
+
+class WatermarkStore(ABC):
+    """Per-key progress markers (e.g. newest commit date per project)."""
+
+    @abstractmethod
+    def load(self) -> dict[str, str]:
+        pass
+
+    @abstractmethod
+    def save(self, watermarks: dict[str, str]) -> None:
+        pass
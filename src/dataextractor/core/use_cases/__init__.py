@@ -1,3 +1,21 @@
-from dataextractor.core.use_cases.list_projects import ListProjectsUseCase
+from dataextractor.core.use_cases.extract_commits import CommitExtractionResult, ExtractCommitsUseCase
+from dataextractor.core.use_cases.extract_issue_logs import ExtractIssueLogsUseCase, IssueLogExtractionResult
+from dataextractor.core.use_cases.list_projects import AsyncListProjectsUseCase, ListProjectsUseCase
+from dataextractor.core.use_cases.pipeline import Pipeline, Stage, StageMetrics
+from dataextractor.core.use_cases.sync_issues import IssueSyncResult, SyncIssuesUseCase
+from dataextractor.core.use_cases.sync_projects import SyncProjectsUseCase
 
-__all__ = ["ListProjectsUseCase"]
+__all__ = [
+    "AsyncListProjectsUseCase",
+    "CommitExtractionResult",
+    "ExtractCommitsUseCase",
+    "ExtractIssueLogsUseCase",
+    "IssueLogExtractionResult",
+    "IssueSyncResult",
+    "ListProjectsUseCase",
+    "Pipeline",
+    "Stage",
+    "StageMetrics",
+    "SyncIssuesUseCase",
+    "SyncProjectsUseCase",
+]
@@ -1,5 +1,8 @@
+from collections.abc import AsyncIterator, Iterator
+
 from dataextractor.core.entities import ProjectInfo
-from dataextractor.core.interfaces import ProjectRepository
+from dataextractor.core.interfaces import AsyncProjectRepository, ProjectRepository
+from dataextractor.core.use_cases.pipeline import Pipeline, Stage, batched
 
 
 class ListProjectsUseCase:
@@ -8,3 +11,33 @@ class ListProjectsUseCase:
 
     def execute(self) -> list[ProjectInfo]:
         return self.repository.get_all_projects()
+
+    def iter_projects(self) -> Iterator[ProjectInfo]:
+        return self.repository.iter_projects()
+
+    def pipeline(
+        self, batch_size: int, fetch_workers: int = 1, transform_workers: int = 1, queue_size: int = 4
+    ) -> Pipeline:
+        """The listing as fetch and transform stages; iterating it is the sink.
+
+        Records are pulled on one thread, behind which the repository keeps
+        `fetch_workers` page requests in flight, while other threads
+        convert them to ProjectInfo.
+        """
+        transform = Stage("transform", self._to_project_infos, transform_workers)
+        records = batched(self.repository.iter_records(), batch_size)
+        return Pipeline(records, [transform], queue_size, source_workers=fetch_workers)
+
+    def _to_project_infos(self, records: list) -> list[ProjectInfo]:
+        return [self.repository.to_project_info(r) for r in records]
+
+
+class AsyncListProjectsUseCase:
+    def __init__(self, repository: AsyncProjectRepository):
+        self.repository = repository
+
+    async def execute(self) -> list[ProjectInfo]:
+        return await self.repository.get_all_projects()
+
+    def iter_projects(self) -> AsyncIterator[ProjectInfo]:
+        return self.repository.iter_projects()
@@ -0,0 +1,257 @@
+import queue
+import threading
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass, replace
+from itertools import chain, islice
+from time import perf_counter
+from typing import Any
+
+_DONE = object()  # end of stream, passed along like a batch
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    function: Callable[[Sequence[Any]], Sequence[Any]]  # one batch in, one batch out
+    workers: int = 1
+
+
+@dataclass
+class StageMetrics:
+    name: str
+    workers: int
+    batches: int = 0
+    items: int = 0
+    busy_seconds: float = 0.0  # summed over worker threads
+    queue_depth: int = 0  # batches waiting in this stage's output queue
+    max_queue_depth: int = 0
+
+
+class Pipeline:  # pylint: disable=too-many-instance-attributes
+    """Batches flow from a source through transform stages to the caller.
+
+    The source runs on one thread and each stage on `workers` threads,
+    linked by queues of at most `queue_size` batches. Iterating the
+    pipeline is the final (sink) stage: it runs on the caller's thread,
+    and when it falls behind the queues fill up and block the stages and
+    the source in turn, so memory stays bounded however slow the sink is.
+    With several workers a stage may pass batches on out of order.
+
+    The first error in any stage stops the others and is raised from the
+    iteration; `metrics()` can be read at any time, also while running.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        source: Iterable[Sequence[Any]],
+        stages: Sequence[Stage],
+        queue_size: int = 4,
+        source_name: str = "fetch",
+        sink_name: str = "sink",
+        source_workers: int = 1,
+    ):
+        self.source = source
+        self.stages = list(stages)
+        self.queue_size = max(queue_size, 1)
+        self._metrics = [
+            # The source is pulled by one thread; it may fan out internally
+            StageMetrics(source_name, max(source_workers, 1)),
+            *(StageMetrics(s.name, max(s.workers, 1)) for s in self.stages),
+            StageMetrics(sink_name, 1),
+        ]
+        self._queues: list[queue.Queue] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._errors: list[BaseException] = []
+        self.elapsed = 0.0
+
+    def __iter__(self) -> Iterator[Sequence[Any]]:
+        self._queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+        threads = [threading.Thread(target=self._produce, name="pipeline-source", daemon=True)]
+        for index, stage in enumerate(self.stages, start=1):
+            remaining = [self._metrics[index].workers]
+            threads.extend(
+                threading.Thread(
+                    target=self._work,
+                    args=(stage, index, remaining),
+                    name=f"pipeline-{stage.name}-{n}",
+                    daemon=True,
+                )
+                for n in range(self._metrics[index].workers)
+            )
+
+        started = perf_counter()
+        for thread in threads:
+            thread.start()
+        try:
+            sink = self._metrics[-1]
+            while (batch := self._get(self._queues[-1])) is not _DONE:
+                consumed = perf_counter()
+                yield batch
+                self._record(sink, batch, perf_counter() - consumed)
+        finally:
+            self._stop.set()
+            for thread in threads:
+                thread.join()
+            self.elapsed = perf_counter() - started
+        if self._errors:
+            raise self._errors[0]
+
+    def iter_items(self) -> Iterator[Any]:
+        """The output flattened from batches to single items."""
+        return chain.from_iterable(self)
+
+    def metrics(self) -> list[StageMetrics]:
+        """A snapshot per stage: source, transform stages, sink."""
+        with self._lock:
+            snapshot = [replace(m) for m in self._metrics]
+        for metrics, outbox in zip(snapshot, self._queues):
+            metrics.queue_depth = outbox.qsize()
+        return snapshot
+
+    def _produce(self) -> None:
+        metrics, outbox = self._metrics[0], self._queues[0]
+        iterator = None
+        try:
+            iterator = iter(self.source)
+            while True:
+                started = perf_counter()
+                batch = next(iterator, _DONE)
+                if batch is _DONE:
+                    break
+                self._record(metrics, batch, perf_counter() - started)
+                if not self._put(outbox, batch, metrics):
+                    return
+            self._put(outbox, _DONE)
+        except BaseException as error:  # pylint: disable=broad-exception-caught
+            self._fail(error)
+        finally:
+            # If stopped early, the source releases its own resources here
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    def _work(self, stage: Stage, index: int, remaining: list[int]) -> None:
+        metrics, inbox, outbox = self._metrics[index], self._queues[index - 1], self._queues[index]
+        try:
+            while (batch := self._get(inbox)) is not _DONE:
+                started = perf_counter()
+                result = stage.function(batch)
+                self._record(metrics, batch, perf_counter() - started)
+                if not self._put(outbox, result, metrics):
+                    return
+        except BaseException as error:  # pylint: disable=broad-exception-caught
+            self._fail(error)
+            return
+        # Siblings still need to see the end of the stream
+        self._put(inbox, _DONE)
+        with self._lock:
+            remaining[0] -= 1
+            last = remaining[0] == 0
+        if last:
+            self._put(outbox, _DONE)
+
+    def _get(self, inbox: queue.Queue) -> Any:
+        return _get(inbox, self._stop)
+
+    def _put(self, outbox: queue.Queue, batch: Any, metrics: StageMetrics | None = None) -> bool:
+        if not _put(outbox, batch, self._stop):
+            return False
+        if metrics is not None:
+            depth = outbox.qsize()
+            with self._lock:
+                metrics.max_queue_depth = max(metrics.max_queue_depth, depth)
+        return True
+
+    def _record(self, metrics: StageMetrics, batch: Sequence[Any], seconds: float) -> None:
+        with self._lock:
+            metrics.batches += 1
+            metrics.items += len(batch)
+            metrics.busy_seconds += seconds
+
+    def _fail(self, error: BaseException) -> None:
+        with self._lock:
+            self._errors.append(error)
+        self._stop.set()
+
+
+def batched(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Lists of up to `size` items; closing this closes `items` too."""
+    iterator = iter(items)
+    try:
+        while batch := list(islice(iterator, size)):
+            yield batch
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+
+
+def merge(sources: Sequence[Iterable[Any]], queue_size: int = 4) -> Iterator[Any]:
+    """Items of several iterables in arrival order, each drained on its own thread.
+
+    Slow sources do not hold up fast ones, so draining them all takes as
+    long as the slowest rather than the sum. The shared queue is bounded;
+    the first error stops every source and is raised here.
+    """
+    if len(sources) == 1:
+        yield from sources[0]
+        return
+
+    items: queue.Queue = queue.Queue(maxsize=max(queue_size, 1))
+    stop = threading.Event()
+    errors: list[BaseException] = []
+
+    def drain(source: Iterable[Any]) -> None:
+        iterator = None
+        try:
+            iterator = iter(source)
+            for item in iterator:
+                if not _put(items, item, stop):
+                    return
+        except BaseException as error:  # pylint: disable=broad-exception-caught
+            errors.append(error)
+            stop.set()
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+            _put(items, _DONE, stop)
+
+    threads = [threading.Thread(target=drain, args=(s,), name="merge-source", daemon=True) for s in sources]
+    for thread in threads:
+        thread.start()
+    try:
+        remaining = len(threads)
+        while remaining and not stop.is_set():
+            item = _get(items, stop)
+            if item is _DONE:
+                remaining -= 1
+            else:
+                yield item
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+    if errors:
+        raise errors[0]
+
+
+def _get(inbox: queue.Queue, stop: threading.Event) -> Any:
+    while not stop.is_set():
+        try:
+            return inbox.get(timeout=0.1)
+        except queue.Empty:
+            continue
+    return _DONE
+
+
+def _put(outbox: queue.Queue, item: Any, stop: threading.Event) -> bool:
+    # A plain put() would block forever once the consumer has stopped
+    while not stop.is_set():
+        try:
+            outbox.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
@@ -0,0 +1,43 @@
+from datetime import datetime
+
+from dataextractor.core.entities import ProjectInfo, ProjectSnapshot
+from dataextractor.core.interfaces import ProjectRepository, ProjectStateStore
+
+
+class SyncProjectsUseCase:
+    """List projects incrementally, merging changes into the last snapshot.
+
+    The watermark is the newest `last_activity_at` reported by the server,
+    so local clock skew never hides changes. Projects that lose membership
+    are only dropped by a full refresh.
+    """
+
+    def __init__(self, repository: ProjectRepository, store: ProjectStateStore):
+        self.repository = repository
+        self.store = store
+
+    def execute(self, full_refresh: bool = False) -> list[ProjectInfo]:
+        snapshot = None if full_refresh else self.store.load()
+
+        if snapshot is None or snapshot.watermark is None:
+            projects = self.repository.get_all_projects()
+        else:
+            changed = self.repository.get_projects_changed_since(snapshot.watermark)
+            projects = self._merge(snapshot.projects, changed)
+
+        watermark = self._latest_activity(projects)
+        if watermark is None and snapshot is not None:
+            watermark = snapshot.watermark
+        self.store.save(ProjectSnapshot(watermark=watermark, projects=projects))
+        return projects
+
+    def _merge(self, previous: list[ProjectInfo], changed: list[ProjectInfo]) -> list[ProjectInfo]:
+        merged = {p.id: p for p in previous}
+        merged.update((p.id, p) for p in changed)
+        return list(merged.values())
+
+    def _latest_activity(self, projects: list[ProjectInfo]) -> str | None:
+        timestamps = [p.last_activity_at for p in projects if p.last_activity_at]
+        if not timestamps:
+            return None
+        return max(timestamps, key=datetime.fromisoformat)
@@ -0,0 +1,48 @@
+import asyncio
+from collections.abc import Coroutine, Iterator
+from typing import Any
+
+from dataextractor.core.entities import ProjectInfo
+from dataextractor.core.interfaces import AsyncProjectRepository, ProjectRepository
+
+
+class BlockingProjectRepository(ProjectRepository):
+    """Expose an async repository through the synchronous interface.
+
+    Each call runs on its own event loop, so this must not be used from
+    inside a running loop; async callers should await the wrapped
+    repository directly.
+    """
+
+    def __init__(self, repository: AsyncProjectRepository):
+        self.repository = repository
+
+    def get_all_projects(self) -> list[ProjectInfo]:
+        return asyncio.run(self._run(self.repository.get_all_projects()))
+
+    def iter_projects(self) -> Iterator[ProjectInfo]:
+        # A Runner keeps one loop alive across items, so rows are yielded as
+        # the async repository produces them instead of after the last page.
+        with asyncio.Runner() as runner:
+            projects = self.repository.iter_projects()
+            try:
+                while True:
+                    try:
+                        yield runner.run(anext(projects))
+                    except StopAsyncIteration:
+                        break
+            finally:
+                runner.run(projects.aclose())
+                runner.run(self.repository.aclose())
+
+    def get_projects_changed_since(self, since: str) -> list[ProjectInfo]:
+        return asyncio.run(self._run(self.repository.get_projects_changed_since(since)))
+
+    def get_unresolved_projects(self) -> dict[str, str]:
+        return self.repository.get_unresolved_projects()
+
+    async def _run(self, coroutine: Coroutine[Any, Any, list[ProjectInfo]]) -> list[ProjectInfo]:
+        try:
+            return await coroutine
+        finally:
+            await self.repository.aclose()
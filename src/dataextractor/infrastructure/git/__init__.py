@@ -0,0 +1,3 @@
+from dataextractor.infrastructure.git.mirror import GitCommandError, GitMirrorCommitRepository
+
+__all__ = ["GitCommandError", "GitMirrorCommitRepository"]
@@ -0,0 +1,146 @@
+import base64
+import os
+import subprocess
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from dataextractor.config import Settings
+from dataextractor.core.entities import CommitInfo, ProjectInfo
+from dataextractor.core.interfaces import CommitRepository
+
+FIELD_SEPARATOR = "\x1f"
+# sha, parents, author name/email/date, committer name/email/date, subject
+LOG_FORMAT = FIELD_SEPARATOR.join(["%H", "%P", "%an", "%ae", "%aI", "%cn", "%ce", "%cI", "%s"])
+
+
+class GitCommandError(RuntimeError):
+    def __init__(self, command: list[str], returncode: int, stderr: str):
+        # Only the subcommand: the rest can be long and is rarely the point
+        message = stderr.strip().splitlines()[-1] if stderr.strip() else f"exit status {returncode}"
+        super().__init__(f"git {command[0]}: {message}")
+        self.command = command
+        self.returncode = returncode
+        self.stderr = stderr
+
+
+class GitMirrorCommitRepository(CommitRepository):
+    """Commit history read from local bare mirrors of each project.
+
+    A project's first call clones a blobless mirror (commits and trees
+    only; `git log` never needs file contents) and later calls just
+    `git fetch` the new objects. History is streamed from `git log`, so
+    extraction costs one fetch per project instead of one API request per
+    page of commits, and the rest is local, disk-bound work.
+
+    The token reaches git through GIT_CONFIG_* environment variables as
+    an HTTP header, so it never appears in argv or the mirror's config.
+    """
+
+    def __init__(self, settings: Settings, mirror_dir: str | Path):
+        self.settings = settings
+        host = urlsplit(settings.git.url).netloc.replace(":", "_") or "local"
+        self.mirror_dir = Path(mirror_dir) / host
+        self._env = self._git_env(settings.git.token)
+
+    def iter_commits(self, project: ProjectInfo, since: str | None = None) -> Iterator[CommitInfo]:
+        mirror = self.update_mirror(project)
+        if not self._has_commits(mirror):
+            return
+
+        command = ["log", f"--format=tformat:{LOG_FORMAT}"]
+        if since is not None:
+            command.append(f"--since={since}")
+        for line in self._stream(mirror, command):
+            yield self._to_commit_info(project, line)
+
+    def update_mirror(self, project: ProjectInfo) -> Path:
+        mirror = self.mirror_dir / f"{project.id}.git"
+        if (mirror / "HEAD").exists():
+            self._run(mirror, ["fetch", "--prune", "--quiet"])
+        else:
+            mirror.parent.mkdir(parents=True, exist_ok=True)
+            self._run(
+                None,
+                ["clone", "--mirror", "--quiet", "--filter=blob:none", "--", project.http_url, str(mirror)],
+            )
+        return mirror
+
+    def _has_commits(self, mirror: Path) -> bool:
+        result = subprocess.run(
+            ["git", "-C", str(mirror), "rev-parse", "--verify", "--quiet", "HEAD"],
+            env=self._env,
+            capture_output=True,
+            check=False,
+        )
+        return result.returncode == 0
+
+    def _run(self, mirror: Path | None, command: list[str]) -> None:
+        prefix = ["git"] if mirror is None else ["git", "-C", str(mirror)]
+        result = subprocess.run(
+            prefix + command, env=self._env, capture_output=True, text=True, check=False
+        )
+        if result.returncode:
+            raise GitCommandError(command, result.returncode, result.stderr)
+
+    def _stream(self, mirror: Path, command: list[str]) -> Iterator[str]:
+        # stderr goes to a file: a pipe nobody reads until stdout ends would
+        # block git (and this loop) once it filled up with warnings.
+        with tempfile.TemporaryFile() as stderr_file:
+            with subprocess.Popen(
+                ["git", "-C", str(mirror), *command],
+                env=self._env,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+            ) as process:
+                try:
+                    for line in process.stdout:
+                        yield line.rstrip("\n")
+                finally:
+                    # Abandoned early: stop git instead of draining its output
+                    if process.poll() is None:
+                        process.kill()
+            if process.returncode > 0:
+                stderr_file.seek(0)
+                raise GitCommandError(
+                    command, process.returncode, stderr_file.read().decode("utf-8", "replace")
+                )
+
+    def _to_commit_info(self, project: ProjectInfo, line: str) -> CommitInfo:
+        (
+            sha, parents, author_name, author_email, authored_date,
+            committer_name, committer_email, committed_date, title,
+        ) = line.split(FIELD_SEPARATOR, 8)
+        return CommitInfo(
+            project_id=project.id,
+            project_path=project.path_with_namespace,
+            sha=sha,
+            title=title,
+            author_name=author_name,
+            author_email=author_email,
+            authored_date=authored_date,
+            committer_name=committer_name,
+            committer_email=committer_email,
+            committed_date=committed_date,
+            parent_ids=tuple(parents.split()),
+            source=project.source,
+        )
+
+    @staticmethod
+    def _git_env(token: str) -> dict[str, str]:
+        env = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+        if token:
+            # GitLab accepts a personal access token as the Basic password
+            credentials = base64.b64encode(f"oauth2:{token}".encode("utf-8")).decode("ascii")
+            # Appended after any GIT_CONFIG_* entries the caller already set
+            index = int(env.get("GIT_CONFIG_COUNT") or 0)
+            env.update({
+                "GIT_CONFIG_COUNT": str(index + 1),
+                f"GIT_CONFIG_KEY_{index}": "http.extraHeader",
+                f"GIT_CONFIG_VALUE_{index}": f"Authorization: Basic {credentials}",
+            })
+        return env
@@ -1,3 +1,13 @@
+from dataextractor.infrastructure.gitlab.async_repository import AsyncGitLabProjectRepository
+from dataextractor.infrastructure.gitlab.commits import GitLabCommitRepository
+from dataextractor.infrastructure.gitlab.connection import GitLabConnection
+from dataextractor.infrastructure.gitlab.graphql_repository import GraphQLGitLabProjectRepository
 from dataextractor.infrastructure.gitlab.repository import GitLabProjectRepository
 
-__all__ = ["GitLabProjectRepository"]
+__all__ = [
+    "AsyncGitLabProjectRepository",
+    "GitLabCommitRepository",
+    "GitLabConnection",
+    "GitLabProjectRepository",
+    "GraphQLGitLabProjectRepository",
+]
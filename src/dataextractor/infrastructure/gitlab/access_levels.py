@@ -0,0 +1,72 @@
+from collections.abc import Iterable
+
+from gitlab.const import AccessLevel
+
+# Reporter..Owner, highest first; each lean listing pass resolves one level.
+# Guest needs no pass of its own: the Guest listing is every membership
+# project, so it is the row listing itself.
+LEAN_ACCESS_LEVELS = (
+    AccessLevel.OWNER,
+    AccessLevel.MAINTAINER,
+    AccessLevel.DEVELOPER,
+    AccessLevel.REPORTER,
+)
+
+
+def plan_passes(totals: dict[int, int | None]) -> tuple[int, list[int]]:
+    """Pick the lean listing passes that can still change a project's level.
+
+    `totals` maps every level of LEAN_ACCESS_LEVELS and Guest to the
+    project count of its listing, or None where GitLab left X-Total out
+    (above 10,000 results). Listings are nested, so a pass no larger than
+    the one above it adds nobody, and the highest pass that holds every
+    project makes the lower ones redundant: it is the floor, whose listing
+    becomes the rows and whose level goes to whoever no pass above it has.
+    Returns the floor and the passes above it that are still needed.
+    """
+    everything = totals[int(AccessLevel.GUEST)]
+    needed: list[int] = []
+    previous: int | None = 0
+    for level in map(int, LEAN_ACCESS_LEVELS):
+        total = totals[level]
+        if total is not None and total == everything:
+            return level, needed
+        if total is None or previous is None or total > previous:
+            needed.append(level)
+        previous = total
+    return int(AccessLevel.GUEST), needed
+
+
+class AccessLevelIndex:
+    """Highest access level per project, filled in by the lean listing passes.
+
+    A project's level is settled once no pass above it is still running:
+    Owner rows straight away, the others as the passes above them finish.
+    A project none of them contains is at the floor level, which is only
+    known once every pass has finished.
+    """
+
+    def __init__(self, passes: Iterable[int], floor: int = int(AccessLevel.GUEST)):
+        self._levels: dict[int, int] = {}
+        self._running = set(passes)
+        self.floor = floor
+
+    @property
+    def complete(self) -> bool:
+        return not self._running
+
+    def add(self, project_id: int, level: int) -> None:
+        if level > self._levels.get(project_id, 0):
+            self._levels[project_id] = level
+
+    def finish(self, level: int) -> None:
+        self._running.discard(level)
+
+    def get(self, project_id: int) -> int | None:
+        """The project's level, or None while a pass could still raise it."""
+        level = self._levels.get(project_id)
+        if level is None:
+            return self.floor if self.complete else None
+        if any(running > level for running in self._running):
+            return None
+        return level
@@ -0,0 +1,288 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator, Mapping
+from contextlib import aclosing
+from typing import NamedTuple
+from urllib.parse import quote
+
+import httpx
+from gitlab.const import AccessLevel
+
+from dataextractor.config import Settings
+from dataextractor.core.entities import ProjectInfo
+from dataextractor.core.interfaces import AsyncProjectRepository
+from dataextractor.infrastructure.gitlab.access_levels import LEAN_ACCESS_LEVELS, AccessLevelIndex, plan_passes
+from dataextractor.infrastructure.gitlab.connection import response_cache
+from dataextractor.infrastructure.gitlab.paging import remaining_pages
+from dataextractor.infrastructure.gitlab.references import project_reference
+from dataextractor.infrastructure.http import RequestScheduler, shared_scheduler, token_identity
+from dataextractor.infrastructure.windowed import async_windowed_map
+
+
+# What _to_project_info reads; cached pages keep only these
+CACHED_FIELDS = (
+    "id",
+    "name",
+    "path_with_namespace",
+    "http_url_to_repo",
+    "permissions",
+    "last_activity_at",
+    "default_branch",
+)
+TOTAL_HEADERS = ("X-Total-Pages", "X-Total")
+
+
+class Page(NamedTuple):
+    projects: list[dict]
+    # Both None when GitLab leaves the headers out (above 10,000 results)
+    total_pages: int | None
+    total: int | None
+
+
+class AsyncGitLabProjectRepository(AsyncProjectRepository):
+    DEFAULT_TIMEOUT = 30  # seconds
+    API_PATH = "/api/v4"
+
+    def __init__(
+        self,
+        settings: Settings,
+        client: httpx.AsyncClient | None = None,
+        scheduler: RequestScheduler | None = None,
+    ):
+        self.settings = settings
+        self.scheduler = scheduler or shared_scheduler(
+            settings.git.url, settings.git.max_rate, settings.git.max_retries
+        )
+        self._client = client
+        self._owns_client = client is None
+        self._unresolved: dict[str, str] = {}
+        self._authenticated = False
+        self.cache = response_cache(settings.git)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            # One keep-alive connection per concurrent request
+            pool_size = max(self.settings.git.concurrency, 1)
+            self._client = httpx.AsyncClient(
+                base_url=self.settings.git.url.rstrip("/") + self.API_PATH,
+                headers={"PRIVATE-TOKEN": self.settings.git.token},
+                timeout=self.DEFAULT_TIMEOUT,
+                http2=self.settings.git.http2,
+                limits=httpx.Limits(
+                    max_connections=pool_size,
+                    max_keepalive_connections=pool_size,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+
+    async def get_all_projects(self) -> list[ProjectInfo]:
+        return [p async for p in self._iter_projects({})]
+
+    async def iter_projects(self) -> AsyncIterator[ProjectInfo]:
+        async for project in self._iter_projects({}):
+            yield project
+
+    async def get_projects_changed_since(self, since: str) -> list[ProjectInfo]:
+        return [p async for p in self._iter_projects({"last_activity_after": since})]
+
+    def get_unresolved_projects(self) -> dict[str, str]:
+        return dict(self._unresolved)
+
+    async def _iter_projects(self, filters: dict) -> AsyncIterator[ProjectInfo]:
+        await self._authenticate()
+        if self.settings.git.projects:
+            # An explicit list is looked up directly; activity filters are
+            # left to the caller since every entry is fetched anyway.
+            async for project in self._iter_configured_projects():
+                yield project
+            return
+        if not self.settings.git.lean:
+            async for project in self._iter_raw_projects(filters):
+                yield self._to_project_info(project)
+            return
+
+        async for project in self._iter_lean_projects(filters):
+            yield project
+
+    async def _authenticate(self) -> None:
+        # The /user round trip only validates the token early; with
+        # skip_auth a bad token fails the first listing request instead.
+        if self._authenticated or self.settings.git.skip_auth:
+            return
+        response = await self._get("/user")
+        response.raise_for_status()
+        self._authenticated = True
+
+    async def _iter_configured_projects(self) -> AsyncIterator[ProjectInfo]:
+        self._unresolved = {}
+        entries = dict.fromkeys(self.settings.git.projects)
+        seen: set[int] = set()
+
+        async def lookup(entry: str) -> tuple[str, dict | None, str]:
+            return entry, *await self._fetch_project(entry)
+
+        lookups = async_windowed_map(lookup, entries, self.settings.git.concurrency)
+        async with aclosing(lookups):
+            async for entry, project, reason in lookups:
+                if project is None:
+                    self._unresolved[entry] = reason
+                elif project["id"] not in seen:
+                    # A URL and a path can name the same project
+                    seen.add(project["id"])
+                    yield self._to_project_info(project)
+
+    async def _fetch_project(self, entry: str) -> tuple[dict | None, str]:
+        reference = project_reference(entry, self.settings.git.url)
+        response = await self._get(f"/projects/{quote(str(reference), safe='')}")
+        if response.status_code in (403, 404):
+            return None, f"{response.status_code}: {response.reason_phrase}"
+        response.raise_for_status()
+        return response.json(), ""
+
+    async def _iter_lean_projects(self, filters: dict) -> AsyncIterator[ProjectInfo]:
+        """Simple listing of every project, with access levels from extra passes.
+
+        simple=true drops the permissions block (and most of the payload)
+        but costs one listing per access level. The first page of every
+        pass is fetched at once, and their totals leave out the passes
+        that cannot change anyone's level (see plan_passes). The floor
+        pass is streamed as the rows while a task walks the others from
+        the highest level down; rows are handed on once their level is
+        settled, so owned projects come through straight away.
+        """
+        passes = {
+            int(level): {"simple": "true", "min_access_level": int(level), **filters}
+            for level in (*LEAN_ACCESS_LEVELS, AccessLevel.GUEST)
+        }
+        first_pages = await asyncio.gather(*(self._fetch_page(1, f) for f in passes.values()))
+        first = dict(zip(passes, first_pages))
+        floor, needed = plan_passes({level: page.total for level, page in first.items()})
+        levels = AccessLevelIndex(needed, floor)
+        walk = asyncio.create_task(
+            self._list_access_levels(levels, [(level, passes[level], first[level]) for level in needed])
+        )
+        held = []
+        try:
+            async for project in self._iter_raw_projects(passes[floor], first[floor]):
+                if levels.get(project["id"]) is None:
+                    held.append(project)
+                else:
+                    yield self._to_project_info(project, levels)
+                if held and levels.complete:
+                    for waiting in held:
+                        yield self._to_project_info(waiting, levels)
+                    held.clear()
+            await walk
+        finally:
+            walk.cancel()
+        for project in held:
+            yield self._to_project_info(project, levels)
+
+    async def _list_access_levels(
+        self, levels: AccessLevelIndex, passes: list[tuple[int, dict, Page]]
+    ) -> None:
+        # min_access_level considers both project and group membership
+        for level, filters, first in passes:
+            async for project in self._iter_raw_projects(filters, first):
+                levels.add(project["id"], level)
+            levels.finish(level)
+
+    async def _iter_raw_projects(self, filters: dict, first: Page | None = None) -> AsyncIterator[dict]:
+        per_page = self.settings.git.per_page
+
+        first = first or await self._fetch_page(1, filters)
+        for project in first.projects:
+            yield project
+
+        page_numbers = remaining_pages(len(first.projects), per_page, first.total_pages)
+
+        # At most `concurrency` requests are in flight or buffered, and pages
+        # are yielded in order as soon as the oldest one completes.
+        pages = async_windowed_map(
+            lambda number: self._fetch_page(number, filters), page_numbers, self.settings.git.concurrency
+        )
+        async with aclosing(pages):
+            async for page in pages:
+                for project in page.projects:
+                    yield project
+                if first.total_pages is None and len(page.projects) < per_page:
+                    break
+
+    async def _fetch_page(self, page: int, filters: dict) -> Page:
+        params = {
+            "membership": "true",
+            "page": page,
+            "per_page": self.settings.git.per_page,
+            **filters,
+        }
+        cache = self.cache
+        if cache is None:
+            response = await self._get("/projects", params)
+            response.raise_for_status()
+            return _page(response.json(), response.headers)
+
+        # Entries hold the trimmed rows rather than the response body, so a
+        # 304 costs a small parse; the key keeps them apart from the bodies
+        # the commits API stores in the same directory.
+        url = self.client.build_request("GET", "/projects", params=params).url
+        key = cache.key(str(url), token_identity(self.settings.git.token) + ":rows")
+        cached = cache.get(key)
+        headers = {"If-None-Match": cached.etag} if cached is not None else None
+        response = await self._get("/projects", params, headers)
+        if response.status_code == 304 and cached is not None:
+            return _page(json.loads(cached.body), cached.headers)
+        response.raise_for_status()
+        projects = response.json()
+        etag = response.headers.get("ETag")
+        if etag:
+            rows = [{k: p[k] for k in CACHED_FIELDS if k in p} for p in projects]
+            totals = {k: response.headers[k] for k in TOTAL_HEADERS if k in response.headers}
+            cache.put(key, etag, totals, json.dumps(rows).encode("utf-8"))
+        return _page(projects, response.headers)
+
+    async def _get(self, path: str, params: dict | None = None, headers: dict | None = None) -> httpx.Response:
+        attempt = 0
+        while True:
+            await self.scheduler.acquire_async()
+            response = await self.client.get(path, params=params, headers=headers)
+            delay = self.scheduler.observe(response.status_code, response.headers, attempt)
+            if delay is None:
+                return response
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _to_project_info(
+        self, project: dict, access_levels: AccessLevelIndex | None = None
+    ) -> ProjectInfo:
+        if access_levels is None:
+            access_level = self._get_access_level(project)
+        else:
+            access_level = access_levels.get(project["id"])
+        return ProjectInfo(
+            id=project["id"],
+            name=project["name"],
+            path_with_namespace=project["path_with_namespace"],
+            http_url=project["http_url_to_repo"],
+            access_level=access_level,
+            last_activity_at=project.get("last_activity_at"),
+            default_branch=project.get("default_branch"),
+            source=self.settings.git.source,
+        )
+
+    def _get_access_level(self, project: dict) -> int | None:
+        permissions = project.get("permissions") or {}
+        for key in ("project_access", "group_access"):
+            if permissions.get(key):
+                return permissions[key]["access_level"]
+        return None
+
+
+def _page(projects: list[dict], headers: Mapping[str, str]) -> Page:
+    total_pages, total = (headers.get(name) for name in TOTAL_HEADERS)
+    return Page(projects, int(total_pages) if total_pages else None, int(total) if total else None)
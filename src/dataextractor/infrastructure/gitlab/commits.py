@@ -0,0 +1,43 @@
+from collections.abc import Iterator
+
+from dataextractor.core.entities import CommitInfo, ProjectInfo
+from dataextractor.core.interfaces import CommitRepository
+from dataextractor.infrastructure.gitlab.connection import NO_CLIENT_RETRIES, GitLabConnection
+
+
+class GitLabCommitRepository(CommitRepository):
+    """Default-branch history through the REST commits API.
+
+    Commit pages go through the connection's python-gitlab client, so
+    they share its pooled session, rate scheduler and HTTP cache.
+    """
+
+    def __init__(self, connection: GitLabConnection):
+        self.connection = connection
+
+    def iter_commits(self, project: ProjectInfo, since: str | None = None) -> Iterator[CommitInfo]:
+        filters = {} if since is None else {"since": since}
+        commits = self.connection.client.projects.get(project.id, lazy=True).commits.list(
+            iterator=True,
+            per_page=self.connection.settings.git.per_page,
+            **NO_CLIENT_RETRIES,
+            **filters,
+        )
+        for commit in commits:
+            yield self._to_commit_info(project, commit)
+
+    def _to_commit_info(self, project: ProjectInfo, commit) -> CommitInfo:
+        return CommitInfo(
+            project_id=project.id,
+            project_path=project.path_with_namespace,
+            sha=commit.id,
+            title=commit.title,
+            author_name=commit.author_name,
+            author_email=commit.author_email,
+            authored_date=commit.authored_date,
+            committer_name=commit.committer_name,
+            committer_email=commit.committer_email,
+            committed_date=commit.committed_date,
+            parent_ids=tuple(commit.parent_ids),
+            source=project.source,
+        )
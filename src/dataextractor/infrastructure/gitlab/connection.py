@@ -0,0 +1,88 @@
+import gitlab
+import requests
+
+from dataextractor.config import Settings
+from dataextractor.config.env import STATE_DIR_NAME, resolve_project_path
+from dataextractor.config.settings import GitSettings
+from dataextractor.infrastructure.http import (
+    ApiHTTPAdapter,
+    RequestScheduler,
+    ResponseCache,
+    shared_response_cache,
+    shared_scheduler,
+    shared_session,
+    token_identity,
+)
+
+# ApiHTTPAdapter already retries 429/5xx on the scheduler's terms; without
+# these python-gitlab would retry every 429 again on top of that.
+NO_CLIENT_RETRIES = {"obey_rate_limit": False, "max_retries": 0}
+
+
+def response_cache(git: GitSettings) -> ResponseCache | None:
+    """The instance's HTTP cache, or None when `http_cache` is off."""
+    if not git.http_cache:
+        return None
+    return shared_response_cache(
+        resolve_project_path(git.http_cache_dir or f"{STATE_DIR_NAME}/http-cache"),
+        max_bytes=git.http_cache_max_mb * 1024 * 1024,
+    )
+
+
+class GitLabConnection:
+    """python-gitlab client and pooled requests session for one instance.
+
+    The commits API and the GraphQL listing go through `session`, which
+    paces and retries requests on the host's scheduler and, when enabled,
+    revalidates them against the HTTP cache.
+    """
+
+    DEFAULT_TIMEOUT = 30  # seconds
+
+    def __init__(self, settings: Settings, scheduler: RequestScheduler | None = None):
+        self.settings = settings
+        self.scheduler = scheduler or shared_scheduler(
+            settings.git.url, settings.git.max_rate, settings.git.max_retries
+        )
+        self._client: gitlab.Gitlab | None = None
+
+    @property
+    def client(self) -> gitlab.Gitlab:
+        if self._client is None:
+            self._client = gitlab.Gitlab(
+                self.settings.git.url,
+                private_token=self.settings.git.token,
+                timeout=self.DEFAULT_TIMEOUT,
+                session=self.session,
+            )
+            # The /user round trip auth() makes only validates the token
+            # early; with skip_auth a bad token fails the first request.
+            # auth() takes no request options, so it is issued directly.
+            if not self.settings.git.skip_auth:
+                self._client.http_get("/user", **NO_CLIENT_RETRIES)
+        return self._client
+
+    @property
+    def session(self) -> requests.Session:
+        git = self.settings.git
+        return shared_session(
+            git.url,
+            token_identity(git.token),
+            self._create_adapter,
+            git.concurrency,
+            git.http_cache,
+            git.http_cache_dir,
+            git.http_cache_max_mb,
+            id(self.scheduler),
+        )
+
+    def _create_adapter(self) -> ApiHTTPAdapter:
+        git = self.settings.git
+        return ApiHTTPAdapter(
+            cache=response_cache(git),
+            identity=token_identity(git.token),
+            scheduler=self.scheduler,
+            # one host per session; keep one idle connection per worker
+            pool_connections=1,
+            pool_maxsize=max(git.concurrency, 1),
+        )
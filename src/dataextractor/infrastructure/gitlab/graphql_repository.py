@@ -0,0 +1,173 @@
+from collections.abc import Iterator
+from datetime import datetime
+from itertools import islice
+
+from gitlab.exceptions import GitlabError
+
+from dataextractor.config import Settings
+from dataextractor.core.entities import ProjectInfo
+from dataextractor.core.interfaces import ProjectRepository
+from dataextractor.infrastructure.gitlab.connection import GitLabConnection
+from dataextractor.infrastructure.gitlab.references import project_reference
+from dataextractor.infrastructure.http import RequestScheduler
+
+# Exactly the fields ProjectInfo needs; %(extra_fields)s adds optional ones
+PROJECTS_QUERY = """
+query Projects($first: Int!, $after: String, $membership: Boolean, $fullPaths: [String!], $ids: [ID!]) {
+  projects(first: $first, after: $after, membership: $membership, fullPaths: $fullPaths, ids: $ids) {
+    pageInfo { hasNextPage endCursor }
+    nodes {
+      id
+      name
+      fullPath
+      httpUrlToRepo
+      maxAccessLevel { integerValue }%(extra_fields)s
+    }
+  }
+}
+"""
+ACTIVITY_FIELD = "lastActivityAt"
+# repository { rootRef } resolves each project's Git repository on the server
+DEFAULT_BRANCH_FIELD = "repository { rootRef }"
+
+# GitLab rejects more than 50 fullPaths (or ids) in one projects query
+LOOKUP_BATCH_SIZE = 50
+PROJECT_GID_PREFIX = "gid://gitlab/Project/"
+
+
+class GraphQLGitLabProjectRepository(GitLabConnection, ProjectRepository):
+    """GitLab listing through the GraphQL API, one query per page.
+
+    Pages are walked with cursors, so unlike the REST listing they cannot
+    be fetched in parallel; in exchange each page carries only the fields
+    ProjectInfo needs, with the effective access level already resolved.
+    Last activity and default branch are left out unless `graphql_extras`
+    is set (an incremental run still asks for last activity to filter on).
+    Requests go through the same pooled, rate-scheduled session as the
+    REST commits API.
+    """
+
+    GRAPHQL_PATH = "/api/graphql"
+
+    def __init__(self, settings: Settings, scheduler: RequestScheduler | None = None):
+        super().__init__(settings, scheduler)
+        self._unresolved: dict[str, str] = {}
+
+    def get_all_projects(self) -> list[ProjectInfo]:
+        return list(self._iter_projects())
+
+    def iter_projects(self) -> Iterator[ProjectInfo]:
+        return self._iter_projects()
+
+    def get_projects_changed_since(self, since: str) -> list[ProjectInfo]:
+        return list(self._iter_projects(last_activity_after=since))
+
+    def get_unresolved_projects(self) -> dict[str, str]:
+        return dict(self._unresolved)
+
+    def iter_records(self) -> Iterator[dict]:
+        return self._iter_records()
+
+    def _iter_projects(self, **filters) -> Iterator[ProjectInfo]:
+        projects = (self.to_project_info(r) for r in self._iter_records(**filters))
+        since = filters.get("last_activity_after")
+        if since is None or self.settings.git.projects:
+            return projects
+        # The projects query has no activity filter, so the cut happens here
+        return (p for p in projects if _is_active_since(p, since))
+
+    def _iter_records(self, **filters) -> Iterator[dict]:
+        query = self._projects_query(with_activity="last_activity_after" in filters)
+        if self.settings.git.projects:
+            return self._iter_configured_nodes(query)
+        return self._iter_nodes(query, membership=True)
+
+    def _projects_query(self, with_activity: bool) -> str:
+        """PROJECTS_QUERY with the extras, when enabled, and the activity filter's field."""
+        extras = self.settings.git.graphql_extras
+        fields = [
+            *([ACTIVITY_FIELD] if extras or with_activity else []),
+            *([DEFAULT_BRANCH_FIELD] if extras else []),
+        ]
+        return PROJECTS_QUERY % {"extra_fields": "".join(f"\n      {f}" for f in fields)}
+
+    def _iter_configured_nodes(self, query: str) -> Iterator[dict]:
+        """Resolve configured entries by full path or id, 50 per query."""
+        self._unresolved = {}
+        entries = iter(dict.fromkeys(self.settings.git.projects))
+        seen: set[int] = set()
+        while batch := list(islice(entries, LOOKUP_BATCH_SIZE)):
+            references = {e: project_reference(e, self.settings.git.url) for e in batch}
+            paths = [r for r in references.values() if isinstance(r, str)]
+            ids = [f"{PROJECT_GID_PREFIX}{r}" for r in references.values() if isinstance(r, int)]
+
+            found: dict[int | str, dict] = {}
+            # GitLab applies fullPaths and ids together, so a query carrying
+            # both only matches projects named twice; each gets its own.
+            for name, values in (("fullPaths", paths), ("ids", ids)):
+                if not values:
+                    continue
+                for node in self._iter_nodes(query, **{name: values}):
+                    found[node["fullPath"].lower()] = node
+                    found[_project_id(node)] = node
+
+            for entry, reference in references.items():
+                node = found.get(reference.lower() if isinstance(reference, str) else reference)
+                if node is None:
+                    self._unresolved[entry] = "not found or not visible to this token"
+                elif _project_id(node) not in seen:
+                    # A URL and a path can name the same project
+                    seen.add(_project_id(node))
+                    yield node
+
+    def _iter_nodes(self, query: str, **variables) -> Iterator[dict]:
+        after = None
+        while True:
+            data = self._query(
+                query, {"first": self.settings.git.per_page, "after": after, **variables}
+            )["projects"]
+            yield from data["nodes"]
+            if not data["pageInfo"]["hasNextPage"]:
+                return
+            after = data["pageInfo"]["endCursor"]
+
+    def _query(self, query: str, variables: dict) -> dict:
+        response = self.session.post(
+            self.settings.git.url.rstrip("/") + self.GRAPHQL_PATH,
+            json={"query": query, "variables": variables},
+            headers={"Authorization": f"Bearer {self.settings.git.token}"},
+            timeout=self.DEFAULT_TIMEOUT,
+        )
+        if not response.ok:
+            raise GitlabError(response.text, response.status_code, response.content)
+        body = response.json()
+        if body.get("errors"):
+            # GraphQL reports query errors with a 200 status
+            messages = "; ".join(e.get("message", "") for e in body["errors"])
+            raise GitlabError(messages, response.status_code, response.content)
+        return body["data"]
+
+    def to_project_info(self, record) -> ProjectInfo:
+        access_level = (record.get("maxAccessLevel") or {}).get("integerValue")
+        repository = record.get("repository") or {}
+        return ProjectInfo(
+            id=_project_id(record),
+            name=record["name"],
+            path_with_namespace=record["fullPath"],
+            http_url=record["httpUrlToRepo"],
+            # NO_ACCESS (0) means visible without membership
+            access_level=access_level or None,
+            last_activity_at=record.get("lastActivityAt"),
+            default_branch=repository.get("rootRef"),
+            source=self.settings.git.source,
+        )
+
+
+def _project_id(node: dict) -> int:
+    return int(node["id"].removeprefix(PROJECT_GID_PREFIX))
+
+
+def _is_active_since(project: ProjectInfo, since: str) -> bool:
+    if project.last_activity_at is None:
+        return True
+    return datetime.fromisoformat(project.last_activity_at) >= datetime.fromisoformat(since)
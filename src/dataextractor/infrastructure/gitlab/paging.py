@@ -0,0 +1,13 @@
+from collections.abc import Iterator
+from itertools import count
+
+
+def remaining_pages(first_page_size: int, per_page: int, total_pages: int | None) -> Iterator[int]:
+    """Page numbers still to fetch after page 1 of an offset-paginated list."""
+    if total_pages is not None:
+        return iter(range(2, total_pages + 1))
+    if first_page_size == per_page:
+        # GitLab omits X-Total-Pages above 10,000 results, so keep
+        # requesting until a short (or empty) page marks the end.
+        return count(2)
+    return iter(())
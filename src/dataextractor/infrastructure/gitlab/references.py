@@ -0,0 +1,27 @@
+from urllib.parse import urlsplit
+
+
+def project_reference(entry: str, base_url: str = "") -> int | str:
+    """The project id or full path that a configured `git_projects` entry names.
+
+    Accepts numeric ids, ``group/project`` paths, web or clone URLs
+    (``https://host/group/project[.git][/-/...]``) and scp-style SSH
+    remotes (``git@host:group/project.git``). A path prefix shared with
+    `base_url` (GitLab served under ``/gitlab``) is dropped.
+    """
+    entry = str(entry).strip()
+    if entry.isdigit():
+        return int(entry)
+
+    if "://" in entry:
+        path = urlsplit(entry).path
+        prefix = urlsplit(base_url).path.rstrip("/")
+        if prefix and path.startswith(prefix + "/"):
+            path = path[len(prefix):]
+    elif "@" in entry and ":" in entry:
+        path = entry.split(":", 1)[1]
+    else:
+        path = entry
+
+    path = path.split("/-/", 1)[0].strip("/")
+    return path.removesuffix(".git")
@@ -1,47 +1,32 @@
-import gitlab
+import httpx
 
 from dataextractor.config import Settings
-from dataextractor.core.entities import ProjectInfo
-from dataextractor.core.interfaces import ProjectRepository
+from dataextractor.infrastructure.blocking import BlockingProjectRepository
+from dataextractor.infrastructure.gitlab.async_repository import AsyncGitLabProjectRepository
+from dataextractor.infrastructure.http import RequestScheduler
 
 
-class GitLabProjectRepository(ProjectRepository):
-    DEFAULT_TIMEOUT = 30  # seconds
+class GitLabProjectRepository(BlockingProjectRepository):
+    """REST listing for synchronous callers.
 
-    def __init__(self, settings: Settings):
-        self.settings = settings
-        self._client: gitlab.Gitlab | None = None
+    Runs AsyncGitLabProjectRepository on one event loop, so `concurrency`
+    pages are in flight without worker threads and rows are built from
+    the JSON payloads directly rather than from python-gitlab objects,
+    which would serialize on the GIL however many threads fetched them.
+    """
 
-    @property
-    def client(self) -> gitlab.Gitlab:
-        if self._client is None:
-            self._client = gitlab.Gitlab(
-                self.settings.git.url,
-                private_token=self.settings.git.token,
-                timeout=self.DEFAULT_TIMEOUT,
-            )
-            self._client.auth()
-        return self._client
-
-    def get_all_projects(self) -> list[ProjectInfo]:
-        # membership=True: only projects the user is a member of
-        # This is much faster than fetching all public projects
-        projects = self.client.projects.list(membership=True, iterator=True)
-        return [self._to_project_info(p) for p in projects]
+    def __init__(
+        self,
+        settings: Settings,
+        scheduler: RequestScheduler | None = None,
+        client: httpx.AsyncClient | None = None,
+    ):
+        super().__init__(AsyncGitLabProjectRepository(settings, client, scheduler))
 
-    def _to_project_info(self, project) -> ProjectInfo:
-        return ProjectInfo(
-            id=project.id,
-            name=project.name,
-            path_with_namespace=project.path_with_namespace,
-            http_url=project.http_url_to_repo,
-            access_level=self._get_access_level(project),
-        )
+    @property
+    def settings(self) -> Settings:
+        return self.repository.settings
 
-    def _get_access_level(self, project) -> int | None:
-        permissions = project.permissions
-        if permissions.get("project_access"):
-            return permissions["project_access"]["access_level"]
-        if permissions.get("group_access"):
-            return permissions["group_access"]["access_level"]
-        return None
+    @property
+    def scheduler(self) -> RequestScheduler:
+        return self.repository.scheduler
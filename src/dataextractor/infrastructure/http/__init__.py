@@ -0,0 +1,21 @@
+from dataextractor.infrastructure.http.adapter import ApiHTTPAdapter, token_identity
+from dataextractor.infrastructure.http.cache import CachedResponse, ResponseCache, shared_response_cache
+from dataextractor.infrastructure.http.scheduler import (
+    RequestScheduler,
+    SchedulerMetrics,
+    shared_scheduler,
+)
+from dataextractor.infrastructure.http.session import close_shared_sessions, shared_session
+
+__all__ = [
+    "ApiHTTPAdapter",
+    "CachedResponse",
+    "RequestScheduler",
+    "ResponseCache",
+    "SchedulerMetrics",
+    "close_shared_sessions",
+    "shared_response_cache",
+    "shared_scheduler",
+    "shared_session",
+    "token_identity",
+]
@@ -0,0 +1,87 @@
+import hashlib
+import time
+
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from dataextractor.infrastructure.http.cache import CachedResponse, ResponseCache
+from dataextractor.infrastructure.http.scheduler import RequestScheduler
+
+# Describe the bytes on the wire rather than the decoded body we store
+_WIRE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+def token_identity(token: str) -> str:
+    """Stable, non-reversible identity for a token, usable as a cache key part."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+
+
+class ApiHTTPAdapter(HTTPAdapter):
+    """Transport adapter for API sessions.
+
+    With a cache, GET requests are sent with If-None-Match and a 304 is
+    answered from the stored body, so unchanged pages cost one round trip
+    with no payload. With a scheduler, every attempt waits for a token and
+    429/5xx responses are retried after the scheduler's backoff.
+    """
+
+    def __init__(
+        self,
+        cache: ResponseCache | None = None,
+        identity: str = "",
+        scheduler: RequestScheduler | None = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.cache = cache
+        self.identity = identity
+        self.scheduler = scheduler
+
+    def send(self, request: PreparedRequest, stream=False, timeout=None, verify=True, cert=None, proxies=None):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        if self.cache is None or request.method != "GET" or stream:
+            return self._send_scheduled(request, stream, timeout, verify, cert, proxies)
+
+        key = self.cache.key(request.url, self.identity)
+        cached = self.cache.get(key)
+        if cached is not None:
+            request.headers["If-None-Match"] = cached.etag
+
+        response = self._send_scheduled(request, stream, timeout, verify, cert, proxies)
+
+        if response.status_code == 304 and cached is not None:
+            return self._from_cache(response, cached)
+
+        etag = response.headers.get("ETag")
+        if response.status_code == 200 and etag:
+            headers = {k: v for k, v in response.headers.items() if k.lower() not in _WIRE_HEADERS}
+            self.cache.put(key, etag, headers, response.content)
+        return response
+
+    def _send_scheduled(self, request: PreparedRequest, *args) -> Response:
+        if self.scheduler is None:
+            return super().send(request, *args)
+
+        attempt = 0
+        while True:
+            self.scheduler.acquire()
+            response = super().send(request, *args)
+            delay = self.scheduler.observe(response.status_code, response.headers, attempt)
+            if delay is None:
+                return response
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _from_cache(self, response: Response, cached: CachedResponse) -> Response:
+        # Pagination headers (Link, X-Total-Pages, ...) come from the cached
+        # response; anything the 304 does send (rate limits, dates) wins.
+        headers = CaseInsensitiveDict(cached.headers)
+        headers.update(
+            (k, v) for k, v in response.headers.items() if k.lower() not in _WIRE_HEADERS
+        )
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers = headers
+        response._content = cached.body  # pylint: disable=protected-access
+        return response
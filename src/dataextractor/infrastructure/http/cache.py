@@ -0,0 +1,119 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+
+_caches: dict[tuple[Path, int], "ResponseCache"] = {}
+_caches_lock = threading.Lock()
+
+
+@dataclass
+class CachedResponse:
+    etag: str
+    headers: dict[str, str]
+    body: bytes
+
+
+class ResponseCache:
+    """On-disk store of ETag-validated response bodies with LRU eviction.
+
+    Each entry is one file: a JSON header line (etag and response headers)
+    followed by the raw body. Recency is tracked in memory and mirrored to
+    file mtimes, so a fresh process resumes the previous eviction order.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._sizes: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+        self._load_index()
+
+    @staticmethod
+    def key(url: str, identity: str = "") -> str:
+        return hashlib.sha256(f"{identity}\n{url}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> CachedResponse | None:
+        path = self._path(key)
+        with self._lock:
+            if key not in self._sizes:
+                return None
+            try:
+                with open(path, "rb") as f:
+                    meta = json.loads(f.readline())
+                    body = f.read()
+                os.utime(path)
+            except (OSError, ValueError):
+                self._forget(key)
+                return None
+            self._sizes.move_to_end(key)
+        return CachedResponse(etag=meta["etag"], headers=meta["headers"], body=body)
+
+    def put(self, key: str, etag: str, headers: dict[str, str], body: bytes) -> None:
+        meta = json.dumps({"etag": etag, "headers": headers}).encode("utf-8")
+        size = len(meta) + 1 + len(body)
+        if size > self.max_bytes:
+            return
+
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(meta)
+                f.write(b"\n")
+                f.write(body)
+            os.replace(tmp_path, path)
+
+            self._total_bytes += size - self._sizes.pop(key, 0)
+            self._sizes[key] = size
+            self._evict()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def _evict(self) -> None:
+        while self._total_bytes > self.max_bytes and self._sizes:
+            oldest = next(iter(self._sizes))
+            self._forget(oldest)
+
+    def _forget(self, key: str) -> None:
+        self._total_bytes -= self._sizes.pop(key, 0)
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _load_index(self) -> None:
+        if not self.directory.exists():
+            return
+        entries = []
+        for entry in self.directory.glob("*.entry"):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, entry.stem, stat.st_size))
+        for _, key, size in sorted(entries):
+            self._sizes[key] = size
+            self._total_bytes += size
+        self._evict()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.entry"
+
+
+def shared_response_cache(directory: str | Path, max_bytes: int) -> ResponseCache:
+    """The process-wide cache for one directory and size limit.
+
+    Every client storing into the directory shares one LRU index, so
+    one does not evict entries another still counts.
+    """
+    key = (Path(directory), max_bytes)
+    with _caches_lock:
+        if key not in _caches:
+            _caches[key] = ResponseCache(directory, max_bytes)
+        return _caches[key]
@@ -0,0 +1,205 @@
+import asyncio
+import math
+import random
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass
+class SchedulerMetrics:
+    current_rate: float
+    requests: int
+    throttled: int
+    retries: int
+
+
+class RequestScheduler:  # pylint: disable=too-many-instance-attributes
+    """Adaptive token bucket shared by every request to one API host.
+
+    The rate starts at `max_rate` (unbounded when 0) and follows the
+    server's RateLimit-Remaining / RateLimit-Reset headers, spreading the
+    remaining budget evenly over the window. An exhausted budget pauses the
+    bucket until the window resets rather than slowing it down, so the next
+    window is used in full. A 429 halves the rate; other successes grow it
+    back by a few percent, never past `max_rate`. Retryable responses are
+    backed off with full jitter, honouring Retry-After (up to BACKOFF_MAX)
+    when the server sends it.
+    """
+
+    MIN_RATE = 0.5  # requests per second
+    RECOVERY_FACTOR = 1.05
+    BACKOFF_BASE = 0.5  # seconds
+    BACKOFF_MAX = 60.0  # seconds
+
+    def __init__(
+        self,
+        max_rate: float = 0.0,
+        max_retries: int = 5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_rate = max_rate if max_rate > 0 else math.inf
+        self.max_retries = max_retries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._rate = self.max_rate
+        self._tokens = 1.0
+        self._updated = clock()
+        self._paused_until = -math.inf
+        self._requests = 0
+        self._throttled = 0
+        self._retries = 0
+
+    @property
+    def current_rate(self) -> float:
+        return self._rate
+
+    def metrics(self) -> SchedulerMetrics:
+        with self._lock:
+            return SchedulerMetrics(
+                current_rate=self._rate,
+                requests=self._requests,
+                throttled=self._throttled,
+                retries=self._retries,
+            )
+
+    def try_acquire(self) -> float:
+        """Take a token if one is free; otherwise return how long until one is.
+
+        Nothing is booked ahead, so a caller that waits and tries again sees
+        the rate as it is then, not a slot reserved under an older rate.
+        """
+        with self._lock:
+            now = self._clock()
+            if now < self._paused_until:
+                return self._paused_until - now
+            if math.isinf(self._rate):
+                self._requests += 1
+                return 0.0
+
+            burst = max(self._rate, 1.0)
+            self._tokens = min(burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                self._requests += 1
+                return 0.0
+            return (1.0 - self._tokens) / self._rate
+
+    def acquire(self) -> None:
+        while (delay := self.try_acquire()) > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        while (delay := self.try_acquire()) > 0:
+            await asyncio.sleep(delay)
+
+    def observe(self, status: int, headers: Mapping[str, str], attempt: int = 0) -> float | None:
+        """Adapt to a response; return a delay if the request should be retried."""
+        retry_after = _retry_after_seconds(headers.get("Retry-After"))
+        if retry_after is not None:
+            retry_after = min(retry_after, self.BACKOFF_MAX)
+        with self._lock:
+            adapted = self._adapt_to_headers(headers)
+            if status == 429:
+                self._throttled += 1
+                self._slow_down()
+                if retry_after is not None:
+                    self._pause(retry_after)
+            elif status < 400 and not adapted and not math.isinf(self._rate):
+                self._rate = min(self.max_rate, self._rate * self.RECOVERY_FACTOR)
+
+            if status not in RETRYABLE_STATUSES or attempt >= self.max_retries:
+                return None
+            self._retries += 1
+
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.BACKOFF_MAX, self.BACKOFF_BASE * 2 ** attempt))
+
+    def _adapt_to_headers(self, headers: Mapping[str, str]) -> bool:
+        remaining = headers.get("RateLimit-Remaining")
+        reset = headers.get("RateLimit-Reset")
+        if remaining is None or reset is None:
+            return False
+        try:
+            window = max(float(reset) - time.time(), 1.0)
+            rate = float(remaining) / window
+        except ValueError:
+            return False
+        if rate <= 0:
+            # Nothing left this window: hold every request until the reset
+            # and carry on at the current rate, instead of crawling at
+            # MIN_RATE into the next window.
+            self._pause(window)
+            return True
+        self._rate = min(self.max_rate, max(self.MIN_RATE, rate))
+        return True
+
+    def _pause(self, seconds: float) -> None:
+        until = self._clock() + seconds
+        if until > self._paused_until:
+            self._paused_until = until
+            self._tokens = 0.0
+            self._updated = until
+
+    def merge_limits(self, max_rate: float, max_retries: int) -> None:
+        """Fold another caller's settings into this shared scheduler.
+
+        The budget belongs to the host, so the lowest rate ceiling anyone
+        asked for applies to all; each caller still gets at least the
+        retries it asked for.
+        """
+        with self._lock:
+            if 0 < max_rate < self.max_rate:
+                self.max_rate = max_rate
+                self._rate = min(self._rate, max_rate)
+            self.max_retries = max(self.max_retries, max_retries)
+
+    def _slow_down(self) -> None:
+        if math.isinf(self._rate):
+            # No budget known yet: start from what has actually been achieved
+            elapsed = max(self._clock() - self._updated, 1.0)
+            self._rate = max(self._requests / elapsed, self.MIN_RATE * 2)
+            self._tokens = 0.0
+            self._updated = self._clock()
+        self._rate = max(self.MIN_RATE, self._rate / 2)
+
+
+def _retry_after_seconds(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+_schedulers: dict[str, RequestScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def shared_scheduler(url: str, max_rate: float = 0.0, max_retries: int = 5) -> RequestScheduler:
+    """The process-wide scheduler for the host serving `url`.
+
+    Every client talking to the same host shares one budget, whichever
+    backend or repository it belongs to; later callers' limits are merged
+    into it (see RequestScheduler.merge_limits) instead of being ignored.
+    """
+    host = urlsplit(url).netloc or url
+    with _schedulers_lock:
+        scheduler = _schedulers.get(host)
+        if scheduler is None:
+            scheduler = _schedulers[host] = RequestScheduler(max_rate=max_rate, max_retries=max_retries)
+        else:
+            scheduler.merge_limits(max_rate, max_retries)
+        return scheduler
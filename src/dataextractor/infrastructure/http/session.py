@@ -0,0 +1,37 @@
+import threading
+from collections.abc import Callable
+
+import requests
+from requests.adapters import HTTPAdapter
+
+_sessions: dict[tuple, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def shared_session(
+    base_url: str,
+    identity: str,
+    adapter_factory: Callable[[], HTTPAdapter],
+    *key_parts,
+) -> requests.Session:
+    """The process-wide keep-alive session for one API base URL and identity.
+
+    Clients built later in the same process reuse the already-open
+    connections instead of paying a new TCP/TLS handshake. `key_parts`
+    separate sessions whose adapters are configured differently.
+    """
+    prefix = base_url.rstrip("/") + "/"
+    key = (prefix, identity, *key_parts)
+    with _sessions_lock:
+        if key not in _sessions:
+            session = requests.Session()
+            session.mount(prefix, adapter_factory())
+            _sessions[key] = session
+        return _sessions[key]
+
+
+def close_shared_sessions() -> None:
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
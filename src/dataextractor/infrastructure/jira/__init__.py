@@ -1 +1,5 @@
-# Jira integration - placeholder for future implementation
+from dataextractor.infrastructure.jira.issues import JiraIssueRepository
+from dataextractor.infrastructure.jira.logs import JiraIssueLogRepository
+from dataextractor.infrastructure.jira.repository import JiraProjectRepository
+
+__all__ = ["JiraIssueLogRepository", "JiraIssueRepository", "JiraProjectRepository"]
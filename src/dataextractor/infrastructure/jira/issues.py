@@ -0,0 +1,201 @@
+from collections import defaultdict
+from collections.abc import Iterator, Mapping, Sequence
+from datetime import datetime
+from functools import cached_property
+from typing import Any
+
+from dataextractor.config.env import STATE_DIR_NAME, resolve_project_path
+from dataextractor.core.entities import IssueInfo, ProjectInfo
+from dataextractor.core.interfaces import IssueRepository
+from dataextractor.infrastructure.jira.repository import JiraProjectRepository
+from dataextractor.infrastructure.state import JsonMetadataCache
+from dataextractor.infrastructure.windowed import windowed_map
+
+# Only what IssueInfo needs; the full field set is many times larger
+SEARCH_FIELDS = (
+    "summary",
+    "issuetype",
+    "status",
+    "priority",
+    "assignee",
+    "reporter",
+    "created",
+    "updated",
+    "resolutiondate",
+    "labels",
+    "project",
+)
+
+# Offsets only stay put while the result order does: issues created during
+# the run sort after everything already counted in `total`, and issues
+# updated during the run keep their place (`updated >=` still matches).
+ORDER_BY = "ORDER BY created ASC, key ASC"
+
+JQL_DATE_FORMAT = "%Y/%m/%d %H:%M"  # JQL compares dates to the minute
+
+
+def jql_quote(value: str) -> str:
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+class JiraIssueRepository(IssueRepository):
+    """Issues through the REST search API, paged by startAt offset.
+
+    The first page reports `total`, so every other offset is known up
+    front and up to `concurrency` pages are fetched at once. Rides on the
+    project repository's pooled session and rate scheduler.
+    """
+
+    def __init__(self, projects: JiraProjectRepository):
+        self.projects = projects
+        self._unresolved_fields: list[str] = []
+
+    def iter_issues(
+        self, projects: Sequence[ProjectInfo], since: Mapping[str, str] | None = None
+    ) -> Iterator[IssueInfo]:
+        if not projects:
+            return
+        custom_fields = self.custom_fields
+        jql = f"{self.project_filter(projects, since or {})} {ORDER_BY}"
+        for issue in self.search(jql, fields=(*SEARCH_FIELDS, *custom_fields.values())):
+            yield self._to_issue_info(issue, custom_fields)
+
+    @cached_property
+    def custom_fields(self) -> dict[str, str]:
+        """Configured extra fields: name as configured -> field id.
+
+        Names are matched case-insensitively against field names and ids
+        from /field, which is cached on disk for `field_cache_ttl_hours`
+        together with the names that lookup could not resolve, so warm runs
+        make no metadata request. Unresolved names are skipped and listed
+        by `get_unresolved_fields`.
+        """
+        names = list(dict.fromkeys(self.projects.settings.jira.fields))
+        if not names:
+            return {}
+        cache = self._field_cache()
+        cached = cache.load() or {}
+        catalog = cached.get("catalog")
+        unresolved = set(cached.get("unresolved", ()))
+        if not isinstance(catalog, dict) or any(
+            n.casefold() not in catalog and n.casefold() not in unresolved for n in names
+        ):
+            # Cold, stale, or a name configured since the cache was written
+            catalog = self._field_catalog()
+            unresolved = {n.casefold() for n in names if n.casefold() not in catalog}
+            cache.save({"catalog": catalog, "unresolved": sorted(unresolved)})
+        self._unresolved_fields = [n for n in names if n.casefold() not in catalog]
+        return {n: catalog[n.casefold()] for n in names if n.casefold() in catalog}
+
+    def get_unresolved_fields(self) -> list[str]:
+        return list(self._unresolved_fields)
+
+    def _field_cache(self) -> JsonMetadataCache:
+        jira = self.projects.settings.jira
+        return JsonMetadataCache(
+            resolve_project_path(jira.state_dir or STATE_DIR_NAME),
+            jira.url,
+            "fields",
+            ttl=jira.field_cache_ttl_hours * 3600,
+        )
+
+    def _field_catalog(self) -> dict[str, str]:
+        catalog: dict[str, str] = {}
+        for item in self.projects.request("GET", "/field"):
+            catalog[item["id"].casefold()] = item["id"]
+            # Field names are not unique; the first (system before custom) wins
+            catalog.setdefault(item["name"].casefold(), item["id"])
+        return catalog
+
+    def project_filter(self, projects: Sequence[ProjectInfo], since: Mapping[str, str]) -> str:
+        """JQL matching `projects`, each from its `since` time when it has one.
+
+        Projects sharing a lower bound share a clause, so one search covers
+        them all however many there are.
+        """
+        bounds: dict[str | None, list[str]] = defaultdict(list)
+        for project in projects:
+            key = project.path_with_namespace
+            bounds[since.get(key)].append(key)
+
+        clauses = []
+        for bound, keys in bounds.items():
+            clause = f"project in ({', '.join(jql_quote(k) for k in keys)})"
+            if bound is not None:
+                clause = f"({clause} AND updated >= {jql_quote(self._jql_date(bound))})"
+            clauses.append(clause)
+        return clauses[0] if len(clauses) == 1 else f"({' OR '.join(clauses)})"
+
+    def _jql_date(self, timestamp: str) -> str:
+        # Truncating to the minute only widens the range
+        moment = datetime.fromisoformat(timestamp).astimezone(self.projects.time_zone)
+        return moment.strftime(JQL_DATE_FORMAT)
+
+    def search(self, jql: str, fields: Sequence[str] = SEARCH_FIELDS, expand: str = "") -> Iterator[dict]:
+        """Raw issues matching `jql`, in result order."""
+        query = {"jql": jql, "fields": list(fields)}
+        if expand:
+            query["expand"] = [expand]
+        first = self._search_page(query, 0)
+        yield from first["issues"]
+
+        # Jira silently caps maxResults, so page by what it actually returned
+        page_size = first.get("maxResults") or len(first["issues"])
+        if not first["issues"] or page_size <= 0:
+            return
+        offsets = iter(range(page_size, first["total"], page_size))
+
+        pages = windowed_map(
+            lambda offset: self._search_page(query, offset), offsets, self.projects.settings.jira.concurrency
+        )
+        for page in pages:
+            yield from page["issues"]
+
+    def _search_page(self, query: dict, start_at: int) -> dict:
+        # POST keeps long JQL (many project keys) out of the URL
+        return self.projects.request(
+            "POST",
+            "/search",
+            json={**query, "startAt": start_at, "maxResults": self.projects.settings.jira.page_size},
+        )
+
+    def _to_issue_info(self, issue: dict, custom_fields: Mapping[str, str] | None = None) -> IssueInfo:
+        fields = issue["fields"]
+        return IssueInfo(
+            id=int(issue["id"]),
+            key=issue["key"],
+            project_key=fields["project"]["key"],
+            summary=fields.get("summary") or "",
+            issue_type=_name(fields.get("issuetype")) or "",
+            status=_name(fields.get("status")) or "",
+            created=fields["created"],
+            updated=fields["updated"],
+            priority=_name(fields.get("priority")),
+            assignee=user_key(fields.get("assignee")),
+            reporter=user_key(fields.get("reporter")),
+            resolved=fields.get("resolutiondate"),
+            labels=tuple(fields.get("labels") or ()),
+            custom_fields={n: field_value(fields.get(i)) for n, i in custom_fields.items()} if custom_fields else None,
+        )
+
+
+def field_value(value: Any) -> Any:
+    """A custom field value without its REST decorations (self links, ids)."""
+    if isinstance(value, list):
+        return [field_value(v) for v in value]
+    if isinstance(value, dict):
+        for key in ("value", "name", "displayName", "key"):
+            if key in value:
+                return value[key]
+    return value
+
+
+def _name(value: dict | None) -> str | None:
+    return value.get("name") if value else None
+
+
+def user_key(value: dict | None) -> str | None:
+    # Server and Data Center identify users by name, Cloud by accountId
+    if not value:
+        return None
+    return value.get("name") or value.get("accountId")
@@ -0,0 +1,112 @@
+from collections import deque
+from collections.abc import Iterator, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from dataextractor.core.entities import ProjectInfo, TransitionInfo, WorklogInfo
+from dataextractor.core.interfaces import IssueLogRepository
+from dataextractor.infrastructure.jira.issues import ORDER_BY, JiraIssueRepository, user_key
+
+# The search only needs to carry the embedded histories
+LOG_FIELDS = ("worklog",)
+HISTORY_PAGE_SIZE = 100
+
+
+class JiraIssueLogRepository(IssueLogRepository):
+    """Status transitions and worklogs, read in bulk from issue searches.
+
+    Search pages are requested with `expand=changelog` and the `worklog`
+    field, which covers most issues in the same round trips as the issue
+    listing. Jira truncates long embedded histories (the changelog to 100
+    entries on Cloud, worklogs to 20), so those issues have the rest paged
+    through the per-issue endpoints on up to `concurrency` workers while
+    the search carries on. At most that many histories are held at once.
+    """
+
+    def __init__(self, issues: JiraIssueRepository):
+        self.issues = issues
+
+    @property
+    def concurrency(self) -> int:
+        return max(self.issues.projects.settings.jira.concurrency, 1)
+
+    def iter_logs(
+        self, projects: Sequence[ProjectInfo], since: Mapping[str, str] | None = None
+    ) -> Iterator[TransitionInfo | WorklogInfo]:
+        if not projects:
+            return
+        jql = f"{self.issues.project_filter(projects, since or {})} {ORDER_BY}"
+        pending: deque[Future] = deque()
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        try:
+            for issue in self.issues.search(jql, fields=LOG_FIELDS, expand="changelog"):
+                changelog = issue.get("changelog") or {}
+                histories = changelog.get("histories") or []
+                if changelog.get("total", len(histories)) > len(histories):
+                    pending.append(executor.submit(self._all_transitions, issue))
+                else:
+                    yield from self._transitions(issue, histories)
+
+                worklog = (issue.get("fields") or {}).get("worklog") or {}
+                worklogs = worklog.get("worklogs") or []
+                if worklog.get("total", len(worklogs)) > len(worklogs):
+                    pending.append(executor.submit(self._all_worklogs, issue))
+                else:
+                    yield from self._worklogs(issue, worklogs)
+
+                # Hand over finished histories; wait once too many are queued
+                while pending and (pending[0].done() or len(pending) > self.concurrency):
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _all_transitions(self, issue: dict) -> list[TransitionInfo]:
+        histories = self._page(f"/issue/{issue['key']}/changelog", "values")
+        return list(self._transitions(issue, histories))
+
+    def _all_worklogs(self, issue: dict) -> list[WorklogInfo]:
+        worklogs = self._page(f"/issue/{issue['key']}/worklog", "worklogs")
+        return list(self._worklogs(issue, worklogs))
+
+    def _page(self, path: str, items: str) -> list[dict]:
+        """Every entry of a per-issue startAt-paginated list."""
+        entries: list[dict] = []
+        while True:
+            page = self.issues.projects.request(
+                "GET", path, params={"startAt": len(entries), "maxResults": HISTORY_PAGE_SIZE}
+            )
+            batch = page.get(items) or []
+            entries.extend(batch)
+            if not batch or len(entries) >= page.get("total", 0):
+                return entries
+
+    @staticmethod
+    def _transitions(issue: dict, histories: list[dict]) -> Iterator[TransitionInfo]:
+        for history in histories:
+            for item in history.get("items") or ():
+                if item.get("field") != "status":
+                    continue
+                yield TransitionInfo(
+                    issue_id=int(issue["id"]),
+                    issue_key=issue["key"],
+                    history_id=int(history["id"]),
+                    created=history["created"],
+                    from_status=item.get("fromString"),
+                    to_status=item.get("toString"),
+                    author=user_key(history.get("author")),
+                )
+
+    @staticmethod
+    def _worklogs(issue: dict, worklogs: list[dict]) -> Iterator[WorklogInfo]:
+        for worklog in worklogs:
+            yield WorklogInfo(
+                id=int(worklog["id"]),
+                issue_id=int(issue["id"]),
+                issue_key=issue["key"],
+                started=worklog["started"],
+                time_spent_seconds=int(worklog.get("timeSpentSeconds") or 0),
+                created=worklog["created"],
+                updated=worklog["updated"],
+                author=user_key(worklog.get("author")),
+            )
@@ -1,13 +1,83 @@
+from functools import cached_property
+from typing import Any
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import requests
+
 from dataextractor.config import Settings
 from dataextractor.core.entities import ProjectInfo
 from dataextractor.core.interfaces import ProjectRepository
+from dataextractor.infrastructure.http import (
+    ApiHTTPAdapter,
+    RequestScheduler,
+    shared_scheduler,
+    shared_session,
+    token_identity,
+)
+
+API_PATH = "/rest/api/2"
 
 
 class JiraProjectRepository(ProjectRepository):
-    """Placeholder for Jira integration - to be implemented."""
+    """Jira projects through the REST API, one ProjectInfo per project.
 
-    def __init__(self, settings: Settings):
+    The project key takes the place of the namespaced path; Jira has no
+    per-project access level to report.
+    """
+
+    DEFAULT_TIMEOUT = 30  # seconds
+
+    def __init__(self, settings: Settings, scheduler: RequestScheduler | None = None):
         self.settings = settings
+        self.scheduler = scheduler or shared_scheduler(settings.jira.url)
+
+    @property
+    def base_url(self) -> str:
+        return self.settings.jira.url.rstrip("/")
+
+    @property
+    def session(self) -> requests.Session:
+        jira = self.settings.jira
+        session = shared_session(
+            jira.url, token_identity(jira.token), self._create_adapter, jira.concurrency, id(self.scheduler)
+        )
+        # Personal access tokens (Server/Data Center) are sent as bearer tokens
+        session.headers["Authorization"] = f"Bearer {jira.token}"
+        return session
+
+    def _create_adapter(self) -> ApiHTTPAdapter:
+        jira = self.settings.jira
+        return ApiHTTPAdapter(
+            identity=token_identity(jira.token),
+            scheduler=self.scheduler,
+            pool_connections=1,
+            pool_maxsize=max(jira.concurrency, 1),
+        )
+
+    def request(self, method: str, path: str, **kwargs) -> Any:
+        """Decoded JSON body of an API call; raises on HTTP errors."""
+        response = self.session.request(
+            method, f"{self.base_url}{API_PATH}{path}", timeout=self.DEFAULT_TIMEOUT, **kwargs
+        )
+        response.raise_for_status()
+        return response.json()
+
+    @cached_property
+    def time_zone(self) -> ZoneInfo:
+        """Zone JQL dates are read in: the token user's profile setting."""
+        try:
+            return ZoneInfo(self.request("GET", "/myself").get("timeZone") or "UTC")
+        except ZoneInfoNotFoundError:
+            return ZoneInfo("UTC")
 
     def get_all_projects(self) -> list[ProjectInfo]:
-        raise NotImplementedError("Jira integration not yet implemented")
+        # /project is not paginated: it returns every project the token can browse
+        return [self._to_project_info(p) for p in self.request("GET", "/project")]
+
+    def _to_project_info(self, project: dict) -> ProjectInfo:
+        return ProjectInfo(
+            id=int(project["id"]),
+            name=project["name"],
+            path_with_namespace=project["key"],
+            http_url=f"{self.base_url}/browse/{project['key']}",
+        )
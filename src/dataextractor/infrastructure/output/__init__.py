@@ -0,0 +1,18 @@
+from dataextractor.infrastructure.output.columnar import ColumnarSink
+from dataextractor.infrastructure.output.console import ConsoleSink
+from dataextractor.infrastructure.output.database import DatabaseSink, PostgresSink, SqliteSink
+from dataextractor.infrastructure.output.factory import create_sink, writes_rows_to_stdout
+from dataextractor.infrastructure.output.ndjson import NdjsonSink
+from dataextractor.infrastructure.output.shared import SharedSink
+
+__all__ = [
+    "ColumnarSink",
+    "ConsoleSink",
+    "DatabaseSink",
+    "NdjsonSink",
+    "PostgresSink",
+    "SharedSink",
+    "SqliteSink",
+    "create_sink",
+    "writes_rows_to_stdout",
+]
@@ -0,0 +1,136 @@
+import os
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from dataextractor.core.entities import CommitInfo, IssueInfo, ProjectInfo, TransitionInfo, WorklogInfo
+from dataextractor.core.interfaces import RowSink
+from dataextractor.infrastructure.output.schema import Column, TableSchema, schema_for
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional: install with the arrow extra
+    pa = pq = None
+
+# Row properties exported as extra text columns. path_with_namespace is
+# unique per project, but its namespace repeats across a whole group.
+DERIVED_COLUMNS: dict[type, tuple[str, ...]] = {
+    ProjectInfo: ("namespace",),
+}
+
+# Low-cardinality columns, stored as a dictionary plus small integer indices
+DICTIONARY_COLUMNS: dict[type, tuple[str, ...]] = {
+    ProjectInfo: ("access_level", "default_branch", "namespace", "source"),
+    CommitInfo: ("project_path", "author_name", "author_email", "committer_name", "committer_email", "source"),
+    IssueInfo: ("project_key", "issue_type", "status", "priority", "assignee", "reporter"),
+    TransitionInfo: ("from_status", "to_status", "author"),
+    WorklogInfo: ("author",),
+}
+
+# File extension per format; Arrow uses the IPC stream format because IPC
+# files cannot hold a different dictionary in each batch.
+EXTENSIONS = {"parquet": ".parquet", "arrow": ".arrows"}
+
+
+def columnar_schema(row_type: type) -> TableSchema:
+    """The row type's table schema followed by its derived columns."""
+    schema = schema_for(row_type)
+    derived = tuple(Column(name, "text") for name in DERIVED_COLUMNS.get(row_type, ()))
+    return TableSchema(schema.columns + derived, schema.primary_key)
+
+
+def arrow_schema(row_type: type):
+    """The fixed Arrow schema of a row dataclass."""
+    types = {"integer": pa.int64(), "text": pa.string(), "json": pa.string()}
+    dictionary = DICTIONARY_COLUMNS.get(row_type, ())
+    return pa.schema([
+        (c.name, pa.dictionary(pa.int32(), types[c.kind]) if c.name in dictionary else types[c.kind])
+        for c in columnar_schema(row_type).columns
+    ])
+
+
+class ColumnarSink(RowSink):
+    """Writes each table to `<directory>/<table>.parquet` or `.arrows`.
+
+    Rows are buffered and converted to one Arrow record batch (a Parquet
+    row group) every `batch_size` rows, so memory stays bounded by the
+    batch size rather than the extraction. Files are written under a
+    temporary name and only replace the previous export once complete.
+    """
+
+    DEFAULT_BATCH_SIZE = 50_000
+
+    def __init__(self, directory: str | Path, file_format: str = "parquet", batch_size: int = DEFAULT_BATCH_SIZE):
+        if pa is None:
+            raise ImportError("The parquet and arrow outputs need pyarrow: install the 'arrow' extra")
+        if file_format not in EXTENSIONS:
+            raise ValueError(f"Unsupported columnar format: {file_format}")
+        self.directory = Path(directory)
+        self.file_format = file_format
+        self.batch_size = batch_size
+        self._buffers: dict[str, list[tuple]] = {}
+        self._schemas: dict[str, TableSchema] = {}
+        self._arrow_schemas: dict[str, Any] = {}
+        self._writers: dict[str, Any] = {}
+
+    def path(self, table: str) -> Path:
+        return self.directory / f"{table}{EXTENSIONS[self.file_format]}"
+
+    def write(self, table: str, rows: Sequence[Any]) -> None:
+        if not rows:
+            return
+        if table not in self._writers:
+            self._open(table, type(rows[0]))
+        schema = self._schemas[table]
+        buffer = self._buffers[table]
+        buffer.extend(schema.values(r) for r in rows)
+        if len(buffer) >= self.batch_size:
+            self._flush(table)
+
+    def close(self) -> None:
+        for table in list(self._writers):
+            self._flush(table)
+            self._writers.pop(table).close()
+            os.replace(self._partial_path(table), self.path(table))
+
+    def __exit__(self, *exc_info) -> None:
+        if exc_info[0] is None:
+            self.close()
+            return
+        # Keep the last complete export rather than a truncated one
+        for table in list(self._writers):
+            self._writers.pop(table).close()
+            self._partial_path(table).unlink(missing_ok=True)
+
+    def _open(self, table: str, row_type: type) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        schema = arrow_schema(row_type)
+        partial = self._partial_path(table)
+        if self.file_format == "parquet":
+            writer = pq.ParquetWriter(
+                partial,
+                schema,
+                compression="zstd",
+                use_dictionary=list(DICTIONARY_COLUMNS.get(row_type, ())),
+            )
+        else:
+            writer = pa.ipc.new_stream(partial, schema)
+        self._writers[table] = writer
+        self._schemas[table] = columnar_schema(row_type)
+        self._arrow_schemas[table] = schema
+        self._buffers[table] = []
+
+    def _flush(self, table: str) -> None:
+        rows = self._buffers[table]
+        if not rows:
+            return
+        names = self._schemas[table].names
+        for start in range(0, len(rows), self.batch_size):
+            columns = dict(zip(names, zip(*rows[start:start + self.batch_size])))
+            batch = pa.RecordBatch.from_pydict(columns, schema=self._arrow_schemas[table])
+            self._writers[table].write_batch(batch)
+        self._buffers[table] = []
+
+    def _partial_path(self, table: str) -> Path:
+        return self.path(table).with_name(self.path(table).name + ".partial")
@@ -0,0 +1,23 @@
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from dataextractor.core.interfaces import RowSink
+
+
+def _repr_row(table: str, row: Any) -> str:  # pylint: disable=unused-argument
+    return repr(row)
+
+
+class ConsoleSink(RowSink):
+    """Prints one line per row; the fallback when no output is configured.
+
+    The formatter gets the table as well as the row, since one entity type
+    can land in several tables (git and Jira projects are both ProjectInfo).
+    """
+
+    def __init__(self, formatter: Callable[[str, Any], str] | None = None):
+        self.formatter = formatter or _repr_row
+
+    def write(self, table: str, rows: Sequence[Any]) -> None:
+        # One print per batch keeps the write count independent of row count
+        print("\n".join(self.formatter(table, row) for row in rows))
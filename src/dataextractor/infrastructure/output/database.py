@@ -0,0 +1,284 @@
+import sqlite3
+from abc import abstractmethod
+from collections.abc import Collection, Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+from dataextractor.core.interfaces import RowSink, SyncResult
+from dataextractor.infrastructure.output.schema import TableSchema, content_hash, quote_identifier, schema_for
+
+try:
+    import psycopg
+except ImportError:  # optional: install with the postgres extra
+    psycopg = None
+
+# Extra column holding each row's content hash, next to the dataclass fields
+HASH_COLUMN = "row_hash"
+
+
+class DatabaseSink(RowSink):
+    """Buffers rows per table and writes each batch in one transaction.
+
+    Tables are created on first use from the row dataclass, and every
+    batch is an upsert on the row type's natural key, so re-running an
+    extraction refreshes rows instead of failing on duplicates.
+
+    Each row is stored with a hash of its content. Upserts leave rows
+    whose hash is unchanged alone, and `sync` diffs a complete listing
+    against the stored hashes so only new, changed and vanished rows are
+    written at all.
+    """
+
+    DEFAULT_BATCH_SIZE = 10_000
+
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.batch_size = batch_size
+        self._buffers: dict[str, list[tuple]] = {}
+        self._schemas: dict[str, TableSchema] = {}
+
+    def write(self, table: str, rows: Sequence[Any]) -> None:
+        if not rows:
+            return
+        schema = self._schema(table, type(rows[0]))
+        self._buffer(table, [_with_hash(schema.values(r)) for r in rows])
+
+    def sync(
+        self,
+        table: str,
+        rows: Iterable[Any],
+        prune: bool = True,
+        sources: Collection[str] | None = None,
+    ) -> SyncResult:
+        """Upsert changed rows and, with `prune`, delete the ones missing from `rows`.
+
+        Only stored rows whose `source` is in `sources` are candidates for
+        deletion when it is given, so one instance's listing never removes
+        another's rows. An empty listing leaves the table alone: that is far
+        more likely a failed or filtered extraction than every row having
+        gone.
+        """
+        result = SyncResult()
+        schema = None
+        known: dict[tuple, str] = {}
+        for row in rows:
+            if schema is None:
+                schema = self._schema(table, type(row))
+                if not schema.primary_key:
+                    raise ValueError(f"Cannot sync {table}: {type(row).__name__} has no primary key")
+                known = self._load_hashes(table, schema)
+            values = _with_hash(schema.values(row))
+            previous = known.pop(schema.key(values), None)
+            if previous == values[-1]:
+                result.unchanged += 1
+                continue
+            if previous is None:
+                result.inserted += 1
+            else:
+                result.updated += 1
+            self._buffer(table, [values])
+
+        if known and sources is not None:
+            if "source" not in schema.primary_key:
+                raise ValueError(f"Cannot sync {table} by source: it is not part of the primary key")
+            position = schema.primary_key.index("source")
+            known = {k: h for k, h in known.items() if k[position] in sources}
+        if known and prune:
+            # Whatever is left in the index was not in this listing
+            self.flush(table)
+            self._delete_rows(table, schema, list(known))
+            result.deleted = len(known)
+        return result
+
+    def flush(self, table: str | None = None) -> None:
+        for name in [table] if table else list(self._buffers):
+            rows = self._buffers.pop(name, None)
+            if rows:
+                schema = self._schemas[name]
+                if schema.primary_key:
+                    # An upsert may touch each key once per statement; last one wins
+                    rows = list({schema.key(r): r for r in rows}.values())
+                self._write_batch(name, schema, rows)
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._close()
+
+    def _schema(self, table: str, row_type: type) -> TableSchema:
+        schema = self._schemas.get(table)
+        if schema is None:
+            schema = schema_for(row_type)
+            self._ensure_table(table, schema)
+            self._schemas[table] = schema
+        return schema
+
+    def _buffer(self, table: str, rows: list[tuple]) -> None:
+        buffer = self._buffers.setdefault(table, [])
+        buffer.extend(rows)
+        if len(buffer) >= self.batch_size:
+            self.flush(table)
+
+    @abstractmethod
+    def _ensure_table(self, table: str, schema: TableSchema) -> None:
+        pass
+
+    @abstractmethod
+    def _load_hashes(self, table: str, schema: TableSchema) -> dict[tuple, str]:
+        """Stored content hash of every row, by primary key."""
+
+    @abstractmethod
+    def _write_batch(self, table: str, schema: TableSchema, rows: list[tuple]) -> None:
+        pass
+
+    @abstractmethod
+    def _delete_rows(self, table: str, schema: TableSchema, keys: list[tuple]) -> None:
+        pass
+
+    @abstractmethod
+    def _close(self) -> None:
+        pass
+
+
+def _with_hash(values: tuple) -> tuple:
+    return values + (content_hash(values),)
+
+
+def _create_table_sql(table: str, schema: TableSchema, types: dict[str, str]) -> str:
+    columns = [f"{quote_identifier(c.name)} {types[c.kind]}" for c in schema.columns]
+    columns.append(f"{quote_identifier(HASH_COLUMN)} {types['text']}")
+    if schema.primary_key:
+        columns.append(f"PRIMARY KEY ({', '.join(map(quote_identifier, schema.primary_key))})")
+    return f"CREATE TABLE IF NOT EXISTS {quote_identifier(table)} ({', '.join(columns)})"
+
+
+def _column_list(schema: TableSchema) -> str:
+    return ", ".join(map(quote_identifier, [*schema.names, HASH_COLUMN]))
+
+
+def _select_hashes_sql(table: str, schema: TableSchema) -> str:
+    columns = ", ".join(map(quote_identifier, [*schema.primary_key, HASH_COLUMN]))
+    return f"SELECT {columns} FROM {quote_identifier(table)}"
+
+
+def _delete_sql(table: str, schema: TableSchema, placeholder: str) -> str:
+    condition = " AND ".join(f"{quote_identifier(n)} = {placeholder}" for n in schema.primary_key)
+    return f"DELETE FROM {quote_identifier(table)} WHERE {condition}"
+
+
+def _upsert_clause(table: str, schema: TableSchema, is_distinct: str) -> str:
+    if not schema.primary_key:
+        return ""
+    updates = [
+        f"{quote_identifier(n)} = excluded.{quote_identifier(n)}"
+        for n in [*schema.names, HASH_COLUMN]
+        if n not in schema.primary_key
+    ]
+    conflict = ", ".join(map(quote_identifier, schema.primary_key))
+    row_hash = quote_identifier(HASH_COLUMN)
+    return (
+        f" ON CONFLICT ({conflict}) DO UPDATE SET {', '.join(updates)}"
+        # Unchanged rows are skipped, so they cost no row or index write
+        f" WHERE {quote_identifier(table)}.{row_hash} {is_distinct} excluded.{row_hash}"
+    )
+
+
+class SqliteSink(DatabaseSink):
+    TYPES = {"integer": "INTEGER", "text": "TEXT", "json": "TEXT"}
+    # IS DISTINCT FROM needs SQLite 3.39; IS NOT is the same null-safe test
+    IS_DISTINCT = "IS NOT"
+
+    def __init__(self, path: str | Path, batch_size: int = DatabaseSink.DEFAULT_BATCH_SIZE):
+        super().__init__(batch_size)
+        # Transactions are explicit, one per batch. Writers may take turns
+        # from different threads (see SharedSink), never at the same time.
+        self.connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        # WAL with NORMAL sync is durable at commit boundaries and avoids an
+        # fsync per page write during bulk loads.
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+
+    def _ensure_table(self, table: str, schema: TableSchema) -> None:
+        self.connection.execute(_create_table_sql(table, schema, self.TYPES))
+
+    def _load_hashes(self, table: str, schema: TableSchema) -> dict[tuple, str]:
+        rows = self.connection.execute(_select_hashes_sql(table, schema))
+        return {tuple(row[:-1]): row[-1] for row in rows}
+
+    def _write_batch(self, table: str, schema: TableSchema, rows: list[tuple]) -> None:
+        placeholders = ", ".join("?" for _ in rows[0])
+        sql = (
+            f"INSERT INTO {quote_identifier(table)} ({_column_list(schema)}) VALUES ({placeholders})"
+            + _upsert_clause(table, schema, self.IS_DISTINCT)
+        )
+        self._in_transaction(sql, rows)
+
+    def _delete_rows(self, table: str, schema: TableSchema, keys: list[tuple]) -> None:
+        self._in_transaction(_delete_sql(table, schema, "?"), keys)
+
+    def _in_transaction(self, sql: str, rows: list[tuple]) -> None:
+        self.connection.execute("BEGIN")
+        try:
+            self.connection.executemany(sql, rows)
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+        self.connection.execute("COMMIT")
+
+    def _close(self) -> None:
+        self.connection.close()
+
+
+class PostgresSink(DatabaseSink):
+    """Bulk loads with COPY into a temp staging table, then one upsert.
+
+    COPY is the fastest way into Postgres but cannot resolve conflicts,
+    so each batch lands in a session-local temp table (which skips the
+    WAL) and is merged into the target with a single statement.
+    """
+
+    TYPES = {"integer": "BIGINT", "text": "TEXT", "json": "JSONB"}
+    IS_DISTINCT = "IS DISTINCT FROM"
+
+    def __init__(self, db_url: str, batch_size: int = DatabaseSink.DEFAULT_BATCH_SIZE, connection=None):
+        super().__init__(batch_size)
+        if connection is None:
+            if psycopg is None:
+                raise ImportError("The postgres output needs psycopg: install the 'postgres' extra")
+            # Autocommit, so each transaction() block below is a real transaction
+            connection = psycopg.connect(db_url, autocommit=True)
+        self.connection = connection
+
+    def _ensure_table(self, table: str, schema: TableSchema) -> None:
+        with self.connection.transaction():
+            self.connection.execute(_create_table_sql(table, schema, self.TYPES))
+
+    def _load_hashes(self, table: str, schema: TableSchema) -> dict[tuple, str]:
+        with self.connection.transaction():
+            rows = self.connection.execute(_select_hashes_sql(table, schema)).fetchall()
+        return {tuple(row[:-1]): row[-1] for row in rows}
+
+    def _write_batch(self, table: str, schema: TableSchema, rows: list[tuple]) -> None:
+        target = quote_identifier(table)
+        staging = quote_identifier(f"_staging_{table}")
+        columns = _column_list(schema)
+        with self.connection.transaction():
+            self.connection.execute(
+                f"CREATE TEMP TABLE IF NOT EXISTS {staging} (LIKE {target}) ON COMMIT DELETE ROWS"
+            )
+            with self.connection.cursor() as cursor:
+                with cursor.copy(f"COPY {staging} ({columns}) FROM STDIN") as copy:
+                    for row in rows:
+                        copy.write_row(row)
+            self.connection.execute(
+                f"INSERT INTO {target} ({columns}) SELECT {columns} FROM {staging}"
+                + _upsert_clause(table, schema, self.IS_DISTINCT)
+            )
+
+    def _delete_rows(self, table: str, schema: TableSchema, keys: list[tuple]) -> None:
+        with self.connection.transaction():
+            with self.connection.cursor() as cursor:
+                cursor.executemany(_delete_sql(table, schema, "%s"), keys)
+
+    def _close(self) -> None:
+        self.connection.close()
@@ -0,0 +1,34 @@
+from collections.abc import Callable
+from typing import Any
+
+from dataextractor.config.env import resolve_project_path
+from dataextractor.config.settings import OutputSettings
+from dataextractor.core.interfaces import RowSink
+from dataextractor.infrastructure.output.columnar import ColumnarSink
+from dataextractor.infrastructure.output.console import ConsoleSink
+from dataextractor.infrastructure.output.database import PostgresSink, SqliteSink
+from dataextractor.infrastructure.output.ndjson import NdjsonSink
+
+
+def create_sink(outputs: OutputSettings, formatter: Callable[[str, Any], str] | None = None) -> RowSink:
+    """The sink selected by `outputs.type`; console output when unset."""
+    output_type = outputs.type.lower()
+    if output_type in ("", "console"):
+        return ConsoleSink(formatter)
+    if output_type == "sqlite":
+        path = outputs.db_url.removeprefix("sqlite:///")
+        return SqliteSink(path if path == ":memory:" else resolve_project_path(path))
+    if output_type in ("postgres", "postgresql"):
+        return PostgresSink(outputs.db_url)
+    if output_type == "ndjson":
+        path = None if writes_rows_to_stdout(outputs) else resolve_project_path(outputs.db_url)
+        return NdjsonSink(path, outputs.compression.lower())
+    if output_type in ("parquet", "arrow"):
+        # db_url names the directory the files are written to
+        return ColumnarSink(resolve_project_path(outputs.db_url or "output"), output_type)
+    raise ValueError(f"Unsupported output type: {outputs.type}")
+
+
+def writes_rows_to_stdout(outputs: OutputSettings) -> bool:
+    """Whether rows go to stdout as data, so status messages must not."""
+    return outputs.type.lower() == "ndjson" and outputs.db_url in ("", "-")
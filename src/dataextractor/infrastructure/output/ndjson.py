@@ -0,0 +1,78 @@
+import gzip
+import json
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from dataextractor.core.interfaces import RowSink
+from dataextractor.infrastructure.output.schema import schema_for
+
+try:
+    import zstandard
+except ImportError:  # optional: install with the zstd extra
+    zstandard = None
+
+COMPRESSIONS = ("", "gzip", "zstd")
+
+
+class NdjsonSink(RowSink):
+    """One JSON object per row, streamed to a file or stdout.
+
+    Each `write` encodes the whole batch and hands it over as a single
+    write into a large buffer, so output costs a syscall per buffer (or
+    per batch on stdout, which is flushed as batches arrive for pipes)
+    rather than one per row. Every object carries the row's table under
+    TABLE_KEY, so one stream can hold several kinds of row (projects and
+    commits, or Jira issues and their logs) and still be told apart.
+    """
+
+    TABLE_KEY = "table"
+
+    BUFFER_SIZE = 1 << 20
+
+    def __init__(self, path: str | Path | None = None, compression: str = ""):
+        compression = "" if compression == "none" else compression
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unsupported compression: {compression}")
+        if compression == "zstd" and zstandard is None:
+            raise ImportError("zstd compression needs zstandard: install the 'zstd' extra")
+        self.to_stdout = path is None
+        self._file = self._open(path)
+        self._stream: BinaryIO = self._compressed(self._file, compression)
+        self._encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+    def write(self, table: str, rows: Sequence[Any]) -> None:
+        if not rows:
+            return
+        names = schema_for(type(rows[0])).names
+        lines = [self._encode({self.TABLE_KEY: table, **{n: getattr(row, n) for n in names}}) for row in rows]
+        self._stream.write(("\n".join(lines) + "\n").encode("utf-8"))
+        if self.to_stdout:
+            # A consumer on the other end of a pipe sees every batch promptly
+            self._stream.flush()
+
+    def close(self) -> None:
+        try:
+            if self._stream is not self._file:
+                self._stream.close()
+        finally:
+            self._file.close()
+
+    def _open(self, path: str | Path | None) -> BinaryIO:
+        # The sink owns the file until close(), so no `with` here
+        # pylint: disable=consider-using-with
+        if path is None:
+            # Text printed before this sink may still sit in sys.stdout's buffer
+            sys.stdout.flush()
+            return open(sys.stdout.fileno(), "wb", buffering=self.BUFFER_SIZE, closefd=False)
+        return open(path, "wb", buffering=self.BUFFER_SIZE)
+
+    @staticmethod
+    def _compressed(file: BinaryIO, compression: str) -> BinaryIO:
+        if compression == "gzip":
+            # Level 6 compresses nearly as well as the default 9 at a fraction of the CPU
+            return gzip.GzipFile(fileobj=file, mode="wb", compresslevel=6)
+        if compression == "zstd":
+            return zstandard.ZstdCompressor(level=3).stream_writer(file, closefd=False)
+        return file
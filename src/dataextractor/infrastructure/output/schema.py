@@ -0,0 +1,82 @@
+import hashlib
+import json
+from dataclasses import dataclass, fields
+from functools import cached_property
+from types import NoneType, UnionType
+from typing import Any, Union, get_args, get_origin
+
+from dataextractor.core.entities import CommitInfo, IssueInfo, ProjectInfo, TransitionInfo, WorklogInfo
+
+# Natural keys of the row types that get written to tables
+PRIMARY_KEYS: dict[type, tuple[str, ...]] = {
+    ProjectInfo: ("source", "id"),
+    CommitInfo: ("source", "project_id", "sha"),
+    IssueInfo: ("id",),
+    TransitionInfo: ("issue_id", "history_id"),
+    WorklogInfo: ("id",),
+}
+
+
+@dataclass(frozen=True)
+class Column:
+    name: str
+    kind: str  # "integer", "text" or "json"
+
+
+@dataclass(frozen=True)
+class TableSchema:
+    columns: tuple[Column, ...]
+    primary_key: tuple[str, ...]
+
+    @property
+    def names(self) -> list[str]:
+        return [c.name for c in self.columns]
+
+    @cached_property
+    def key_indices(self) -> tuple[int, ...]:
+        return tuple(self.names.index(n) for n in self.primary_key)
+
+    def key(self, values: tuple) -> tuple:
+        """The primary key part of a `values` tuple."""
+        return tuple(values[i] for i in self.key_indices)
+
+    def values(self, row: Any) -> tuple:
+        """The row as a tuple in column order, with json columns encoded."""
+        return tuple(
+            json.dumps(value) if column.kind == "json" and value is not None else value
+            for column, value in ((c, getattr(row, c.name)) for c in self.columns)
+        )
+
+
+_schemas: dict[type, TableSchema] = {}
+
+
+def schema_for(row_type: type) -> TableSchema:
+    """Columns of a row dataclass, derived from its field annotations."""
+    schema = _schemas.get(row_type)
+    if schema is None:
+        columns = tuple(Column(f.name, _column_kind(f.type)) for f in fields(row_type))
+        schema = TableSchema(columns, PRIMARY_KEYS.get(row_type, ()))
+        _schemas[row_type] = schema
+    return schema
+
+
+def content_hash(values: tuple) -> str:
+    """Digest of a row's column values; stable across runs and processes."""
+    encoded = json.dumps(values, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def quote_identifier(name: str) -> str:
+    # Double quotes are the standard identifier quote in SQLite and Postgres
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _column_kind(annotation: Any) -> str:
+    if get_origin(annotation) in (Union, UnionType):
+        annotation = next(a for a in get_args(annotation) if a is not NoneType)
+    if annotation is int or annotation is bool:
+        return "integer"
+    if annotation in (tuple, list, dict) or get_origin(annotation) in (tuple, list, dict):
+        return "json"
+    return "text"
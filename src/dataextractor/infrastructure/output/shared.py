@@ -0,0 +1,54 @@
+import threading
+from collections.abc import Collection, Iterable, Iterator, Sequence
+from typing import Any
+
+from dataextractor.core.interfaces import RowSink, SyncResult
+
+_END = object()
+
+
+class SharedSink(RowSink):
+    """Lets extractions on several threads write through one sink.
+
+    Calls into the wrapped sink are serialized by a lock, so it still sees
+    one writer at a time. A `sync` holds the lock only while the wrapped
+    sink works on a row, not while the next row is being fetched, so a
+    long listing does not keep the other threads from writing.
+    """
+
+    def __init__(self, sink: RowSink):
+        self.sink = sink
+        self._lock = threading.Lock()
+
+    def write(self, table: str, rows: Sequence[Any]) -> None:
+        with self._lock:
+            self.sink.write(table, rows)
+
+    def sync(
+        self,
+        table: str,
+        rows: Iterable[Any],
+        prune: bool = True,
+        sources: Collection[str] | None = None,
+    ) -> SyncResult:
+        with self._lock:
+            return self.sink.sync(table, self._unlocked(rows), prune, sources)
+
+    def close(self) -> None:
+        with self._lock:
+            self.sink.close()
+
+    def _unlocked(self, rows: Iterable[Any]) -> Iterator[Any]:
+        # Runs inside sync()'s `with`, which owns the lock; it is only
+        # handed back while upstream produces the next row.
+        # pylint: disable=consider-using-with
+        iterator = iter(rows)
+        while True:
+            self._lock.release()
+            try:
+                row = next(iterator, _END)
+            finally:
+                self._lock.acquire()
+            if row is _END:
+                return
+            yield row
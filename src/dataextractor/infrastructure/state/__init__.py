@@ -0,0 +1,7 @@
+from dataextractor.infrastructure.state.json_store import (
+    JsonMetadataCache,
+    JsonProjectStateStore,
+    JsonWatermarkStore,
+)
+
+__all__ = ["JsonMetadataCache", "JsonProjectStateStore", "JsonWatermarkStore"]
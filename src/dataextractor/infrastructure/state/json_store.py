@@ -0,0 +1,93 @@
+import hashlib
+import json
+import os
+import time
+from collections.abc import Sequence
+from dataclasses import asdict
+from pathlib import Path
+
+from dataextractor.core.entities import ProjectInfo, ProjectSnapshot
+from dataextractor.core.interfaces import ProjectStateStore, WatermarkStore
+
+
+def _state_path(directory: str | Path, name: str, instance_url: str, scope: Sequence[str] = ()) -> Path:
+    key = hashlib.sha256("\n".join([instance_url.rstrip("/"), *scope]).encode("utf-8")).hexdigest()[:16]
+    return Path(directory) / f"{name}-{key}.json"
+
+
+def _write_atomically(path: Path, data) -> None:
+    # Write then rename, so an interrupted run never leaves a torn file
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+class JsonProjectStateStore(ProjectStateStore):
+    """Keeps one JSON snapshot per instance URL and listing scope inside `directory`.
+
+    `scope` names what the listing covered (the token, any project
+    allowlist). A snapshot only merges with listings of the same scope: a
+    full catalog is not the answer to an allowlisted run, and an allowlisted
+    snapshot must not stand in for the full catalog.
+    """
+
+    def __init__(self, directory: str | Path, instance_url: str, scope: Sequence[str] = ()):
+        self.path = _state_path(directory, "projects", instance_url, scope)
+
+    def load(self) -> ProjectSnapshot | None:
+        if not self.path.exists():
+            return None
+
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f)
+
+        return ProjectSnapshot(
+            watermark=data.get("watermark"),
+            projects=[ProjectInfo(**p) for p in data.get("projects", [])],
+        )
+
+    def save(self, snapshot: ProjectSnapshot) -> None:
+        data = {
+            "watermark": snapshot.watermark,
+            "projects": [asdict(p) for p in snapshot.projects],
+        }
+        _write_atomically(self.path, data)
+
+
+class JsonWatermarkStore(WatermarkStore):
+    """Keeps one JSON object of watermarks per instance URL and `name`."""
+
+    def __init__(self, directory: str | Path, instance_url: str, name: str):
+        self.path = _state_path(directory, name, instance_url)
+
+    def load(self) -> dict[str, str]:
+        if not self.path.exists():
+            return {}
+        with open(self.path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def save(self, watermarks: dict[str, str]) -> None:
+        _write_atomically(self.path, watermarks)
+
+
+class JsonMetadataCache:
+    """Slow-changing server metadata of one instance, trusted for `ttl` seconds."""
+
+    def __init__(self, directory: str | Path, instance_url: str, name: str, ttl: float):
+        self.path = _state_path(directory, name, instance_url)
+        self.ttl = ttl
+
+    def load(self):
+        """The cached data, or None when missing or older than the TTL."""
+        if not self.path.exists():
+            return None
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f)
+        if time.time() - data.get("fetched_at", 0) > self.ttl:
+            return None
+        return data.get("data")
+
+    def save(self, data) -> None:
+        _write_atomically(self.path, {"fetched_at": time.time(), "data": data})
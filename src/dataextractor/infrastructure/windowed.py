@@ -0,0 +1,50 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any
+
+
+def windowed_map(function: Callable[[Any], Any], items: Iterable[Any], window: int) -> Iterator[Any]:
+    """`function` over `items` on `window` threads, results in item order.
+
+    At most `window` calls are in flight, items are pulled only as slots
+    free up, and each result is yielded as soon as it and those before it
+    are done. Closing the iterator cancels the calls not yet started.
+    """
+    window = max(window, 1)
+    items = iter(items)
+    executor = ThreadPoolExecutor(max_workers=window)
+    try:
+        pending = deque(executor.submit(function, item) for item in islice(items, window))
+        while pending:
+            result = pending.popleft().result()
+            pending.extend(executor.submit(function, item) for item in islice(items, 1))
+            yield result
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+async def async_windowed_map(
+    function: Callable[[Any], Awaitable[Any]], items: Iterable[Any], window: int
+) -> AsyncIterator[Any]:
+    """windowed_map on the running event loop, with tasks in place of threads.
+
+    Callers that may stop early should close it (contextlib.aclosing), so
+    the tasks still in flight are cancelled straight away.
+    """
+    items = iter(items)
+
+    def start(count: int) -> list[asyncio.Task]:
+        return [asyncio.ensure_future(function(item)) for item in islice(items, count)]
+
+    pending = deque(start(max(window, 1)))
+    try:
+        while pending:
+            result = await pending.popleft()
+            pending.extend(start(1))
+            yield result
+    finally:
+        for task in pending:
+            task.cancel()
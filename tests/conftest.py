@@ -0,0 +1,24 @@
+from dataextractor.config.settings import GitSettings, JiraSettings, OutputSettings, Settings
+from dataextractor.core.entities import ProjectInfo
+
+
+def make_project(project_id, **fields):
+    """A GitLab project row; keyword arguments override the defaults."""
+    values = {
+        "name": f"project-{project_id}",
+        "path_with_namespace": f"group/project-{project_id}",
+        "http_url": f"https://gitlab.example.com/group/project-{project_id}.git",
+        "access_level": 30,
+        "last_activity_at": "2024-01-01T00:00:00Z",
+    }
+    values.update(fields)
+    return ProjectInfo(id=project_id, **values)
+
+
+def make_settings(**git_fields):
+    """Settings for the test GitLab instance; keyword arguments go to GitSettings."""
+    return Settings(
+        git=GitSettings(url="https://gitlab.example.com", token="test-token", **git_fields),
+        jira=JiraSettings(),
+        outputs=OutputSettings(),
+    )
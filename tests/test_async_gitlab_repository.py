@@ -0,0 +1,247 @@
+import asyncio
+from unittest.mock import patch
+
+import httpx
+
+from dataextractor.config.settings import GitSettings, Settings
+from dataextractor.core.entities import ProjectInfo
+from dataextractor.infrastructure.blocking import BlockingProjectRepository
+from dataextractor.infrastructure.gitlab import AsyncGitLabProjectRepository
+from dataextractor.infrastructure.gitlab.access_levels import plan_passes
+from dataextractor.infrastructure.http import RequestScheduler
+from tests.conftest import make_settings
+
+
+def _project(project_id, permissions=None):
+    return {
+        "id": project_id,
+        "name": f"project-{project_id}",
+        "path_with_namespace": f"group/project-{project_id}",
+        "http_url_to_repo": f"https://gitlab.example.com/group/project-{project_id}.git",
+        "permissions": permissions or {"project_access": {"access_level": 30}, "group_access": None},
+    }
+
+
+class FakeGitLab:
+    def __init__(self, total, per_page, total_pages_header=True):
+        self.projects = [_project(i) for i in range(1, total + 1)]
+        self.per_page = per_page
+        self.total_pages_header = total_pages_header
+        self.requests = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/user"):
+            # The token check ahead of the listing
+            return httpx.Response(200, json={"id": 1})
+        self.requests.append(request)
+        page = int(request.url.params["page"])
+        start = (page - 1) * self.per_page
+        headers = {}
+        if self.total_pages_header:
+            headers["X-Total-Pages"] = str(-(-len(self.projects) // self.per_page))
+        return httpx.Response(200, json=self.projects[start:start + self.per_page], headers=headers)
+
+
+class TestAsyncGitLabProjectRepository:
+    def _create_settings(self, concurrency=4, per_page=2):
+        return make_settings(concurrency=concurrency, per_page=per_page)
+
+    def _create_repository(self, fake, **kwargs):
+        client = httpx.AsyncClient(
+            base_url="https://gitlab.example.com/api/v4",
+            transport=httpx.MockTransport(fake.handler),
+        )
+        return AsyncGitLabProjectRepository(self._create_settings(**kwargs), client=client)
+
+    def test_client_property_creates_pooled_client(self):
+        repository = AsyncGitLabProjectRepository(self._create_settings(concurrency=8))
+
+        client = repository.client
+
+        assert str(client.base_url) == "https://gitlab.example.com/api/v4/"
+        assert client.headers["PRIVATE-TOKEN"] == "test-token"
+        assert repository.client is client
+        asyncio.run(repository.aclose())
+
+    def test_client_requests_http2_when_enabled(self):
+        settings = self._create_settings()
+        settings.git.http2 = True
+        repository = AsyncGitLabProjectRepository(settings)
+
+        with patch("dataextractor.infrastructure.gitlab.async_repository.httpx.AsyncClient") as client_class:
+            _ = repository.client
+
+        assert client_class.call_args.kwargs["http2"] is True
+
+    def test_get_all_projects_returns_pages_in_order(self):
+        fake = FakeGitLab(total=7, per_page=2)
+        repository = self._create_repository(fake)
+
+        projects = asyncio.run(repository.get_all_projects())
+
+        assert [p.id for p in projects] == [1, 2, 3, 4, 5, 6, 7]
+        assert all(isinstance(p, ProjectInfo) for p in projects)
+        assert len(fake.requests) == 4
+
+    def test_iter_projects_streams_in_order(self):
+        fake = FakeGitLab(total=5, per_page=2)
+        repository = self._create_repository(fake, concurrency=2)
+
+        async def collect():
+            return [p.id async for p in repository.iter_projects()]
+
+        assert asyncio.run(collect()) == [1, 2, 3, 4, 5]
+
+    def test_get_all_projects_sends_membership_and_paging_params(self):
+        fake = FakeGitLab(total=1, per_page=2)
+        repository = self._create_repository(fake)
+
+        asyncio.run(repository.get_all_projects())
+
+        params = fake.requests[0].url.params
+        assert params["membership"] == "true"
+        assert params["per_page"] == "2"
+
+    def test_get_projects_changed_since_filters_by_activity(self):
+        fake = FakeGitLab(total=1, per_page=2)
+        repository = self._create_repository(fake)
+
+        asyncio.run(repository.get_projects_changed_since("2024-01-01T00:00:00Z"))
+
+        assert fake.requests[0].url.params["last_activity_after"] == "2024-01-01T00:00:00Z"
+
+    def test_get_all_projects_without_total_pages_probes_until_short_page(self):
+        fake = FakeGitLab(total=9, per_page=2, total_pages_header=False)
+        repository = self._create_repository(fake, concurrency=3)
+
+        projects = asyncio.run(repository.get_all_projects())
+
+        assert [p.id for p in projects] == list(range(1, 10))
+
+    def test_throttled_page_is_retried(self):
+        fake = FakeGitLab(total=1, per_page=2)
+        responses = [httpx.Response(429, headers={"Retry-After": "0"})]
+
+        def handler(request):
+            if responses:
+                return responses.pop()
+            return fake.handler(request)
+
+        client = httpx.AsyncClient(
+            base_url="https://gitlab.example.com/api/v4",
+            transport=httpx.MockTransport(handler),
+        )
+        scheduler = RequestScheduler(max_rate=1000.0)
+        repository = AsyncGitLabProjectRepository(
+            self._create_settings(), client=client, scheduler=scheduler
+        )
+
+        projects = asyncio.run(repository.get_all_projects())
+
+        assert [p.id for p in projects] == [1]
+        assert scheduler.metrics().throttled == 1
+
+    def test_access_level_falls_back_to_group_access(self):
+        fake = FakeGitLab(total=0, per_page=2)
+        fake.projects = [_project(1, {"project_access": None, "group_access": {"access_level": 40}})]
+        repository = self._create_repository(fake)
+
+        projects = asyncio.run(repository.get_all_projects())
+
+        assert projects[0].access_level == 40
+
+    def test_access_level_none_when_no_permissions(self):
+        fake = FakeGitLab(total=0, per_page=2)
+        fake.projects = [_project(1, {"project_access": None, "group_access": None})]
+        repository = self._create_repository(fake)
+
+        projects = asyncio.run(repository.get_all_projects())
+
+        assert projects[0].access_level is None
+
+
+class TestAsyncGitLabProjectRepositoryLean:
+    def _list(self, members_at, per_page=100, totals=False):
+        """Lean listing over `members_at` (ids per min_access_level); returns rows and requests."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/user"):
+                return httpx.Response(200, json={"id": 1})
+            requests.append(request)
+            params = request.url.params
+            assert params["simple"] == "true"
+            ids = members_at[params["min_access_level"]]
+            start = (int(params["page"]) - 1) * per_page
+            page = [{**_project(i), "permissions": None} for i in ids[start:start + per_page]]
+            headers = {}
+            if totals:
+                headers = {"X-Total": str(len(ids)), "X-Total-Pages": str(max(-(-len(ids) // per_page), 1))}
+            return httpx.Response(200, json=page, headers=headers)
+
+        settings = Settings(git=GitSettings(url="https://gitlab.example.com", lean=True, per_page=per_page))
+        client = httpx.AsyncClient(
+            base_url="https://gitlab.example.com/api/v4",
+            transport=httpx.MockTransport(handler),
+        )
+        repository = AsyncGitLabProjectRepository(settings, client=client)
+        return asyncio.run(repository.get_all_projects()), requests
+
+    def test_lean_listing_resolves_access_levels_in_bulk(self):
+        members_at = {"50": [], "40": [2], "30": [1, 2], "20": [1, 2], "10": [1, 2, 3]}
+
+        projects, requests = self._list(members_at)
+
+        assert sorted((p.id, p.access_level) for p in projects) == [(1, 30), (2, 40), (3, 10)]
+        # The Guest pass is the listing itself
+        assert len(requests) == 5
+
+    def test_lean_listing_skips_passes_that_add_nobody(self):
+        # Developer everywhere: the Developer pass already holds every project
+        members_at = {"50": [], "40": [], "30": [1, 2, 3], "20": [1, 2, 3], "10": [1, 2, 3]}
+
+        projects, requests = self._list(members_at, per_page=1, totals=True)
+
+        assert [(p.id, p.access_level) for p in projects] == [(1, 30), (2, 30), (3, 30)]
+        # one first page per pass, then only the rest of the Developer pass
+        later_pages = [r.url.params["min_access_level"] for r in requests if r.url.params["page"] != "1"]
+        assert len(requests) == 7
+        assert later_pages == ["30", "30"]
+
+    def test_plan_keeps_passes_that_add_projects(self):
+        assert plan_passes({50: 0, 40: 2, 30: 2, 20: 5, 10: 5}) == (20, [40])
+
+    def test_plan_keeps_every_pass_without_totals(self):
+        assert plan_passes({50: 3, 40: None, 30: None, 20: None, 10: None}) == (10, [50, 40, 30, 20])
+
+
+class TestBlockingProjectRepository:
+    def test_get_all_projects_runs_async_repository(self):
+        fake = FakeGitLab(total=3, per_page=2)
+        settings = Settings(git=GitSettings(url="https://gitlab.example.com", per_page=2))
+        repository = AsyncGitLabProjectRepository(settings)
+        repository._client = httpx.AsyncClient(  # pylint: disable=protected-access
+            base_url="https://gitlab.example.com/api/v4",
+            transport=httpx.MockTransport(fake.handler),
+        )
+
+        projects = BlockingProjectRepository(repository).get_all_projects()
+
+        assert [p.id for p in projects] == [1, 2, 3]
+        assert repository._client is None  # pylint: disable=protected-access
+
+    def test_iter_projects_streams_through_one_event_loop(self):
+        fake = FakeGitLab(total=5, per_page=2)
+        settings = Settings(git=GitSettings(url="https://gitlab.example.com", per_page=2))
+        repository = AsyncGitLabProjectRepository(settings)
+        repository._client = httpx.AsyncClient(  # pylint: disable=protected-access
+            base_url="https://gitlab.example.com/api/v4",
+            transport=httpx.MockTransport(fake.handler),
+        )
+
+        projects = BlockingProjectRepository(repository).iter_projects()
+
+        assert next(projects).id == 1
+        assert len(fake.requests) == 1
+        assert [p.id for p in projects] == [2, 3, 4, 5]
+        assert repository._client is None  # pylint: disable=protected-access
@@ -18,11 +18,12 @@ class TestCliHandler:
         assert args.g is False
         assert args.j is True
 
-    def test_flags_are_mutually_exclusive(self):
+    def test_both_flags_select_combined_mode(self):
         cli = CliHandler()
+        args = cli.parse(["-g", "-j"])
 
-        with pytest.raises(SystemExit):
-            cli.parse(["-g", "-j"])
+        assert args.g is True
+        assert args.j is True
 
     def test_requires_at_least_one_flag(self):
         cli = CliHandler()
@@ -87,6 +88,54 @@ class TestCliHandlerGitOptions:
 
         assert args.git_projects == ["project1", "project2"]
 
+    def test_parse_git_concurrency(self):
+        cli = CliHandler()
+        args = cli.parse(["-g", "--git-concurrency", "8"])
+
+        assert args.git_concurrency == 8
+
+    def test_parse_git_per_page(self):
+        cli = CliHandler()
+        args = cli.parse(["-g", "--git-per-page", "50"])
+
+        assert args.git_per_page == 50
+
+    def test_parse_git_backend_choices(self):
+        cli = CliHandler()
+
+        assert cli.parse(["-g", "--git-backend", "async"]).git_backend == "async"
+        with pytest.raises(SystemExit):
+            cli.parse(["-g", "--git-backend", "invalid"])
+
+    def test_incremental_flags_default_to_unset(self):
+        cli = CliHandler()
+        args = cli.parse(["-g"])
+
+        assert args.incremental is None
+        assert args.full_refresh is False
+
+    def test_parse_logs_flag(self):
+        cli = CliHandler()
+
+        assert cli.parse(["-g"]).logs is False
+        assert cli.parse(["-g", "--logs"]).logs is True
+
+    def test_parse_mirror_options(self):
+        cli = CliHandler()
+
+        assert cli.parse(["-g"]).mirror is None
+        args = cli.parse(["-g", "--logs", "--mirror", "--git-mirror-dir", "/tmp/mirrors"])
+
+        assert args.mirror is True
+        assert args.git_mirror_dir == "/tmp/mirrors"
+
+    def test_parse_incremental_and_full_refresh(self):
+        cli = CliHandler()
+        args = cli.parse(["-g", "--incremental", "--full-refresh"])
+
+        assert args.incremental is True
+        assert args.full_refresh is True
+
 
 class TestCliHandlerJiraOptions:
     def test_parse_jira_url(self):
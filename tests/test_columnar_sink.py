@@ -0,0 +1,56 @@
+import pytest
+
+from dataextractor.config.settings import OutputSettings
+from dataextractor.infrastructure.output import ColumnarSink, create_sink
+from tests.conftest import make_project
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def _project(project_id, access_level=30):
+    return make_project(project_id, access_level=access_level, default_branch="main")
+
+
+class TestColumnarSink:
+    def test_parquet_round_trip_in_row_groups(self, tmp_path):
+        with ColumnarSink(tmp_path, "parquet", batch_size=2) as sink:
+            sink.write("git_data", [_project(1), _project(2), _project(3, access_level=None)])
+
+        parquet = pq.ParquetFile(tmp_path / "git_data.parquet")
+        assert parquet.metadata.num_row_groups == 2
+        table = parquet.read()
+        assert table.column("id").to_pylist() == [1, 2, 3]
+        assert table.column("access_level").to_pylist() == [30, 30, None]
+        for column in ("access_level", "namespace"):
+            encodings = parquet.metadata.row_group(0).column(table.schema.get_field_index(column)).encodings
+            assert "RLE_DICTIONARY" in encodings
+        assert table.schema.field("namespace").type == pa.dictionary(pa.int32(), pa.string())
+        assert table.column("namespace").to_pylist() == ["group", "group", "group"]
+
+    def test_arrow_stream_keeps_dictionary_columns(self, tmp_path):
+        with ColumnarSink(tmp_path, "arrow", batch_size=1) as sink:
+            sink.write("git_data", [_project(1), _project(2, access_level=40)])
+
+        table = pa.ipc.open_stream(tmp_path / "git_data.arrows").read_all()
+        assert table.schema.field("access_level").type == pa.dictionary(pa.int32(), pa.int64())
+        assert table.column("access_level").to_pylist() == [30, 40]
+        assert table.schema.field("name").type == pa.string()
+
+    def test_failed_export_keeps_previous_file(self, tmp_path):
+        with ColumnarSink(tmp_path) as sink:
+            sink.write("git_data", [_project(1)])
+
+        with pytest.raises(RuntimeError):
+            with ColumnarSink(tmp_path) as sink:
+                sink.write("git_data", [_project(2)])
+                raise RuntimeError("listing failed")
+
+        assert pq.read_table(tmp_path / "git_data.parquet").column("id").to_pylist() == [1]
+        assert [p.name for p in tmp_path.iterdir()] == ["git_data.parquet"]
+
+    def test_factory_uses_db_url_as_directory(self, tmp_path):
+        sink = create_sink(OutputSettings(type="parquet", db_url=str(tmp_path / "exports")))
+
+        assert isinstance(sink, ColumnarSink)
+        assert sink.path("git_data") == tmp_path / "exports" / "git_data.parquet"
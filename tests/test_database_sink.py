@@ -0,0 +1,252 @@
+import sqlite3
+from unittest.mock import MagicMock
+
+import pytest
+
+from dataextractor.config.settings import OutputSettings
+from dataextractor.core.entities import CommitInfo, ProjectInfo
+from dataextractor.core.interfaces import SyncResult
+from dataextractor.infrastructure.output import ConsoleSink, PostgresSink, SqliteSink, create_sink
+from dataextractor.infrastructure.output.schema import schema_for
+from tests.conftest import make_project
+
+
+def _project(project_id, access_level=30, source=""):
+    return make_project(project_id, access_level=access_level, source=source)
+
+
+def _commit(sha, parents=()):
+    return CommitInfo(
+        project_id=1,
+        project_path="group/project-1",
+        sha=sha,
+        title="Fix",
+        author_name="Author",
+        author_email="author@example.com",
+        authored_date="2024-01-01T00:00:00Z",
+        committer_name="Committer",
+        committer_email="committer@example.com",
+        committed_date="2024-01-01T00:00:00Z",
+        parent_ids=parents,
+    )
+
+
+class TestSchema:
+    def test_columns_follow_field_types(self):
+        kinds = {c.name: c.kind for c in schema_for(CommitInfo).columns}
+
+        assert kinds["project_id"] == "integer"
+        assert kinds["sha"] == "text"
+        assert kinds["parent_ids"] == "json"
+        assert schema_for(CommitInfo).primary_key == ("source", "project_id", "sha")
+
+    def test_optional_fields_use_inner_type(self):
+        kinds = {c.name: c.kind for c in schema_for(ProjectInfo).columns}
+
+        assert kinds["access_level"] == "integer"
+        assert kinds["default_branch"] == "text"
+
+
+class TestSqliteSink:
+    def test_writes_rows_on_close(self, tmp_path):
+        path = tmp_path / "out.db"
+
+        with SqliteSink(path) as sink:
+            sink.write("git_data", [_project(1), _project(2)])
+
+        rows = sqlite3.connect(path).execute("SELECT id, name FROM git_data ORDER BY id").fetchall()
+        assert rows == [(1, "project-1"), (2, "project-2")]
+
+    def test_rerun_upserts_on_primary_key(self, tmp_path):
+        path = tmp_path / "out.db"
+        with SqliteSink(path) as sink:
+            sink.write("git_data", [_project(1, access_level=30)])
+
+        with SqliteSink(path) as sink:
+            sink.write("git_data", [_project(1, access_level=40)])
+
+        rows = sqlite3.connect(path).execute("SELECT id, access_level FROM git_data").fetchall()
+        assert rows == [(1, 40)]
+
+    def test_duplicate_keys_in_a_batch_keep_last_row(self, tmp_path):
+        path = tmp_path / "out.db"
+
+        with SqliteSink(path) as sink:
+            sink.write("git_data", [_project(1, access_level=30), _project(1, access_level=50)])
+
+        rows = sqlite3.connect(path).execute("SELECT id, access_level FROM git_data").fetchall()
+        assert rows == [(1, 50)]
+
+    def test_full_batches_are_committed_before_close(self, tmp_path):
+        path = tmp_path / "out.db"
+        sink = SqliteSink(path, batch_size=2)
+
+        sink.write("git_data", [_project(1), _project(2), _project(3)])
+
+        count = sqlite3.connect(path).execute("SELECT COUNT(*) FROM git_data").fetchone()
+        assert count == (3,)
+        sink.close()
+
+    def test_json_columns_are_encoded(self, tmp_path):
+        path = tmp_path / "out.db"
+
+        with SqliteSink(path) as sink:
+            sink.write("git_logs", [_commit("abc", parents=("p1", "p2"))])
+
+        row = sqlite3.connect(path).execute("SELECT sha, parent_ids FROM git_logs").fetchone()
+        assert row == ("abc", '["p1", "p2"]')
+
+    def test_failed_batch_is_rolled_back(self, tmp_path):
+        sink = SqliteSink(tmp_path / "out.db")
+        sink.write("git_data", [_project(1)])
+        sink.connection.execute('DROP TABLE "git_data"')
+
+        with pytest.raises(sqlite3.OperationalError):
+            sink.flush()
+
+        assert not sink.connection.in_transaction
+        sink.close()
+
+
+class TestSqliteSync:
+    def _sync(self, path, projects, prune=True, sources=None):
+        with SqliteSink(path) as sink:
+            return sink.sync("git_data", projects, prune, sources)
+
+    def _rows(self, path):
+        return sqlite3.connect(path).execute("SELECT id, access_level FROM git_data ORDER BY id").fetchall()
+
+    def test_first_sync_inserts_everything(self, tmp_path):
+        result = self._sync(tmp_path / "out.db", [_project(1), _project(2)])
+
+        assert result == SyncResult(inserted=2)
+        assert self._rows(tmp_path / "out.db") == [(1, 30), (2, 30)]
+
+    def test_only_changes_are_written(self, tmp_path):
+        path = tmp_path / "out.db"
+        self._sync(path, [_project(1), _project(2), _project(3)])
+
+        result = self._sync(path, [_project(1), _project(2, access_level=40), _project(4)])
+
+        assert result == SyncResult(inserted=1, updated=1, deleted=1, unchanged=1)
+        assert result.total == 3
+        assert self._rows(path) == [(1, 30), (2, 40), (4, 30)]
+
+    def test_unchanged_listing_writes_nothing(self, tmp_path):
+        path = tmp_path / "out.db"
+        self._sync(path, [_project(1), _project(2)])
+        connection = sqlite3.connect(path)
+        changes_before = connection.execute("SELECT total_changes()").fetchone()
+
+        with SqliteSink(path) as sink:
+            result = sink.sync("git_data", [_project(1), _project(2)])
+            assert sink.connection.total_changes == 0
+
+        assert result == SyncResult(unchanged=2)
+        assert connection.execute("SELECT total_changes()").fetchone() == changes_before
+
+    def test_empty_listing_leaves_table_alone(self, tmp_path):
+        path = tmp_path / "out.db"
+        self._sync(path, [_project(1)])
+
+        assert self._sync(path, []) == SyncResult()
+        assert self._rows(path) == [(1, 30)]
+
+    def test_partial_listing_upserts_without_deleting(self, tmp_path):
+        path = tmp_path / "out.db"
+        self._sync(path, [_project(1), _project(2)])
+
+        result = self._sync(path, [_project(2, access_level=40)], prune=False)
+
+        assert result == SyncResult(updated=1)
+        assert self._rows(path) == [(1, 30), (2, 40)]
+
+    def test_deletes_are_scoped_to_the_listed_sources(self, tmp_path):
+        path = tmp_path / "out.db"
+        self._sync(path, [_project(1, source="a"), _project(2, source="a"), _project(3, source="b")])
+
+        result = self._sync(path, [_project(1, source="a")], sources={"a"})
+
+        assert result == SyncResult(deleted=1, unchanged=1)
+        rows = sqlite3.connect(path).execute("SELECT source, id FROM git_data ORDER BY id").fetchall()
+        assert rows == [("a", 1), ("b", 3)]
+
+    def test_empty_source_scope_deletes_nothing(self, tmp_path):
+        path = tmp_path / "out.db"
+        self._sync(path, [_project(1), _project(2)])
+
+        assert self._sync(path, [_project(1)], sources=set()) == SyncResult(unchanged=1)
+        assert self._rows(path) == [(1, 30), (2, 30)]
+
+    def test_upsert_skips_rows_with_same_hash(self, tmp_path):
+        path = tmp_path / "out.db"
+        with SqliteSink(path) as sink:
+            sink.write("git_data", [_project(1)])
+
+        with SqliteSink(path) as sink:
+            sink.write("git_data", [_project(1), _project(2)])
+            sink.flush()
+            assert sink.connection.total_changes == 1
+
+    def test_upsert_uses_is_not_for_older_sqlite(self, tmp_path):
+        statements = []
+        with SqliteSink(tmp_path / "out.db") as sink:
+            sink.connection.set_trace_callback(statements.append)
+            sink.write("git_data", [_project(1)])
+
+        upserts = [s for s in statements if s.startswith("INSERT")]
+        assert upserts and all('"row_hash" IS NOT excluded."row_hash"' in s for s in upserts)
+
+
+class TestConsoleSync:
+    def test_writes_every_row(self, capsys):
+        result = ConsoleSink(lambda table, p: f"{table} {p.name}").sync("git_data", [_project(1), _project(2)])
+
+        assert result == SyncResult(inserted=2)
+        assert capsys.readouterr().out == "git_data project-1\ngit_data project-2\n"
+
+
+class TestPostgresSink:
+    def test_batches_are_copied_to_staging_then_upserted(self):
+        connection = MagicMock()
+        copy = connection.cursor.return_value.__enter__.return_value.copy.return_value.__enter__.return_value
+
+        with PostgresSink("postgresql://db", connection=connection) as sink:
+            sink.write("git_logs", [_commit("a"), _commit("b", parents=("a",))])
+
+        statements = [c.args[0] for c in connection.execute.call_args_list]
+        assert statements[0].startswith('CREATE TABLE IF NOT EXISTS "git_logs"')
+        assert 'PRIMARY KEY ("source", "project_id", "sha")' in statements[0]
+        assert '"parent_ids" JSONB' in statements[0]
+        assert statements[1] == (
+            'CREATE TEMP TABLE IF NOT EXISTS "_staging_git_logs" (LIKE "git_logs") ON COMMIT DELETE ROWS'
+        )
+        assert statements[2].startswith('INSERT INTO "git_logs"')
+        assert 'ON CONFLICT ("source", "project_id", "sha") DO UPDATE SET' in statements[2]
+        copy_sql = connection.cursor.return_value.__enter__.return_value.copy.call_args.args[0]
+        assert copy_sql.startswith('COPY "_staging_git_logs"')
+        names = schema_for(CommitInfo).names
+        rows = [dict(zip(names, c.args[0])) for c in copy.write_row.call_args_list]
+        assert [r["sha"] for r in rows] == ["a", "b"]
+        assert rows[1]["parent_ids"] == '["a"]'
+        assert len(copy.write_row.call_args.args[0]) == len(names) + 1  # plus row_hash
+        assert 'WHERE "git_logs"."row_hash" IS DISTINCT FROM excluded."row_hash"' in statements[2]
+        connection.close.assert_called_once()
+
+
+class TestCreateSink:
+    def test_console_is_the_default(self):
+        assert isinstance(create_sink(OutputSettings()), ConsoleSink)
+
+    def test_sqlite_url(self, tmp_path):
+        path = tmp_path / "out.db"
+
+        sink = create_sink(OutputSettings(type="sqlite", db_url=f"sqlite:///{path}"))
+
+        assert isinstance(sink, SqliteSink)
+        sink.close()
+        assert path.exists()
+
+    def test_unsupported_type_raises(self):
+        with pytest.raises(ValueError, match="mysql"):
+            create_sink(OutputSettings(type="mysql"))
@@ -18,6 +18,8 @@ class TestGitInputs:
         assert git.git_type == ""
         assert git.git_token == ""
         assert not git.git_projects
+        assert git.git_concurrency == 1
+        assert git.git_per_page == 100
 
 
 class TestJiraInputs:
@@ -27,6 +29,12 @@ class TestJiraInputs:
         assert jira.jira_url == ""
         assert jira.jira_version == ""
         assert jira.jira_token == ""
+        assert jira.jira_page_size == 100
+        assert jira.jira_concurrency == 1
+        assert jira.jira_incremental is False
+        assert jira.jira_overlap_minutes == 5
+        assert not jira.jira_fields
+        assert jira.jira_field_cache_ttl_hours == 24.0
 
 
 class TestInputs:
@@ -73,6 +81,29 @@ class TestInputs:
         assert inputs.git.git_version == ""
         assert not inputs.git.git_projects
 
+    def test_from_dict_parses_paging_options(self):
+        inputs = Inputs.from_dict({"git_concurrency": "4", "git_per_page": 50})
+
+        assert inputs.git.git_concurrency == 4
+        assert inputs.git.git_per_page == 50
+
+    def test_from_dict_parses_mirror_options(self):
+        inputs = Inputs.from_dict({"git_mirror": True, "git_mirror_dir": "/srv/mirrors"})
+
+        assert inputs.git.git_mirror is True
+        assert inputs.git.git_mirror_dir == "/srv/mirrors"
+
+    def test_from_dict_parses_git_sources(self):
+        inputs = Inputs.from_dict({"git_sources": [
+            {"name": "eu", "git_url": "https://gitlab-eu.example.com", "git_token": "eu-token"},
+            {"git_url": "https://gitlab-us.example.com", "git_projects": ["group/app"]},
+        ]})
+
+        first, second = inputs.git.git_sources
+        assert (first.name, first.git_url, first.git_token) == ("eu", "https://gitlab-eu.example.com", "eu-token")
+        assert second.name == ""
+        assert second.git_projects == ["group/app"]
+
 
 class TestOutputs:
     def test_from_dict_with_full_data(self):
@@ -0,0 +1,158 @@
+import threading
+from dataclasses import replace
+from unittest.mock import patch
+
+from dataextractor.core.entities import CommitInfo
+from dataextractor.core.interfaces import CommitRepository, RowSink, WatermarkStore
+from dataextractor.core.use_cases import ExtractCommitsUseCase
+from tests.conftest import make_project
+
+
+def _commit(project, day):
+    return CommitInfo(
+        project_id=project.id,
+        project_path=project.path_with_namespace,
+        sha=f"{project.id}-{day}",
+        title=f"Commit {day}",
+        author_name="Author",
+        author_email="author@example.com",
+        authored_date=f"2024-01-{day:02d}T00:00:00Z",
+        committer_name="Committer",
+        committer_email="committer@example.com",
+        committed_date=f"2024-01-{day:02d}T00:00:00Z",
+    )
+
+
+class MockCommitRepository(CommitRepository):
+    def __init__(self, days: int, failing: set[int] | None = None):
+        self.days = days
+        self.failing = failing or set()
+        self.calls: list[tuple[int, str | None]] = []
+        self._lock = threading.Lock()
+
+    def iter_commits(self, project, since=None):
+        with self._lock:
+            self.calls.append((project.id, since))
+        if project.id in self.failing:
+            raise RuntimeError("boom")
+        for day in range(self.days, 0, -1):
+            commit = _commit(project, day)
+            if since is None or commit.committed_date >= since:
+                yield commit
+
+
+class MemorySink(RowSink):
+    def __init__(self):
+        self.writes: list[tuple[str, list]] = []
+        self.writer_threads: set[int] = set()
+
+    def write(self, table, rows):
+        self.writer_threads.add(threading.get_ident())
+        self.writes.append((table, list(rows)))
+
+    @property
+    def rows(self):
+        return [row for _, rows in self.writes for row in rows]
+
+
+class MemoryWatermarkStore(WatermarkStore):
+    def __init__(self, watermarks=None):
+        self.watermarks = dict(watermarks or {})
+
+    def load(self):
+        return dict(self.watermarks)
+
+    def save(self, watermarks):
+        self.watermarks = dict(watermarks)
+
+
+class TestExtractCommitsUseCase:
+    def test_writes_every_commit_and_stores_newest_date(self):
+        repository = MockCommitRepository(days=3)
+        sink = MemorySink()
+        store = MemoryWatermarkStore()
+
+        result = ExtractCommitsUseCase(repository, sink, store, "git_logs", concurrency=4).execute(
+            [make_project(1), make_project(2)]
+        )
+
+        assert result.rows == 6
+        assert result.projects == 2
+        assert {table for table, _ in sink.writes} == {"git_logs"}
+        assert sink.writer_threads == {threading.get_ident()}
+        assert store.watermarks == {"1": "2024-01-03T00:00:00Z", "2": "2024-01-03T00:00:00Z"}
+
+    def test_resumes_from_watermark_inclusively(self):
+        repository = MockCommitRepository(days=5)
+        sink = MemorySink()
+        store = MemoryWatermarkStore({"1": "2024-01-03T00:00:00Z"})
+
+        result = ExtractCommitsUseCase(repository, sink, store, "git_logs").execute([make_project(1)])
+
+        assert repository.calls == [(1, "2024-01-03T00:00:00Z")]
+        # The watermark commit is rewritten; the sink's upsert makes that a no-op
+        assert [c.sha for c in sink.rows] == ["1-5", "1-4", "1-3"]
+        assert result.rows == 3
+        assert store.watermarks["1"] == "2024-01-05T00:00:00Z"
+
+    def test_keeps_commits_sharing_the_watermark_timestamp(self):
+        project = make_project(1)
+        sibling = replace(_commit(project, 3), sha="1-3b")
+
+        class SiblingRepository(MockCommitRepository):
+            def iter_commits(self, project, since=None):
+                yield from super().iter_commits(project, since)
+                yield sibling
+
+        sink = MemorySink()
+        store = MemoryWatermarkStore({"1": "2024-01-03T00:00:00Z"})
+
+        ExtractCommitsUseCase(SiblingRepository(days=3), sink, store, "git_logs").execute([project])
+
+        assert "1-3b" in [c.sha for c in sink.rows]
+
+    def test_full_refresh_ignores_watermarks(self):
+        repository = MockCommitRepository(days=2)
+        store = MemoryWatermarkStore({"1": "2024-01-02T00:00:00Z"})
+
+        result = ExtractCommitsUseCase(repository, MemorySink(), store, "git_logs").execute(
+            [make_project(1)], full_refresh=True
+        )
+
+        assert repository.calls == [(1, None)]
+        assert result.rows == 2
+
+    def test_rows_are_written_in_batches(self):
+        use_case = ExtractCommitsUseCase(MockCommitRepository(days=5), MemorySink(), MemoryWatermarkStore(), "t")
+
+        with patch.object(use_case, "BATCH_SIZE", 2):
+            use_case.execute([make_project(1)])
+
+        assert [len(rows) for _, rows in use_case.sink.writes] == [2, 2, 1]
+
+    def test_failing_project_is_reported_and_keeps_its_watermark(self):
+        repository = MockCommitRepository(days=2, failing={2})
+        store = MemoryWatermarkStore({"2": "2024-01-01T00:00:00Z"})
+
+        result = ExtractCommitsUseCase(repository, MemorySink(), store, "git_logs", concurrency=2).execute(
+            [make_project(1), make_project(2), make_project(3)]
+        )
+
+        assert result.failed == {"group/project-2": "RuntimeError: boom"}
+        assert result.rows == 4
+        assert store.watermarks["2"] == "2024-01-01T00:00:00Z"
+        assert set(store.watermarks) == {"1", "2", "3"}
+
+    def test_projects_are_pulled_lazily(self):
+        pulled = []
+
+        def projects():
+            for project_id in range(1, 4):
+                pulled.append(project_id)
+                yield make_project(project_id)
+
+        ExtractCommitsUseCase(
+            MockCommitRepository(days=1), MemorySink(), MemoryWatermarkStore(), "t", concurrency=1
+        ).execute(projects())
+
+        assert pulled == [1, 2, 3]
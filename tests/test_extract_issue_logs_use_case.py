@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from dataextractor.core.entities import ProjectInfo, TransitionInfo, WorklogInfo
+from dataextractor.core.interfaces import IssueLogRepository, RowSink, WatermarkStore
+from dataextractor.core.use_cases import ExtractIssueLogsUseCase
+
+
+def _project(key):
+    return ProjectInfo(id=1, name=key, path_with_namespace=key, http_url="")
+
+
+def _transition(history_id):
+    return TransitionInfo(issue_id=1, issue_key="APP-1", history_id=history_id, created="2024-01-03T10:00:00+00:00")
+
+
+def _worklog(worklog_id):
+    return WorklogInfo(
+        id=worklog_id,
+        issue_id=1,
+        issue_key="APP-1",
+        started="2024-01-03T09:00:00+00:00",
+        time_spent_seconds=60,
+        created="2024-01-03T10:00:00+00:00",
+        updated="2024-01-03T10:00:00+00:00",
+    )
+
+
+class MockLogRepository(IssueLogRepository):
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def iter_logs(self, projects, since=None):
+        self.calls.append(dict(since or {}))
+        yield from self.rows
+
+
+class MemorySink(RowSink):
+    def __init__(self):
+        self.writes = []
+
+    def write(self, table, rows):
+        self.writes.append((table, list(rows)))
+
+
+class MemoryWatermarkStore(WatermarkStore):
+    def __init__(self, watermarks=None):
+        self.watermarks = dict(watermarks or {})
+
+    def load(self):
+        return dict(self.watermarks)
+
+    def save(self, watermarks):
+        self.watermarks = dict(watermarks)
+
+
+class TestExtractIssueLogsUseCase:
+    def test_routes_rows_to_their_tables_in_batches(self):
+        rows = [_transition(n) for n in range(3)] + [_worklog(n) for n in range(2)]
+        sink = MemorySink()
+        use_case = ExtractIssueLogsUseCase(
+            MockLogRepository(rows), sink, MemoryWatermarkStore(), tables=("logs", "logs_worklogs")
+        )
+
+        with patch.object(use_case, "BATCH_SIZE", 2):
+            result = use_case.execute([_project("APP")])
+
+        assert [(t, len(r)) for t, r in sink.writes] == [("logs", 2), ("logs_worklogs", 2), ("logs", 1)]
+        assert (result.transitions, result.worklogs, result.incremental) == (3, 2, False)
+
+    def test_watermark_is_the_start_of_the_run(self):
+        store = MemoryWatermarkStore()
+        before = datetime.now(timezone.utc)
+
+        ExtractIssueLogsUseCase(MockLogRepository([]), MemorySink(), store, tables=("a", "b")).execute(
+            [_project("APP")]
+        )
+
+        assert before <= datetime.fromisoformat(store.watermarks["APP"]) <= datetime.now(timezone.utc)
+
+    def test_reads_history_of_issues_updated_since_watermark_minus_overlap(self):
+        repository = MockLogRepository([_transition(1)])
+        store = MemoryWatermarkStore({"APP": "2024-01-05T10:00:00+00:00"})
+
+        result = ExtractIssueLogsUseCase(
+            repository, MemorySink(), store, tables=("a", "b"), overlap=timedelta(minutes=15)
+        ).execute([_project("APP"), _project("NEW")])
+
+        assert repository.calls == [{"APP": "2024-01-05T09:45:00+00:00"}]
+        assert result.incremental
+        assert set(store.watermarks) == {"APP", "NEW"}
+
+    def test_full_refresh_ignores_watermarks(self):
+        repository = MockLogRepository([])
+        store = MemoryWatermarkStore({"APP": "2024-01-05T10:00:00+00:00"})
+
+        ExtractIssueLogsUseCase(repository, MemorySink(), store, tables=("a", "b")).execute(
+            [_project("APP")], full_refresh=True
+        )
+
+        assert repository.calls == [{}]
@@ -0,0 +1,184 @@
+import asyncio
+
+import pytest
+import requests
+
+from benchmarks.fake_gitlab import FakeGitLabServer, ServerOptions
+from dataextractor.config.settings import GitSettings, JiraSettings, OutputSettings, Settings
+from dataextractor.infrastructure.gitlab import (
+    AsyncGitLabProjectRepository,
+    GitLabCommitRepository,
+    GitLabConnection,
+    GitLabProjectRepository,
+    GraphQLGitLabProjectRepository,
+)
+from dataextractor.infrastructure.http import RequestScheduler
+
+
+@pytest.fixture(name="server")
+def fixture_server():
+    with FakeGitLabServer(ServerOptions(projects=250)) as server:
+        yield server
+
+
+def _create_settings(url, **git_options):
+    return Settings(
+        git=GitSettings(url=url, token="bench-token", **git_options),
+        jira=JiraSettings(),
+        outputs=OutputSettings(),
+    )
+
+
+class TestFakeGitLabServer:
+    def test_pages_carry_totals_link_and_etag(self, server):
+        response = requests.get(
+            f"{server.url}/api/v4/projects", params={"page": 1, "per_page": 100}, timeout=5
+        )
+
+        assert len(response.json()) == 100
+        assert response.headers["X-Total"] == "250"
+        assert response.headers["X-Total-Pages"] == "3"
+        assert 'rel="next"' in response.headers["Link"]
+
+        revalidated = requests.get(
+            f"{server.url}/api/v4/projects",
+            params={"page": 1, "per_page": 100},
+            headers={"If-None-Match": response.headers["ETag"]},
+            timeout=5,
+        )
+        assert revalidated.status_code == 304
+
+    @pytest.mark.parametrize("simple", ["true", "True"])
+    def test_simple_listing_drops_full_payload(self, server, simple):
+        response = requests.get(
+            f"{server.url}/api/v4/projects", params={"per_page": 5, "simple": simple}, timeout=5
+        )
+
+        assert all("description" not in p and "permissions" not in p for p in response.json())
+
+    def test_rate_limit_answers_429_once_budget_is_spent(self):
+        options = ServerOptions(projects=10, rate_limit=2)
+        with FakeGitLabServer(options) as server:
+            statuses = [
+                requests.get(f"{server.url}/api/v4/user", timeout=5).status_code for _ in range(3)
+            ]
+            assert statuses == [200, 200, 429]
+            assert server.throttled == 1
+
+    @pytest.mark.parametrize("git_options", [{}, {"concurrency": 4}, {"lean": True}])
+    def test_rest_repository_lists_every_project(self, server, git_options):
+        repository = GitLabProjectRepository(
+            _create_settings(server.url, **git_options), scheduler=RequestScheduler()
+        )
+
+        # Lean listings hand rows on as their access level is settled
+        projects = sorted(repository.get_all_projects(), key=lambda p: p.id)
+
+        assert [p.id for p in projects] == list(range(1, 251))
+        assert projects[0].access_level == 20
+        assert projects[0].path_with_namespace == "group-1/team-1/project-1"
+
+    def test_async_repository_lists_every_project(self, server):
+        repository = AsyncGitLabProjectRepository(
+            _create_settings(server.url, concurrency=4), scheduler=RequestScheduler()
+        )
+
+        async def list_projects():
+            try:
+                return await repository.get_all_projects()
+            finally:
+                await repository.aclose()
+
+        projects = asyncio.run(list_projects())
+
+        assert len(projects) == 250
+        # the token check and three pages
+        assert server.requests == 4
+
+    @pytest.mark.parametrize("concurrency", [1, 4])
+    def test_rest_repository_resolves_configured_projects(self, server, concurrency):
+        repository = GitLabProjectRepository(
+            _create_settings(
+                server.url,
+                concurrency=concurrency,
+                projects=[
+                    f"{server.url}/group-3/team-3/project-3.git",
+                    "7",
+                    "group-9/team-2/project-9",
+                    "group-0/missing",
+                    "group-3/team-3/project-3",
+                ],
+            ),
+            scheduler=RequestScheduler(),
+        )
+
+        projects = repository.get_all_projects()
+
+        assert [p.id for p in projects] == [3, 7, 9]
+        assert list(repository.get_unresolved_projects()) == ["group-0/missing"]
+        assert "404" in repository.get_unresolved_projects()["group-0/missing"]
+
+    def test_async_repository_resolves_configured_projects(self, server):
+        repository = AsyncGitLabProjectRepository(
+            _create_settings(server.url, concurrency=4, projects=["2", "group-0/missing", "group-5/team-5/project-5"]),
+            scheduler=RequestScheduler(),
+        )
+
+        async def list_projects():
+            try:
+                return await repository.get_all_projects()
+            finally:
+                await repository.aclose()
+
+        projects = asyncio.run(list_projects())
+
+        assert [p.id for p in projects] == [2, 5]
+        assert repository.get_unresolved_projects() == {"group-0/missing": "404: Not Found"}
+        # the token check and three lookups
+        assert server.requests == 4
+
+    def test_graphql_repository_lists_every_project(self, server):
+        repository = GraphQLGitLabProjectRepository(
+            _create_settings(server.url), scheduler=RequestScheduler()
+        )
+
+        projects = repository.get_all_projects()
+
+        assert [p.id for p in projects] == list(range(1, 251))
+        assert projects[0].access_level == 20
+        assert projects[0].default_branch == "main"
+        assert server.requests == 3
+
+    def test_graphql_repository_resolves_mixed_paths_and_ids(self, server):
+        repository = GraphQLGitLabProjectRepository(
+            _create_settings(server.url, projects=["group-2/team-2/project-2", "5", "group-0/missing"]),
+            scheduler=RequestScheduler(),
+        )
+
+        projects = repository.get_all_projects()
+
+        assert [p.id for p in projects] == [2, 5]
+        assert list(repository.get_unresolved_projects()) == ["group-0/missing"]
+
+    def test_fake_graphql_applies_both_filters(self, server):
+        response = requests.post(
+            f"{server.url}/api/graphql",
+            json={"variables": {"fullPaths": ["group-2/team-2/project-2"], "ids": ["gid://gitlab/Project/5"]}},
+            timeout=5,
+        )
+
+        assert response.json()["data"]["projects"]["nodes"] == []
+
+    def test_commit_repository_pages_history_since(self, server):
+        settings = _create_settings(server.url, per_page=8, projects=["3"])
+        scheduler = RequestScheduler()
+        [info] = GitLabProjectRepository(settings, scheduler=scheduler).get_all_projects()
+        connection = GitLabConnection(settings, scheduler=scheduler)
+
+        commits = list(GitLabCommitRepository(connection).iter_commits(info))
+        recent = list(GitLabCommitRepository(connection).iter_commits(info, since=commits[4].committed_date))
+
+        assert len(commits) == 20
+        assert commits[0].committed_date == "2024-01-01T00:03:00Z"
+        assert [c.sha for c in recent] == [c.sha for c in commits[:5]]
+        assert commits[0].project_path == "group-3/team-3/project-3"
@@ -0,0 +1,107 @@
+import os
+import subprocess
+
+import pytest
+
+from dataextractor.config.settings import GitSettings, JiraSettings, OutputSettings, Settings
+from dataextractor.core.entities import ProjectInfo
+from dataextractor.infrastructure.git import GitCommandError, GitMirrorCommitRepository
+
+
+def _git(repo, *args, date=None):
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "Author",
+        "GIT_AUTHOR_EMAIL": "author@example.com",
+        "GIT_COMMITTER_NAME": "Committer",
+        "GIT_COMMITTER_EMAIL": "committer@example.com",
+    }
+    if date:
+        env.update(GIT_AUTHOR_DATE=date, GIT_COMMITTER_DATE=date)
+    subprocess.run(["git", "-C", str(repo), *args], env=env, check=True, capture_output=True)
+
+
+@pytest.fixture(name="source")
+def fixture_source(tmp_path):
+    repo = tmp_path / "source"
+    repo.mkdir()
+    _git(repo, "init", "--quiet", "--initial-branch=main")
+    for day in (1, 2, 3):
+        _git(repo, "commit", "--allow-empty", "-m", f"Change {day}", date=f"2024-01-0{day}T10:00:00+00:00")
+    return repo
+
+
+def _project(url, project_id=1):
+    return ProjectInfo(id=project_id, name="source", path_with_namespace="group/source", http_url=str(url))
+
+
+class TestGitMirrorCommitRepository:
+    def _create_repository(self, tmp_path, token="secret-token"):
+        settings = Settings(
+            git=GitSettings(url="https://gitlab.example.com", token=token),
+            jira=JiraSettings(),
+            outputs=OutputSettings(),
+        )
+        return GitMirrorCommitRepository(settings, tmp_path / "mirrors")
+
+    def test_first_call_clones_bare_mirror_and_streams_history(self, tmp_path, source):
+        repository = self._create_repository(tmp_path)
+
+        commits = list(repository.iter_commits(_project(source)))
+
+        assert [c.title for c in commits] == ["Change 3", "Change 2", "Change 1"]
+        assert commits[0].committed_date == "2024-01-03T10:00:00+00:00"
+        assert commits[0].author_email == "author@example.com"
+        assert commits[0].parent_ids == (commits[1].sha,)
+        assert commits[2].parent_ids == ()
+        assert (tmp_path / "mirrors" / "gitlab.example.com" / "1.git" / "HEAD").exists()
+
+    def test_later_calls_fetch_new_commits_and_honour_since(self, tmp_path, source):
+        repository = self._create_repository(tmp_path)
+        list(repository.iter_commits(_project(source)))
+        _git(source, "commit", "--allow-empty", "-m", "Change 4", date="2024-01-04T10:00:00+00:00")
+
+        commits = list(repository.iter_commits(_project(source), since="2024-01-03T10:00:00+00:00"))
+
+        assert [c.title for c in commits] == ["Change 4", "Change 3"]
+
+    def test_empty_repository_has_no_commits(self, tmp_path):
+        empty = tmp_path / "empty"
+        empty.mkdir()
+        _git(empty, "init", "--quiet")
+        repository = self._create_repository(tmp_path)
+
+        assert not list(repository.iter_commits(_project(empty)))
+
+    def test_unreachable_remote_raises_git_error(self, tmp_path):
+        repository = self._create_repository(tmp_path)
+
+        with pytest.raises(GitCommandError, match="git clone"):
+            list(repository.iter_commits(_project(tmp_path / "missing")))
+
+    def test_token_is_passed_as_config_env_not_argv(self, tmp_path):
+        env = self._create_repository(tmp_path)._env  # pylint: disable=protected-access
+
+        assert env["GIT_CONFIG_KEY_0"] == "http.extraHeader"
+        assert env["GIT_CONFIG_VALUE_0"].startswith("Authorization: Basic ")
+        assert env["GIT_TERMINAL_PROMPT"] == "0"
+
+    def test_token_config_is_appended_to_existing_config_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("GIT_CONFIG_COUNT", "1")
+        monkeypatch.setenv("GIT_CONFIG_KEY_0", "http.sslVerify")
+        monkeypatch.setenv("GIT_CONFIG_VALUE_0", "false")
+
+        env = self._create_repository(tmp_path)._env  # pylint: disable=protected-access
+
+        assert env["GIT_CONFIG_COUNT"] == "2"
+        assert env["GIT_CONFIG_KEY_0"] == "http.sslVerify"
+        assert env["GIT_CONFIG_KEY_1"] == "http.extraHeader"
+
+    def test_failing_log_reports_git_stderr(self, tmp_path, source):
+        repository = self._create_repository(tmp_path)
+        mirror = repository.update_mirror(_project(source))
+
+        with pytest.raises(GitCommandError, match="git log") as error:
+            list(repository._stream(mirror, ["log", "no-such-branch"]))  # pylint: disable=protected-access
+
+        assert "no-such-branch" in error.value.stderr
@@ -1,137 +1,366 @@
 from unittest.mock import MagicMock, patch
 
-from dataextractor.config.settings import GitSettings, JiraSettings, OutputSettings, Settings
+import httpx
+import pytest
+
 from dataextractor.core.entities import ProjectInfo
-from dataextractor.infrastructure.gitlab import GitLabProjectRepository
+from dataextractor.infrastructure.gitlab import GitLabConnection, GitLabProjectRepository
+from dataextractor.infrastructure.http import ApiHTTPAdapter, RequestScheduler
+from tests.conftest import make_settings
 
 
-class TestGitLabProjectRepository:
-    def _create_settings(self):
-        return Settings(
-            git=GitSettings(
-                url="https://gitlab.example.com",
-                token="test-token",
-            ),
-            jira=JiraSettings(),
-            outputs=OutputSettings(),
-        )
+def _project(project_id, permissions=None):
+    return {
+        "id": project_id,
+        "name": f"project-{project_id}",
+        "path_with_namespace": f"group/project-{project_id}",
+        "http_url_to_repo": f"https://gitlab.example.com/group/project-{project_id}.git",
+        "permissions": permissions or {"project_access": {"access_level": 30}, "group_access": None},
+    }
+
+
+class FakeGitLab:
+    """Project listing and lookups over httpx.MockTransport."""
+
+    def __init__(self, total=0, per_page=2, total_pages_header=True):
+        self.projects = [_project(i) for i in range(1, total + 1)]
+        self.per_page = per_page
+        self.total_pages_header = total_pages_header
+        self.requests = []
 
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path.removeprefix("/api/v4")
+        if path == "/user":
+            return httpx.Response(200, json={"id": 1})
+        if path != "/projects":
+            project = next((p for p in self.projects if path == f"/projects/{p['id']}"), None)
+            if project is None:
+                return httpx.Response(404, json={"message": "404 Project Not Found"})
+            return httpx.Response(200, json=project)
+        start = (int(request.url.params["page"]) - 1) * self.per_page
+        headers = {}
+        if self.total_pages_header:
+            headers["X-Total-Pages"] = str(-(-len(self.projects) // self.per_page))
+        return httpx.Response(200, json=self.projects[start:start + self.per_page], headers=headers)
+
+    def pages(self) -> list[int]:
+        return [int(r.url.params["page"]) for r in self.requests if r.url.path.endswith("/projects")]
+
+
+def _create_repository(fake, settings=None, handler=None):
+    client = httpx.AsyncClient(
+        base_url="https://gitlab.example.com/api/v4",
+        transport=httpx.MockTransport(handler or fake.handler),
+    )
+    return GitLabProjectRepository(settings or make_settings(), scheduler=RequestScheduler(), client=client)
+
+
+class TestGitLabConnection:
     def test_init_stores_settings(self):
-        settings = self._create_settings()
+        settings = make_settings()
 
-        repository = GitLabProjectRepository(settings)
+        connection = GitLabConnection(settings)
 
-        assert repository.settings is settings
-        assert repository._client is None  # pylint: disable=protected-access
+        assert connection.settings is settings
+        assert connection._client is None  # pylint: disable=protected-access
 
-    @patch("dataextractor.infrastructure.gitlab.repository.gitlab.Gitlab")
+    @patch("dataextractor.infrastructure.gitlab.connection.gitlab.Gitlab")
     def test_client_property_creates_gitlab_instance(self, mock_gitlab_class):
-        settings = self._create_settings()
         mock_client = MagicMock()
         mock_gitlab_class.return_value = mock_client
-        repository = GitLabProjectRepository(settings)
+        connection = GitLabConnection(make_settings())
 
-        client = repository.client
+        client = connection.client
 
         mock_gitlab_class.assert_called_once_with(
             "https://gitlab.example.com",
             private_token="test-token",
             timeout=30,
+            session=connection.session,
         )
-        mock_client.auth.assert_called_once()
+        mock_client.http_get.assert_called_once_with("/user", obey_rate_limit=False, max_retries=0)
         assert client is mock_client
 
-    @patch("dataextractor.infrastructure.gitlab.repository.gitlab.Gitlab")
-    def test_client_property_caches_instance(self, mock_gitlab_class):
-        settings = self._create_settings()
+    @patch("dataextractor.infrastructure.gitlab.connection.gitlab.Gitlab")
+    def test_client_property_skips_auth_probe(self, mock_gitlab_class):
         mock_client = MagicMock()
         mock_gitlab_class.return_value = mock_client
-        repository = GitLabProjectRepository(settings)
+        connection = GitLabConnection(make_settings(skip_auth=True))
+
+        _ = connection.client
+
+        mock_client.http_get.assert_not_called()
 
-        client1 = repository.client
-        client2 = repository.client
+    @patch("dataextractor.infrastructure.gitlab.connection.gitlab.Gitlab")
+    def test_client_property_caches_instance(self, mock_gitlab_class):
+        mock_gitlab_class.return_value = MagicMock()
+        connection = GitLabConnection(make_settings())
+
+        client1 = connection.client
+        client2 = connection.client
 
         assert client1 is client2
         mock_gitlab_class.assert_called_once()
 
-    @patch("dataextractor.infrastructure.gitlab.repository.gitlab.Gitlab")
-    def test_get_all_projects_returns_project_info_list(self, mock_gitlab_class):
-        settings = self._create_settings()
-        mock_client = MagicMock()
-        mock_gitlab_class.return_value = mock_client
+    def test_session_is_shared_between_connections(self):
+        first = GitLabConnection(make_settings())
+        second = GitLabConnection(make_settings())
+
+        assert first.session is second.session
+
+    def test_session_pool_matches_concurrency(self):
+        connection = GitLabConnection(make_settings(concurrency=16))
+
+        adapter = connection.session.get_adapter("https://gitlab.example.com/api/v4/projects")
+
+        assert adapter._pool_maxsize == 16  # pylint: disable=protected-access
+
+    def test_session_mounts_response_cache(self, tmp_path):
+        connection = GitLabConnection(make_settings(http_cache=True, http_cache_dir=str(tmp_path)))
 
-        mock_project = MagicMock()
-        mock_project.id = 1
-        mock_project.name = "test-project"
-        mock_project.path_with_namespace = "group/test-project"
-        mock_project.http_url_to_repo = "https://gitlab.example.com/group/test-project.git"
-        mock_project.permissions = {"project_access": {"access_level": 30}}
-        mock_client.projects.list.return_value = [mock_project]
+        adapter = connection.session.get_adapter("https://gitlab.example.com/api/v4/projects")
 
-        repository = GitLabProjectRepository(settings)
-        projects = repository.get_all_projects()
+        assert isinstance(adapter, ApiHTTPAdapter)
+        assert adapter.cache.directory == tmp_path
+
+    def test_session_is_kept_per_cache_size(self, tmp_path):
+        small = GitLabConnection(make_settings(http_cache=True, http_cache_dir=str(tmp_path), http_cache_max_mb=1))
+        large = GitLabConnection(make_settings(http_cache=True, http_cache_dir=str(tmp_path), http_cache_max_mb=2))
+
+        assert small.session is not large.session
+
+    def test_session_routes_requests_through_scheduler(self):
+        scheduler = RequestScheduler()
+        connection = GitLabConnection(make_settings(), scheduler=scheduler)
+
+        adapter = connection.session.get_adapter("https://gitlab.example.com/api/v4/projects")
+        assert adapter.scheduler is scheduler
+        assert adapter.cache is None
+
+    def test_connections_share_scheduler_per_host(self):
+        first = GitLabConnection(make_settings())
+        second = GitLabConnection(make_settings())
+
+        assert first.scheduler is second.scheduler
+
+
+class TestGitLabProjectRepository:
+    def test_init_wraps_async_repository(self):
+        settings = make_settings()
+        scheduler = RequestScheduler()
+
+        repository = GitLabProjectRepository(settings, scheduler=scheduler)
+
+        assert repository.settings is settings
+        assert repository.scheduler is scheduler
+        assert repository.repository.scheduler is scheduler
+
+    def test_repositories_share_scheduler_per_host(self):
+        first = GitLabProjectRepository(make_settings())
+        second = GitLabProjectRepository(make_settings())
+
+        assert first.scheduler is second.scheduler
+
+    def test_get_all_projects_returns_project_info_list(self):
+        fake = FakeGitLab(total=1)
+
+        projects = _create_repository(fake).get_all_projects()
 
         assert len(projects) == 1
         assert isinstance(projects[0], ProjectInfo)
         assert projects[0].id == 1
-        assert projects[0].name == "test-project"
-        assert projects[0].path_with_namespace == "group/test-project"
-        assert projects[0].http_url == "https://gitlab.example.com/group/test-project.git"
+        assert projects[0].name == "project-1"
+        assert projects[0].path_with_namespace == "group/project-1"
+        assert projects[0].http_url == "https://gitlab.example.com/group/project-1.git"
         assert projects[0].access_level == 30
+        assert projects[0].source == ""
 
-    @patch("dataextractor.infrastructure.gitlab.repository.gitlab.Gitlab")
-    def test_get_access_level_from_project_access(self, mock_gitlab_class):
-        settings = self._create_settings()
-        mock_client = MagicMock()
-        mock_gitlab_class.return_value = mock_client
+    def test_projects_are_tagged_with_the_source(self):
+        fake = FakeGitLab(total=1)
 
-        mock_project = MagicMock()
-        mock_project.id = 1
-        mock_project.name = "test"
-        mock_project.path_with_namespace = "group/test"
-        mock_project.http_url_to_repo = "https://gitlab.example.com/group/test.git"
-        mock_project.permissions = {"project_access": {"access_level": 40}, "group_access": None}
-        mock_client.projects.list.return_value = [mock_project]
+        projects = _create_repository(fake, make_settings(source="eu")).get_all_projects()
 
-        repository = GitLabProjectRepository(settings)
-        projects = repository.get_all_projects()
+        assert projects[0].source == "eu"
 
-        assert projects[0].access_level == 40
+    @pytest.mark.parametrize(
+        ("permissions", "access_level"),
+        [
+            ({"project_access": {"access_level": 40}, "group_access": None}, 40),
+            ({"project_access": None, "group_access": {"access_level": 30}}, 30),
+            ({"project_access": None, "group_access": None}, None),
+        ],
+    )
+    def test_access_level_from_permissions(self, permissions, access_level):
+        fake = FakeGitLab()
+        fake.projects = [_project(1, permissions)]
 
-    @patch("dataextractor.infrastructure.gitlab.repository.gitlab.Gitlab")
-    def test_get_access_level_from_group_access(self, mock_gitlab_class):
-        settings = self._create_settings()
-        mock_client = MagicMock()
-        mock_gitlab_class.return_value = mock_client
+        projects = _create_repository(fake).get_all_projects()
 
-        mock_project = MagicMock()
-        mock_project.id = 1
-        mock_project.name = "test"
-        mock_project.path_with_namespace = "group/test"
-        mock_project.http_url_to_repo = "https://gitlab.example.com/group/test.git"
-        mock_project.permissions = {"project_access": None, "group_access": {"access_level": 30}}
-        mock_client.projects.list.return_value = [mock_project]
+        assert projects[0].access_level == access_level
 
-        repository = GitLabProjectRepository(settings)
-        projects = repository.get_all_projects()
+    def test_token_is_checked_once_before_listing(self):
+        fake = FakeGitLab(total=3)
+        repository = _create_repository(fake)
 
-        assert projects[0].access_level == 30
+        repository.get_all_projects()
+        repository.get_all_projects()
+
+        paths = [r.url.path for r in fake.requests]
+        assert paths[0] == "/api/v4/user"
+        assert paths.count("/api/v4/user") == 1
+
+    def test_skip_auth_lists_without_token_check(self):
+        fake = FakeGitLab(total=1)
+
+        _create_repository(fake, make_settings(skip_auth=True)).get_all_projects()
+
+        assert [r.url.path for r in fake.requests] == ["/api/v4/projects"]
+
+    def test_rejected_token_raises(self):
+        def handler(request):
+            return httpx.Response(401, json={"message": "401 Unauthorized"}, request=request)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            _create_repository(FakeGitLab(), handler=handler).get_all_projects()
+
+    def test_get_projects_changed_since_filters_by_activity(self):
+        fake = FakeGitLab(total=1)
+
+        _create_repository(fake).get_projects_changed_since("2024-01-01T00:00:00Z")
+
+        params = fake.requests[-1].url.params
+        assert params["membership"] == "true"
+        assert params["last_activity_after"] == "2024-01-01T00:00:00Z"
+
+    def test_configured_projects_record_not_found_as_unresolved(self):
+        fake = FakeGitLab(total=2)
+        repository = _create_repository(fake, make_settings(projects=["2", "group/missing"]))
+
+        assert [p.id for p in repository.get_all_projects()] == [2]
+        assert repository.get_unresolved_projects() == {"group/missing": "404: Not Found"}
+
+    def test_configured_projects_raise_other_errors(self):
+        def handler(request):
+            if request.url.path.endswith("/user"):
+                return httpx.Response(200, json={"id": 1})
+            return httpx.Response(500, request=request)
+
+        repository = _create_repository(FakeGitLab(), make_settings(projects=["group/project"]), handler)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            repository.get_all_projects()
+
+    def test_listing_closes_its_own_client(self):
+        fake = FakeGitLab(total=1)
+        repository = GitLabProjectRepository(make_settings(), scheduler=RequestScheduler())
+        repository.repository._client = httpx.AsyncClient(  # pylint: disable=protected-access
+            base_url="https://gitlab.example.com/api/v4",
+            transport=httpx.MockTransport(fake.handler),
+        )
+
+        repository.get_all_projects()
+
+        assert repository.repository._client is None  # pylint: disable=protected-access
+
+
+class TestGitLabProjectRepositoryHttpCache:
+    def _handler(self, fake):
+        def handler(request):
+            response = fake.handler(request)
+            if not request.url.path.endswith("/projects"):
+                return response
+            etag = f'"page-{request.url.params["page"]}"'
+            if request.headers.get("If-None-Match") == etag:
+                return httpx.Response(304)
+            response.headers["ETag"] = etag
+            return response
+
+        return handler
+
+    def test_unchanged_pages_come_from_cached_rows(self, tmp_path):
+        fake = FakeGitLab(total=5)
+        fake.projects = [{**p, "description": "x" * 100} for p in fake.projects]
+        settings = make_settings(http_cache=True, http_cache_dir=str(tmp_path))
+
+        first = _create_repository(fake, settings, self._handler(fake)).get_all_projects()
+        fake.requests.clear()
+        second = _create_repository(fake, settings, self._handler(fake)).get_all_projects()
+
+        assert second == first
+        assert sorted(fake.pages()) == [1, 2, 3]
+        assert all(r.headers.get("If-None-Match") for r in fake.requests if r.url.path.endswith("/projects"))
+        assert not any(b"description" in entry.read_bytes() for entry in tmp_path.glob("*.entry"))
+
+    def test_listing_without_cache_sends_no_validators(self):
+        fake = FakeGitLab(total=3)
+
+        _create_repository(fake, handler=self._handler(fake)).get_all_projects()
+
+        assert not any("If-None-Match" in r.headers for r in fake.requests)
+
+
+class TestGitLabProjectRepositoryConcurrent:
+    def _create_settings(self, concurrency=4, per_page=2):
+        return make_settings(concurrency=concurrency, per_page=per_page)
+
+    def test_concurrent_listing_matches_sequential_order(self):
+        fake = FakeGitLab(total=7)
+
+        projects = _create_repository(fake, self._create_settings()).get_all_projects()
+
+        assert [p.id for p in projects] == [1, 2, 3, 4, 5, 6, 7]
+
+    def test_concurrent_listing_requests_each_page_once(self):
+        fake = FakeGitLab(total=7)
+
+        _create_repository(fake, self._create_settings()).get_all_projects()
+
+        assert sorted(fake.pages()) == [1, 2, 3, 4]
+
+    def test_concurrent_listing_without_total_pages_probes_until_short_page(self):
+        fake = FakeGitLab(total=9, total_pages_header=False)
+
+        projects = _create_repository(fake, self._create_settings(concurrency=3)).get_all_projects()
+
+        assert [p.id for p in projects] == list(range(1, 10))
+
+    def test_concurrency_of_one_fetches_pages_in_turn(self):
+        fake = FakeGitLab(total=5)
+
+        projects = _create_repository(fake, self._create_settings(concurrency=1)).get_all_projects()
+
+        assert [p.id for p in projects] == [1, 2, 3, 4, 5]
+        assert fake.pages() == [1, 2, 3]
+
+    def test_iter_projects_yields_first_page_before_fetching_others(self):
+        fake = FakeGitLab(total=7)
+
+        projects = _create_repository(fake, self._create_settings(concurrency=2)).iter_projects()
+        first = next(projects)
+
+        assert first.id == 1
+        assert fake.pages() == [1]
+        assert [p.id for p in projects] == [2, 3, 4, 5, 6, 7]
+
+    def test_iter_projects_keeps_bounded_pages_in_flight(self):
+        fake = FakeGitLab(total=20)
+
+        projects = _create_repository(fake, self._create_settings(concurrency=2)).iter_projects()
+        for _ in range(3):
+            next(projects)
+
+        # page 1 plus the page being consumed plus one prefetched page
+        assert len(fake.pages()) <= 4
+        projects.close()
 
-    @patch("dataextractor.infrastructure.gitlab.repository.gitlab.Gitlab")
-    def test_get_access_level_none_when_no_access(self, mock_gitlab_class):
-        settings = self._create_settings()
-        mock_client = MagicMock()
-        mock_gitlab_class.return_value = mock_client
 
-        mock_project = MagicMock()
-        mock_project.id = 1
-        mock_project.name = "test"
-        mock_project.path_with_namespace = "group/test"
-        mock_project.http_url_to_repo = "https://gitlab.example.com/group/test.git"
-        mock_project.permissions = {"project_access": None, "group_access": None}
-        mock_client.projects.list.return_value = [mock_project]
+class TestGitLabProjectRepositoryLean:
+    def test_lean_listing_applies_filters_to_every_pass(self):
+        fake = FakeGitLab(total=1)
 
-        repository = GitLabProjectRepository(settings)
-        projects = repository.get_all_projects()
+        _create_repository(fake, make_settings(lean=True)).get_projects_changed_since("2024-01-01T00:00:00Z")
 
-        assert projects[0].access_level is None
+        listings = [r.url.params for r in fake.requests if r.url.path.endswith("/projects")]
+        assert sorted(int(p["min_access_level"]) for p in listings) == [10, 20, 30, 40, 50]
+        assert all(p["last_activity_after"] == "2024-01-01T00:00:00Z" for p in listings)
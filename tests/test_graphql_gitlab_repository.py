@@ -0,0 +1,141 @@
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+from gitlab.exceptions import GitlabError
+
+from dataextractor.config.settings import GitSettings, JiraSettings, OutputSettings, Settings
+from dataextractor.core.entities import ProjectInfo
+from dataextractor.infrastructure.gitlab import GraphQLGitLabProjectRepository
+from dataextractor.infrastructure.http import RequestScheduler
+
+
+def _node(project_id, access_level=30, last_activity_at="2024-01-01T00:00:00Z"):
+    return {
+        "id": f"gid://gitlab/Project/{project_id}",
+        "name": f"project-{project_id}",
+        "fullPath": f"group/project-{project_id}",
+        "httpUrlToRepo": f"https://gitlab.example.com/group/project-{project_id}.git",
+        "lastActivityAt": last_activity_at,
+        "maxAccessLevel": {"integerValue": access_level},
+        "repository": {"rootRef": "main"},
+    }
+
+
+def _response(nodes, end_cursor=None, errors=None):
+    response = MagicMock(ok=True, status_code=200)
+    body = {"data": {"projects": {
+        "pageInfo": {"hasNextPage": end_cursor is not None, "endCursor": end_cursor},
+        "nodes": nodes,
+    }}}
+    if errors:
+        body = {"data": None, "errors": errors}
+    response.json.return_value = body
+    return response
+
+
+class TestGraphQLGitLabProjectRepository:
+    def _create_repository(self, responses, **git_options):
+        settings = Settings(
+            git=GitSettings(url="https://gitlab.example.com", token="test-token", **git_options),
+            jira=JiraSettings(),
+            outputs=OutputSettings(),
+        )
+        repository = GraphQLGitLabProjectRepository(settings, scheduler=RequestScheduler())
+        session = MagicMock()
+        session.post.side_effect = responses
+        patcher = patch.object(
+            GraphQLGitLabProjectRepository, "session", new_callable=PropertyMock, return_value=session
+        )
+        patcher.start()
+        self._patchers.append(patcher)
+        return repository, session
+
+    def setup_method(self):
+        self._patchers = []  # pylint: disable=attribute-defined-outside-init
+
+    def teardown_method(self):
+        for patcher in self._patchers:
+            patcher.stop()
+
+    def test_follows_cursors_until_last_page(self):
+        repository, session = self._create_repository(
+            [_response([_node(1), _node(2)], end_cursor="c1"), _response([_node(3)])],
+            per_page=2,
+        )
+
+        projects = repository.get_all_projects()
+
+        assert [p.id for p in projects] == [1, 2, 3]
+        assert projects[0] == ProjectInfo(
+            id=1,
+            name="project-1",
+            path_with_namespace="group/project-1",
+            http_url="https://gitlab.example.com/group/project-1.git",
+            access_level=30,
+            last_activity_at="2024-01-01T00:00:00Z",
+            default_branch="main",
+        )
+        first, second = (c.kwargs["json"]["variables"] for c in session.post.call_args_list)
+        assert first == {"first": 2, "after": None, "membership": True}
+        assert second["after"] == "c1"
+        assert session.post.call_args.args[0] == "https://gitlab.example.com/api/graphql"
+        assert session.post.call_args.kwargs["headers"] == {"Authorization": "Bearer test-token"}
+
+    def test_extras_are_not_queried_by_default(self):
+        repository, session = self._create_repository([_response([_node(1)])])
+
+        repository.get_all_projects()
+
+        query = session.post.call_args.kwargs["json"]["query"]
+        assert "lastActivityAt" not in query and "rootRef" not in query
+
+    def test_extras_are_queried_when_enabled(self):
+        repository, session = self._create_repository([_response([_node(1)])], graphql_extras=True)
+
+        repository.get_all_projects()
+
+        query = session.post.call_args.kwargs["json"]["query"]
+        assert "lastActivityAt" in query and "repository { rootRef }" in query
+
+    def test_changed_since_queries_last_activity_without_extras(self):
+        repository, session = self._create_repository([_response([_node(1)])])
+
+        repository.get_projects_changed_since("2023-12-01T00:00:00.000Z")
+
+        query = session.post.call_args.kwargs["json"]["query"]
+        assert "lastActivityAt" in query and "rootRef" not in query
+
+    def test_no_access_level_maps_to_none(self):
+        repository, _ = self._create_repository([_response([_node(1, access_level=0)])])
+
+        assert repository.get_all_projects()[0].access_level is None
+
+    def test_changed_since_filters_on_last_activity(self):
+        repository, _ = self._create_repository([_response([
+            _node(1, last_activity_at="2024-01-01T00:00:00Z"),
+            _node(2, last_activity_at="2024-03-01T00:00:00Z"),
+        ])])
+
+        projects = repository.get_projects_changed_since("2024-02-01T00:00:00.000Z")
+
+        assert [p.id for p in projects] == [2]
+
+    def test_graphql_errors_raise(self):
+        repository, _ = self._create_repository([_response([], errors=[{"message": "boom"}])])
+
+        with pytest.raises(GitlabError, match="boom"):
+            repository.get_all_projects()
+
+    def test_configured_paths_and_ids_are_queried_separately(self):
+        repository, session = self._create_repository(
+            [_response([_node(1)]), _response([_node(7)])],
+            projects=["https://gitlab.example.com/group/project-1.git", "7", "group/missing"],
+        )
+
+        projects = repository.get_all_projects()
+
+        assert [p.id for p in projects] == [1, 7]
+        assert list(repository.get_unresolved_projects()) == ["group/missing"]
+        by_path, by_id = (c.kwargs["json"]["variables"] for c in session.post.call_args_list)
+        assert by_path == {"first": 100, "after": None, "fullPaths": ["group/project-1", "group/missing"]}
+        assert by_id == {"first": 100, "after": None, "ids": ["gid://gitlab/Project/7"]}
@@ -0,0 +1,113 @@
+from unittest.mock import patch
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from dataextractor.infrastructure.http import ApiHTTPAdapter, ResponseCache, shared_response_cache, token_identity
+
+
+def _response(status, body=b"", headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = body  # pylint: disable=protected-access
+    response.headers.update(headers or {})
+    return response
+
+
+def _prepared(url="https://gitlab.example.com/api/v4/projects?page=1"):
+    return requests.Request("GET", url).prepare()
+
+
+class TestResponseCache:
+    def test_put_and_get_round_trip(self, tmp_path):
+        cache = ResponseCache(tmp_path, max_bytes=1024)
+        key = cache.key("https://example.com/a", "id")
+
+        cache.put(key, '"etag-1"', {"X-Total-Pages": "3"}, b"[1, 2]")
+        cached = cache.get(key)
+
+        assert cached.etag == '"etag-1"'
+        assert cached.headers == {"X-Total-Pages": "3"}
+        assert cached.body == b"[1, 2]"
+
+    def test_key_depends_on_identity(self):
+        assert ResponseCache.key("https://example.com/a", "a") != ResponseCache.key(
+            "https://example.com/a", "b"
+        )
+
+    def test_evicts_least_recently_used_entry(self, tmp_path):
+        cache = ResponseCache(tmp_path, max_bytes=200)
+        body = b"x" * 60
+
+        cache.put("a", "1", {}, body)
+        cache.put("b", "2", {}, body)
+        cache.get("a")
+        cache.put("c", "3", {}, body)
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+        assert cache.total_bytes <= 200
+
+    def test_skips_entries_larger_than_cap(self, tmp_path):
+        cache = ResponseCache(tmp_path, max_bytes=10)
+
+        cache.put("a", "1", {}, b"x" * 100)
+
+        assert cache.get("a") is None
+
+    def test_shared_cache_is_one_per_directory(self, tmp_path):
+        first = shared_response_cache(tmp_path, max_bytes=1024)
+
+        assert shared_response_cache(tmp_path, max_bytes=1024) is first
+        assert shared_response_cache(tmp_path / "other", max_bytes=1024) is not first
+
+    def test_index_is_rebuilt_from_disk(self, tmp_path):
+        ResponseCache(tmp_path, max_bytes=1024).put("a", "1", {}, b"body")
+
+        cache = ResponseCache(tmp_path, max_bytes=1024)
+
+        assert cache.get("a").body == b"body"
+        assert cache.total_bytes > 0
+
+
+class TestApiHTTPAdapter:
+    def test_token_identity_does_not_contain_token(self):
+        identity = token_identity("secret-token")
+
+        assert "secret-token" not in identity
+        assert identity == token_identity("secret-token")
+
+    def test_stores_response_with_etag(self, tmp_path):
+        cache = ResponseCache(tmp_path, max_bytes=1024)
+        adapter = ApiHTTPAdapter(cache=cache, identity="id")
+        request = _prepared()
+
+        with patch.object(HTTPAdapter, "send", return_value=_response(200, b"[]", {"ETag": '"v1"'})):
+            adapter.send(request)
+
+        assert cache.get(cache.key(request.url, "id")).etag == '"v1"'
+
+    def test_not_modified_is_served_from_cache(self, tmp_path):
+        cache = ResponseCache(tmp_path, max_bytes=1024)
+        adapter = ApiHTTPAdapter(cache=cache, identity="id")
+        request = _prepared()
+        cache.put(cache.key(request.url, "id"), '"v1"', {"X-Total-Pages": "2"}, b"[1]")
+
+        with patch.object(HTTPAdapter, "send", return_value=_response(304)) as send:
+            response = adapter.send(request)
+
+        assert send.call_args.args[0].headers["If-None-Match"] == '"v1"'
+        assert response.status_code == 200
+        assert response.content == b"[1]"
+        assert response.headers["X-Total-Pages"] == "2"
+
+    def test_non_get_requests_bypass_cache(self, tmp_path):
+        cache = ResponseCache(tmp_path, max_bytes=1024)
+        adapter = ApiHTTPAdapter(cache=cache, identity="id")
+        request = requests.Request("POST", "https://gitlab.example.com/api/v4/x").prepare()
+
+        with patch.object(HTTPAdapter, "send", return_value=_response(200, b"{}", {"ETag": '"v1"'})):
+            adapter.send(request)
+
+        assert cache.total_bytes == 0
@@ -0,0 +1,138 @@
+import threading
+from unittest.mock import MagicMock
+
+from dataextractor.config.settings import JiraSettings, Settings
+from dataextractor.core.entities import ProjectInfo, TransitionInfo, WorklogInfo
+from dataextractor.infrastructure.jira import JiraIssueLogRepository, JiraIssueRepository, JiraProjectRepository
+
+
+def _history(history_id: int, to_status: str = "Done") -> dict:
+    return {
+        "id": str(history_id),
+        "author": {"name": "alice"},
+        "created": "2024-01-03T10:00:00.000+0000",
+        "items": [
+            {"field": "assignee", "fromString": None, "toString": "bob"},
+            {"field": "status", "fromString": "Open", "toString": to_status},
+        ],
+    }
+
+
+def _worklog(worklog_id: int) -> dict:
+    return {
+        "id": str(worklog_id),
+        "author": {"accountId": "abc"},
+        "started": "2024-01-03T09:00:00.000+0000",
+        "timeSpentSeconds": 3600,
+        "created": "2024-01-03T10:00:00.000+0000",
+        "updated": "2024-01-03T10:00:00.000+0000",
+    }
+
+
+def _issue(number: int, histories: list[dict], worklogs: list[dict], changelog_total=None, worklog_total=None):
+    return {
+        "id": str(number),
+        "key": f"APP-{number}",
+        "changelog": {"histories": histories, "total": changelog_total or len(histories)},
+        "fields": {"worklog": {"worklogs": worklogs, "total": worklog_total or len(worklogs)}},
+    }
+
+
+class FakeJira:
+    """Search results with embedded histories plus the per-issue endpoints."""
+
+    def __init__(self, issues: list[dict], changelogs=None, worklogs=None):
+        self.issues = issues
+        self.changelogs = changelogs or {}
+        self.worklogs = worklogs or {}
+        self.searches: list[dict] = []
+        self.history_requests: list[tuple[str, int]] = []
+        self.lock = threading.Lock()
+
+    def __call__(self, method, path, **kwargs):
+        if path == "/search":
+            self.searches.append(kwargs["json"])
+            start = kwargs["json"]["startAt"]
+            return {"startAt": start, "maxResults": 2, "total": len(self.issues), "issues": self.issues[start:start + 2]}
+        start, size = kwargs["params"]["startAt"], kwargs["params"]["maxResults"]
+        with self.lock:
+            self.history_requests.append((path, start))
+        key = path.split("/")[2]
+        if path.endswith("/changelog"):
+            values = self.changelogs[key]
+            return {"startAt": start, "total": len(values), "values": values[start:start + size]}
+        values = self.worklogs[key]
+        return {"startAt": start, "total": len(values), "worklogs": values[start:start + size]}
+
+
+class TestJiraIssueLogRepository:
+    def _repository(self, jira: FakeJira) -> JiraIssueLogRepository:
+        projects = JiraProjectRepository(
+            Settings(jira=JiraSettings(url="https://jira.example.com", token="t", page_size=2, concurrency=2))
+        )
+        projects.request = MagicMock(side_effect=jira)
+        return JiraIssueLogRepository(JiraIssueRepository(projects))
+
+    def _projects(self):
+        return [ProjectInfo(id=1, name="App", path_with_namespace="APP", http_url="")]
+
+    def test_reads_embedded_histories_from_search_pages(self):
+        jira = FakeJira([_issue(1, [_history(11)], [_worklog(21)]), _issue(2, [], [])])
+
+        rows = list(self._repository(jira).iter_logs(self._projects()))
+
+        assert rows == [
+            TransitionInfo(
+                issue_id=1,
+                issue_key="APP-1",
+                history_id=11,
+                created="2024-01-03T10:00:00.000+0000",
+                from_status="Open",
+                to_status="Done",
+                author="alice",
+            ),
+            WorklogInfo(
+                id=21,
+                issue_id=1,
+                issue_key="APP-1",
+                started="2024-01-03T09:00:00.000+0000",
+                time_spent_seconds=3600,
+                created="2024-01-03T10:00:00.000+0000",
+                updated="2024-01-03T10:00:00.000+0000",
+                author="abc",
+            ),
+        ]
+        assert jira.searches[0]["expand"] == ["changelog"]
+        assert jira.searches[0]["fields"] == ["worklog"]
+        assert not jira.history_requests
+
+    def test_truncated_histories_are_paged_per_issue(self):
+        changelog = [_history(n) for n in range(250)]
+        worklogs = [_worklog(n) for n in range(30)]
+        jira = FakeJira(
+            [
+                _issue(1, changelog[:100], worklogs[:20], changelog_total=250, worklog_total=30),
+                _issue(2, [_history(999)], []),
+                _issue(3, [], []),
+            ],
+            changelogs={"APP-1": changelog},
+            worklogs={"APP-1": worklogs},
+        )
+
+        rows = list(self._repository(jira).iter_logs(self._projects()))
+
+        transitions = [r for r in rows if isinstance(r, TransitionInfo)]
+        assert sorted(t.history_id for t in transitions) == [*range(250), 999]
+        assert len([r for r in rows if isinstance(r, WorklogInfo)]) == 30
+        assert sorted(jira.history_requests) == [
+            ("/issue/APP-1/changelog", 0),
+            ("/issue/APP-1/changelog", 100),
+            ("/issue/APP-1/changelog", 200),
+            ("/issue/APP-1/worklog", 0),
+        ]
+
+    def test_no_projects_no_requests(self):
+        jira = FakeJira([])
+
+        assert not list(self._repository(jira).iter_logs([]))
+        assert not jira.searches
@@ -0,0 +1,288 @@
+import threading
+from unittest.mock import MagicMock, patch
+from zoneinfo import ZoneInfo
+
+import pytest
+import requests
+
+from dataextractor.config.settings import JiraSettings, Settings
+from dataextractor.core.entities import IssueInfo, ProjectInfo
+from dataextractor.infrastructure.jira import JiraIssueRepository, JiraProjectRepository
+from dataextractor.infrastructure.jira.issues import SEARCH_FIELDS
+
+
+def _settings(**jira) -> Settings:
+    return Settings(jira=JiraSettings(url="https://jira.example.com/", token="jira-token", **jira))
+
+
+def _issue(number: int, project: str = "APP") -> dict:
+    return {
+        "id": str(10000 + number),
+        "key": f"{project}-{number}",
+        "fields": {
+            "project": {"key": project},
+            "summary": f"Issue {number}",
+            "issuetype": {"name": "Bug"},
+            "status": {"name": "Open"},
+            "priority": {"name": "High"},
+            "assignee": {"name": "alice"},
+            "reporter": {"accountId": "5b10ac8d82e05b22cc7d4ef5"},
+            "created": "2024-01-01T10:00:00.000+0000",
+            "updated": "2024-01-02T10:00:00.000+0000",
+            "resolutiondate": None,
+            "labels": ["backend"],
+        },
+    }
+
+
+class FakeSearch:
+    """Answers search requests from a fixed list of issues, capping page sizes."""
+
+    def __init__(self, total: int, max_results: int = 100):
+        self.issues = [_issue(n) for n in range(total)]
+        self.max_results = max_results
+        self.offsets: list[int] = []
+        self.lock = threading.Lock()
+
+    def __call__(self, method, path, **kwargs):
+        assert (method, path) == ("POST", "/search")
+        body = kwargs["json"]
+        with self.lock:
+            self.offsets.append(body["startAt"])
+        size = min(body["maxResults"], self.max_results)
+        start = body["startAt"]
+        return {
+            "startAt": start,
+            "maxResults": size,
+            "total": len(self.issues),
+            "issues": self.issues[start:start + size],
+        }
+
+
+class TestJiraProjectRepository:
+    def test_request_sends_bearer_token_to_api_path(self):
+        repository = JiraProjectRepository(_settings())
+        session = MagicMock()
+        session.headers = {}
+        session.request.return_value.json.return_value = []
+
+        with patch("dataextractor.infrastructure.jira.repository.shared_session", return_value=session):
+            repository.request("GET", "/project")
+
+        session.request.assert_called_once_with("GET", "https://jira.example.com/rest/api/2/project", timeout=30)
+        assert session.headers["Authorization"] == "Bearer jira-token"
+
+    def test_request_raises_on_http_errors(self):
+        repository = JiraProjectRepository(_settings())
+        session = MagicMock()
+        session.headers = {}
+        session.request.return_value.raise_for_status.side_effect = requests.HTTPError("401")
+
+        with patch("dataextractor.infrastructure.jira.repository.shared_session", return_value=session):
+            with pytest.raises(requests.HTTPError):
+                repository.request("GET", "/project")
+
+    def test_get_all_projects(self):
+        repository = JiraProjectRepository(_settings())
+        repository.request = MagicMock(return_value=[{"id": "10000", "key": "APP", "name": "Application"}])
+
+        projects = repository.get_all_projects()
+
+        assert projects == [
+            ProjectInfo(
+                id=10000,
+                name="Application",
+                path_with_namespace="APP",
+                http_url="https://jira.example.com/browse/APP",
+            )
+        ]
+
+    def test_time_zone_comes_from_the_token_user(self):
+        repository = JiraProjectRepository(_settings())
+        repository.request = MagicMock(return_value={"timeZone": "America/New_York"})
+
+        assert repository.time_zone == ZoneInfo("America/New_York")
+        assert repository.time_zone == ZoneInfo("America/New_York")
+        repository.request.assert_called_once_with("GET", "/myself")
+
+    def test_unknown_time_zone_falls_back_to_utc(self):
+        repository = JiraProjectRepository(_settings())
+        repository.request = MagicMock(return_value={"timeZone": "Nowhere/Special"})
+
+        assert repository.time_zone == ZoneInfo("UTC")
+
+
+class TestJiraIssueRepository:
+    def _repository(self, search: FakeSearch, **jira) -> JiraIssueRepository:
+        projects = JiraProjectRepository(_settings(**jira))
+        projects.request = MagicMock(side_effect=search)
+        return JiraIssueRepository(projects)
+
+    def _projects(self, *keys: str) -> list[ProjectInfo]:
+        return [ProjectInfo(id=n, name=k, path_with_namespace=k, http_url="") for n, k in enumerate(keys)]
+
+    def test_converts_issues(self):
+        repository = self._repository(FakeSearch(total=1))
+
+        issues = list(repository.iter_issues(self._projects("APP")))
+
+        assert issues == [
+            IssueInfo(
+                id=10000,
+                key="APP-0",
+                project_key="APP",
+                summary="Issue 0",
+                issue_type="Bug",
+                status="Open",
+                created="2024-01-01T10:00:00.000+0000",
+                updated="2024-01-02T10:00:00.000+0000",
+                priority="High",
+                assignee="alice",
+                reporter="5b10ac8d82e05b22cc7d4ef5",
+                resolved=None,
+                labels=("backend",),
+            )
+        ]
+
+    def test_search_jql_names_every_project_in_a_stable_order(self):
+        search = FakeSearch(total=0)
+        repository = self._repository(search)
+
+        list(repository.iter_issues(self._projects("APP", 'we"ird')))
+
+        body = repository.projects.request.call_args.kwargs["json"]
+        assert body["jql"] == 'project in ("APP", "we\\"ird") ORDER BY created ASC, key ASC'
+        assert "summary" in body["fields"]
+
+    def test_no_projects_no_requests(self):
+        repository = self._repository(FakeSearch(total=3))
+
+        assert not list(repository.iter_issues([]))
+        repository.projects.request.assert_not_called()
+
+    def test_fetches_remaining_offsets_concurrently_in_order(self):
+        search = FakeSearch(total=1050)
+        repository = self._repository(search, page_size=100, concurrency=4)
+
+        issues = list(repository.iter_issues(self._projects("APP")))
+
+        assert [i.key for i in issues] == [f"APP-{n}" for n in range(1050)]
+        assert sorted(search.offsets) == list(range(0, 1100, 100))
+
+    def test_pages_by_the_size_jira_returns(self):
+        # The server caps maxResults below what was asked for
+        search = FakeSearch(total=120, max_results=50)
+        repository = self._repository(search, page_size=100, concurrency=2)
+
+        issues = list(repository.iter_issues(self._projects("APP")))
+
+        assert len(issues) == 120
+        assert sorted(search.offsets) == [0, 50, 100]
+
+    def test_empty_search_makes_one_request(self):
+        search = FakeSearch(total=0)
+        repository = self._repository(search, concurrency=4)
+
+        assert not list(repository.iter_issues(self._projects("APP")))
+        assert search.offsets == [0]
+
+    def test_since_filters_projects_in_the_users_time_zone(self):
+        repository = self._repository(FakeSearch(total=0))
+        repository.projects.time_zone = ZoneInfo("America/New_York")
+
+        jql = repository.project_filter(
+            self._projects("APP", "WEB", "NEW"),
+            {"APP": "2024-01-05T15:30:45+00:00", "WEB": "2024-01-05T15:30:45+00:00"},
+        )
+
+        assert jql == (
+            '((project in ("APP", "WEB") AND updated >= "2024/01/05 10:30") OR project in ("NEW"))'
+        )
+
+    def test_without_since_one_clause_covers_all_projects(self):
+        repository = self._repository(FakeSearch(total=0))
+
+        assert repository.project_filter(self._projects("APP", "WEB"), {}) == 'project in ("APP", "WEB")'
+
+
+FIELD_CATALOG = [
+    {"id": "summary", "name": "Summary"},
+    {"id": "customfield_10002", "name": "Story Points"},
+    {"id": "customfield_10010", "name": "Sprint"},
+    {"id": "customfield_10020", "name": "Team"},
+]
+
+
+class TestJiraFieldProjection:
+    def _repository(self, tmp_path, fields, search=None, catalog=None):
+        settings = _settings(fields=fields, state_dir=str(tmp_path))
+        projects = JiraProjectRepository(settings)
+        search = search or FakeSearch(total=0)
+
+        def request(method, path, **kwargs):
+            if path == "/field":
+                return FIELD_CATALOG if catalog is None else catalog
+            return search(method, path, **kwargs)
+
+        projects.request = MagicMock(side_effect=request)
+        return JiraIssueRepository(projects)
+
+    def _field_requests(self, repository):
+        return [c for c in repository.projects.request.call_args_list if c.args[1] == "/field"]
+
+    def test_requests_only_the_configured_fields(self, tmp_path):
+        repository = self._repository(tmp_path, ["story points", "customfield_10010", "Nope"])
+
+        list(repository.iter_issues([ProjectInfo(id=1, name="", path_with_namespace="APP", http_url="")]))
+
+        body = repository.projects.request.call_args.kwargs["json"]
+        assert body["fields"][-2:] == ["customfield_10002", "customfield_10010"]
+        assert "*all" not in body["fields"]
+        assert repository.get_unresolved_fields() == ["Nope"]
+
+    def test_field_values_are_stored_by_configured_name(self, tmp_path):
+        search = FakeSearch(total=1)
+        search.issues[0]["fields"]["customfield_10002"] = 5.0
+        search.issues[0]["fields"]["customfield_10020"] = {"self": "https://jira/option/1", "value": "Core", "id": "1"}
+        repository = self._repository(tmp_path, ["Story Points", "Team"], search)
+
+        issues = list(repository.iter_issues([ProjectInfo(id=1, name="", path_with_namespace="APP", http_url="")]))
+
+        assert issues[0].custom_fields == {"Story Points": 5.0, "Team": "Core"}
+
+    def test_warm_runs_read_the_mapping_from_disk(self, tmp_path):
+        cold = self._repository(tmp_path, ["Story Points"])
+        assert cold.custom_fields == {"Story Points": "customfield_10002"}
+
+        warm = self._repository(tmp_path, ["Story Points"])
+
+        assert warm.custom_fields == {"Story Points": "customfield_10002"}
+        assert len(self._field_requests(cold)) == 1
+        assert not self._field_requests(warm)
+
+    def test_field_created_since_the_cache_was_written_triggers_a_refresh(self, tmp_path):
+        # No "Team" field yet
+        assert self._repository(tmp_path, ["Story Points"], catalog=FIELD_CATALOG[:-1]).custom_fields
+
+        repository = self._repository(tmp_path, ["Story Points", "Team"])
+
+        assert repository.custom_fields == {"Story Points": "customfield_10002", "Team": "customfield_10020"}
+        assert len(self._field_requests(repository)) == 1
+
+    def test_unresolved_names_are_cached_until_the_ttl_expires(self, tmp_path):
+        cold = self._repository(tmp_path, ["Story Points", "Nope"])
+        assert cold.custom_fields == {"Story Points": "customfield_10002"}
+
+        warm = self._repository(tmp_path, ["Story Points", "Nope"])
+
+        assert warm.custom_fields == {"Story Points": "customfield_10002"}
+        assert warm.get_unresolved_fields() == ["Nope"]
+        assert not self._field_requests(warm)
+
+    def test_without_configured_fields_nothing_is_looked_up(self, tmp_path):
+        repository = self._repository(tmp_path, [])
+
+        list(repository.iter_issues([ProjectInfo(id=1, name="", path_with_namespace="APP", http_url="")]))
+
+        assert not self._field_requests(repository)
+        assert repository.projects.request.call_args.kwargs["json"]["fields"] == list(SEARCH_FIELDS)
@@ -0,0 +1,129 @@
+from unittest.mock import patch
+
+from dataextractor.core.entities import ProjectInfo, ProjectSnapshot
+from dataextractor.core.interfaces import ProjectRepository, SyncResult
+from dataextractor.core.use_cases import SyncProjectsUseCase
+from dataextractor.infrastructure.output import SqliteSink
+from dataextractor.infrastructure.state import JsonMetadataCache, JsonProjectStateStore, JsonWatermarkStore
+from tests.conftest import make_project
+
+CATALOG = [make_project(i) for i in range(1, 6)]
+
+
+class AllowlistRepository(ProjectRepository):
+    """The catalog, or its allowlisted part; nothing changes between runs."""
+
+    def __init__(self, allowlist):
+        self.allowlist = allowlist
+
+    def get_all_projects(self):
+        return [p for p in CATALOG if not self.allowlist or str(p.id) in self.allowlist]
+
+    def get_projects_changed_since(self, since):
+        return []
+
+
+class TestJsonProjectStateStore:
+    def test_load_returns_none_without_state(self, tmp_path):
+        store = JsonProjectStateStore(tmp_path, "https://gitlab.example.com")
+
+        assert store.load() is None
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        store = JsonProjectStateStore(tmp_path / "state", "https://gitlab.example.com")
+        snapshot = ProjectSnapshot(
+            watermark="2024-01-01T10:00:00.000Z",
+            projects=[
+                ProjectInfo(
+                    id=1,
+                    name="test",
+                    path_with_namespace="group/test",
+                    http_url="https://gitlab.example.com/group/test.git",
+                    access_level=30,
+                    last_activity_at="2024-01-01T10:00:00.000Z",
+                ),
+            ],
+        )
+
+        store.save(snapshot)
+
+        assert store.load() == snapshot
+
+    def test_state_is_kept_per_instance(self, tmp_path):
+        first = JsonProjectStateStore(tmp_path, "https://gitlab-a.example.com")
+        second = JsonProjectStateStore(tmp_path, "https://gitlab-b.example.com/")
+
+        first.save(ProjectSnapshot(watermark="2024-01-01T10:00:00.000Z"))
+
+        assert first.path != second.path
+        assert second.load() is None
+
+    def test_state_is_kept_per_scope(self, tmp_path):
+        full = JsonProjectStateStore(tmp_path, "https://gitlab.example.com", ["token"])
+        allowlisted = JsonProjectStateStore(tmp_path, "https://gitlab.example.com", ["token", "2"])
+
+        full.save(ProjectSnapshot(watermark="2024-01-01T10:00:00.000Z"))
+
+        assert full.path != allowlisted.path
+        assert allowlisted.load() is None
+
+
+class TestIncrementalScopes:
+    def _sync(self, tmp_path, allowlist):
+        store = JsonProjectStateStore(tmp_path, "https://gitlab.example.com", ["token", *allowlist])
+        return SyncProjectsUseCase(AllowlistRepository(allowlist), store).execute()
+
+    def test_allowlisted_run_after_full_run_lists_only_the_allowlist(self, tmp_path):
+        self._sync(tmp_path, [])
+
+        assert [p.id for p in self._sync(tmp_path, ["2"])] == [2]
+
+    def test_full_run_after_allowlisted_run_lists_the_whole_catalog(self, tmp_path):
+        with SqliteSink(tmp_path / "out.db") as sink:
+            sink.sync("git_data", CATALOG)
+        self._sync(tmp_path, ["2"])
+
+        projects = self._sync(tmp_path, [])
+        with SqliteSink(tmp_path / "out.db") as sink:
+            result = sink.sync("git_data", projects)
+
+        assert projects == CATALOG
+        assert result == SyncResult(unchanged=5)
+
+
+class TestJsonWatermarkStore:
+    def test_load_returns_empty_without_state(self, tmp_path):
+        store = JsonWatermarkStore(tmp_path, "https://gitlab.example.com", "commits")
+
+        assert store.load() == {}
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        store = JsonWatermarkStore(tmp_path / "state", "https://gitlab.example.com", "commits")
+
+        store.save({"1": "2024-01-01T10:00:00Z"})
+
+        assert store.path.name.startswith("commits-")
+        assert store.load() == {"1": "2024-01-01T10:00:00Z"}
+
+
+class TestJsonMetadataCache:
+    def test_load_returns_none_without_cache(self, tmp_path):
+        cache = JsonMetadataCache(tmp_path, "https://jira.example.com", "fields", ttl=60)
+
+        assert cache.load() is None
+
+    def test_fresh_cache_is_returned(self, tmp_path):
+        cache = JsonMetadataCache(tmp_path / "state", "https://jira.example.com", "fields", ttl=60)
+
+        cache.save({"story points": "customfield_10002"})
+
+        assert cache.path.name.startswith("fields-")
+        assert cache.load() == {"story points": "customfield_10002"}
+
+    def test_stale_cache_is_ignored(self, tmp_path):
+        cache = JsonMetadataCache(tmp_path, "https://jira.example.com", "fields", ttl=60)
+        with patch("dataextractor.infrastructure.state.json_store.time.time", return_value=1000.0):
+            cache.save({"a": "b"})
+
+        with patch("dataextractor.infrastructure.state.json_store.time.time", return_value=1061.0):
+            assert cache.load() is None
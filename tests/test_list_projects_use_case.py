@@ -1,6 +1,8 @@
+import asyncio
+
 from dataextractor.core.entities import ProjectInfo
-from dataextractor.core.interfaces import ProjectRepository
-from dataextractor.core.use_cases import ListProjectsUseCase
+from dataextractor.core.interfaces import AsyncProjectRepository, ProjectRepository
+from dataextractor.core.use_cases import AsyncListProjectsUseCase, ListProjectsUseCase
 
 
 class MockProjectRepository(ProjectRepository):
@@ -11,6 +13,14 @@ class MockProjectRepository(ProjectRepository):
         return self._projects
 
 
+class MockAsyncProjectRepository(AsyncProjectRepository):
+    def __init__(self, projects: list[ProjectInfo]):
+        self._projects = projects
+
+    async def get_all_projects(self) -> list[ProjectInfo]:
+        return self._projects
+
+
 class TestListProjectsUseCase:
     def test_execute_returns_projects_from_repository(self):
         projects = [
@@ -46,8 +56,56 @@ class TestListProjectsUseCase:
         assert not result
         assert len(result) == 0
 
+    def test_iter_projects_yields_repository_projects(self):
+        projects = [
+            ProjectInfo(
+                id=1,
+                name="project-1",
+                path_with_namespace="group/project-1",
+                http_url="https://gitlab.com/group/project-1.git",
+            ),
+        ]
+        use_case = ListProjectsUseCase(MockProjectRepository(projects))
+
+        assert list(use_case.iter_projects()) == projects
+
+    def test_pipeline_yields_every_project_in_batches(self):
+        projects = [
+            ProjectInfo(
+                id=i,
+                name=f"project-{i}",
+                path_with_namespace=f"group/project-{i}",
+                http_url=f"https://gitlab.com/group/project-{i}.git",
+            )
+            for i in range(5)
+        ]
+        use_case = ListProjectsUseCase(MockProjectRepository(projects))
+
+        pipeline = use_case.pipeline(batch_size=2)
+
+        assert [len(b) for b in pipeline] == [2, 2, 1]
+        assert [m.items for m in pipeline.metrics()] == [5, 5, 5]
+
     def test_use_case_stores_repository(self):
         repository = MockProjectRepository([])
         use_case = ListProjectsUseCase(repository)
 
         assert use_case.repository is repository
+
+
+class TestAsyncListProjectsUseCase:
+    def test_execute_awaits_repository(self):
+        projects = [
+            ProjectInfo(
+                id=1,
+                name="project-1",
+                path_with_namespace="group/project-1",
+                http_url="https://gitlab.com/group/project-1.git",
+                access_level=30,
+            ),
+        ]
+        use_case = AsyncListProjectsUseCase(MockAsyncProjectRepository(projects))
+
+        result = asyncio.run(use_case.execute())
+
+        assert result == projects
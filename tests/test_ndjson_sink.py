@@ -0,0 +1,71 @@
+import gzip
+import json
+
+import pytest
+
+from dataextractor.config.settings import OutputSettings
+from dataextractor.infrastructure.output import NdjsonSink, create_sink, writes_rows_to_stdout
+from tests.conftest import make_project
+
+
+class TestNdjsonSink:
+    def test_writes_one_object_per_line(self, tmp_path):
+        path = tmp_path / "projects.ndjson"
+
+        with NdjsonSink(path) as sink:
+            sink.write("git_data", [make_project(1), make_project(2)])
+            sink.write("git_data", [make_project(3)])
+
+        records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        assert [r["id"] for r in records] == [1, 2, 3]
+        assert records[0]["path_with_namespace"] == "group/project-1"
+        assert records[0]["default_branch"] is None
+
+    def test_each_line_names_its_table(self, tmp_path):
+        path = tmp_path / "out.ndjson"
+
+        with NdjsonSink(path) as sink:
+            sink.write("git_data", [make_project(1)])
+            sink.write("jira_data", [make_project(2)])
+
+        records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        assert [(r["table"], r["id"]) for r in records] == [("git_data", 1), ("jira_data", 2)]
+
+    def test_gzip_compression(self, tmp_path):
+        path = tmp_path / "projects.ndjson.gz"
+
+        with NdjsonSink(path, compression="gzip") as sink:
+            sink.write("git_data", [make_project(1)])
+
+        assert json.loads(gzip.decompress(path.read_bytes()))["id"] == 1
+
+    def test_zstd_compression(self, tmp_path):
+        zstandard = pytest.importorskip("zstandard")
+        path = tmp_path / "projects.ndjson.zst"
+
+        with NdjsonSink(path, compression="zstd") as sink:
+            sink.write("git_data", [make_project(1), make_project(2)])
+
+        with zstandard.ZstdDecompressor().stream_reader(path.open("rb")) as reader:
+            assert len(reader.read().splitlines()) == 2
+
+    def test_streams_each_batch_to_stdout(self, capfd):
+        sink = NdjsonSink()
+
+        sink.write("git_data", [make_project(1)])
+
+        assert json.loads(capfd.readouterr().out)["id"] == 1
+        sink.close()
+
+    def test_unknown_compression_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="brotli"):
+            NdjsonSink(tmp_path / "out.ndjson", compression="brotli")
+
+    def test_factory_streams_to_stdout_without_db_url(self):
+        outputs = OutputSettings(type="ndjson")
+
+        assert writes_rows_to_stdout(outputs)
+        sink = create_sink(outputs)
+        assert isinstance(sink, NdjsonSink) and sink.to_stdout
+        sink.close()
+        assert not writes_rows_to_stdout(OutputSettings(type="ndjson", db_url="out.ndjson"))
@@ -0,0 +1,118 @@
+import threading
+import time
+
+import pytest
+
+from dataextractor.core.use_cases import Pipeline, Stage
+from dataextractor.core.use_cases.pipeline import batched, merge
+
+
+def _double(batch):
+    return [n * 2 for n in batch]
+
+
+class TestPipeline:
+    def test_batches_pass_through_stages_in_order(self):
+        pipeline = Pipeline(batched(range(7), 3), [Stage("double", _double)])
+
+        assert list(pipeline) == [[0, 2, 4], [6, 8, 10], [12]]
+
+    def test_several_workers_process_every_batch(self):
+        pipeline = Pipeline(
+            batched(range(100), 5),
+            [Stage("double", _double, workers=4), Stage("negate", lambda b: [-n for n in b], workers=3)],
+        )
+
+        assert sorted(pipeline.iter_items()) == sorted(-n * 2 for n in range(100))
+
+    def test_slow_sink_blocks_the_source(self):
+        produced = []
+
+        def source():
+            for n in range(100):
+                produced.append(n)
+                yield [n]
+
+        pipeline = Pipeline(source(), [Stage("double", _double)], queue_size=1)
+        batches = iter(pipeline)
+        next(batches)
+        time.sleep(0.3)
+
+        # One batch in each queue, one held by each thread, one being consumed
+        assert len(produced) <= 6
+        batches.close()
+
+    def test_stage_error_is_raised_and_stops_the_source(self):
+        closed = threading.Event()
+
+        def source():
+            try:
+                n = 0
+                while True:
+                    yield [n]
+                    n += 1
+            finally:
+                closed.set()
+
+        def fail_on_three(batch):
+            if batch[0] == 3:
+                raise ValueError("bad record")
+            return batch
+
+        with pytest.raises(ValueError, match="bad record"):
+            list(Pipeline(source(), [Stage("check", fail_on_three)]))
+        assert closed.is_set()
+
+    def test_stopping_early_closes_the_source(self):
+        closed = threading.Event()
+
+        def source():
+            try:
+                yield from ([n] for n in range(1000))
+            finally:
+                closed.set()
+
+        batches = iter(Pipeline(source(), [Stage("double", _double)]))
+        next(batches)
+        batches.close()
+
+        assert closed.is_set()
+
+    def test_metrics_count_items_per_stage(self):
+        pipeline = Pipeline(batched(range(10), 4), [Stage("double", _double, workers=2)], queue_size=2)
+
+        list(pipeline)
+
+        metrics = pipeline.metrics()
+        assert [m.name for m in metrics] == ["fetch", "double", "sink"]
+        assert [m.items for m in metrics] == [10, 10, 10]
+        assert [m.batches for m in metrics] == [3, 3, 3]
+        assert metrics[1].workers == 2
+        assert all(m.max_queue_depth <= 2 for m in metrics)
+        assert pipeline.elapsed > 0
+
+
+class TestMerge:
+    def test_sources_are_drained_concurrently(self):
+        def slow(name):
+            for n in range(3):
+                time.sleep(0.1)
+                yield (name, n)
+
+        started = time.perf_counter()
+        items = list(merge([slow("a"), slow("b"), slow("c")]))
+
+        assert sorted(items) == sorted((name, n) for name in "abc" for n in range(3))
+        # Three sources of 0.3s each take about as long as one
+        assert time.perf_counter() - started < 0.6
+
+    def test_error_in_one_source_is_raised(self):
+        def broken():
+            yield 1
+            raise ConnectionError("instance down")
+
+        with pytest.raises(ConnectionError, match="instance down"):
+            list(merge([iter(range(1000)), broken()], queue_size=1))
+
+    def test_single_source_is_passed_through(self):
+        assert list(merge([iter([1, 2, 3])])) == [1, 2, 3]
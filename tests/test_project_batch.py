@@ -0,0 +1,56 @@
+from dataextractor.core.entities import ProjectBatch, ProjectInfo
+
+
+def _project(project_id, path, access_level=30, source=""):
+    return ProjectInfo(
+        id=project_id,
+        name=path.rpartition("/")[2],
+        path_with_namespace=path,
+        http_url=f"https://gitlab.com/{path}.git",
+        access_level=access_level,
+        source=source,
+    )
+
+
+class TestProjectBatch:
+    def test_round_trips_projects(self):
+        projects = [
+            _project(1, "group/a"),
+            _project(2, "group/sub/b", access_level=None),
+            _project(3, "c", access_level=50),
+        ]
+
+        batch = ProjectBatch.from_projects(projects)
+
+        assert len(batch) == 3
+        assert list(batch) == projects
+
+    def test_round_trips_sources(self):
+        projects = [_project(1, "g/a", source="gitlab-a"), _project(2, "g/b", source="gitlab-b")]
+
+        batch = ProjectBatch.from_projects(projects)
+
+        assert batch[0] == projects[0]
+        assert list(batch) == projects
+        assert batch.sources == ["gitlab-a", "gitlab-b"]
+
+    def test_ids_and_access_levels_are_columnar(self):
+        batch = ProjectBatch.from_projects([_project(1, "g/a", 30), _project(2, "g/b", None)])
+
+        assert list(batch.ids) == [1, 2]
+        assert list(batch.access_levels) == [30, 0]
+
+    def test_namespaces_are_stored_once(self):
+        batch = ProjectBatch.from_projects(
+            [_project(i, f"group/sub/project-{i}") for i in range(100)]
+        )
+
+        assert batch.namespaces == ["group/sub"]
+        assert set(batch.namespace_codes) == {0}
+        assert batch.path_with_namespace(42) == "group/sub/project-42"
+
+    def test_index_access(self):
+        batch = ProjectBatch.from_projects([_project(7, "group/x", 40)])
+
+        assert batch[0].id == 7
+        assert batch[0].access_level_name == "Maintainer"
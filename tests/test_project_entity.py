@@ -1,3 +1,5 @@
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from dataextractor.core.entities import ProjectInfo
@@ -71,3 +73,34 @@ class TestProjectInfo:
         )
 
         assert project.access_level_name == "Unknown (99)"
+
+    def test_project_info_is_frozen(self):
+        project = ProjectInfo(
+            id=1,
+            name="test",
+            path_with_namespace="group/test",
+            http_url="https://gitlab.com/group/test.git",
+        )
+
+        with pytest.raises(FrozenInstanceError):
+            project.access_level = 30  # type: ignore[misc]
+
+    def test_project_info_has_no_instance_dict(self):
+        project = ProjectInfo(
+            id=1,
+            name="test",
+            path_with_namespace="group/test",
+            http_url="https://gitlab.com/group/test.git",
+        )
+
+        assert not hasattr(project, "__dict__")
+
+    def test_namespace(self):
+        project = ProjectInfo(
+            id=1,
+            name="test",
+            path_with_namespace="group/subgroup/test",
+            http_url="https://gitlab.com/group/subgroup/test.git",
+        )
+
+        assert project.namespace == "group/subgroup"
@@ -0,0 +1,28 @@
+import pytest
+
+from dataextractor.infrastructure.gitlab.references import project_reference
+
+
+class TestProjectReference:
+    @pytest.mark.parametrize(
+        "entry, expected",
+        [
+            ("42", 42),
+            ("group/sub/project", "group/sub/project"),
+            ("/group/project/", "group/project"),
+            ("https://gitlab.example.com/group/project", "group/project"),
+            ("https://gitlab.example.com/group/project.git", "group/project"),
+            ("https://gitlab.example.com/group/project/-/tree/main", "group/project"),
+            ("git@gitlab.example.com:group/sub/project.git", "group/sub/project"),
+            ("ssh://git@gitlab.example.com:2222/group/project.git", "group/project"),
+        ],
+    )
+    def test_parses_supported_forms(self, entry, expected):
+        assert project_reference(entry, "https://gitlab.example.com") == expected
+
+    def test_strips_base_url_path_prefix(self):
+        reference = project_reference(
+            "https://example.com/gitlab/group/project.git", "https://example.com/gitlab/"
+        )
+
+        assert reference == "group/project"
@@ -0,0 +1,170 @@
+import io
+import math
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from dataextractor.infrastructure.http import ApiHTTPAdapter, RequestScheduler, shared_scheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _response(status, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = b"[]"  # pylint: disable=protected-access
+    response.raw = io.BytesIO()
+    response.headers.update(headers or {})
+    return response
+
+
+class TestRequestScheduler:
+    def test_unbounded_by_default(self):
+        scheduler = RequestScheduler()
+
+        assert math.isinf(scheduler.current_rate)
+        assert all(scheduler.try_acquire() == 0 for _ in range(100))
+
+    def test_token_bucket_spaces_requests_at_max_rate(self):
+        clock = FakeClock()
+        scheduler = RequestScheduler(max_rate=2.0, clock=clock)
+
+        assert scheduler.try_acquire() == 0
+        assert scheduler.try_acquire() == 0.5
+
+        clock.now = 0.5
+
+        assert scheduler.try_acquire() == 0
+        assert scheduler.metrics().requests == 2
+
+    def test_tokens_refill_over_time(self):
+        clock = FakeClock()
+        scheduler = RequestScheduler(max_rate=2.0, clock=clock)
+        scheduler.try_acquire()
+        scheduler.try_acquire()
+
+        clock.now = 10.0
+
+        assert scheduler.try_acquire() == 0
+
+    def test_waiters_pick_up_a_raised_rate(self):
+        clock = FakeClock()
+        scheduler = RequestScheduler(max_rate=10.0, clock=clock)
+        scheduler.observe(429, {"Retry-After": "0"})
+        scheduler.try_acquire()
+        slow_wait = scheduler.try_acquire()
+
+        scheduler.observe(200, {"RateLimit-Remaining": "100", "RateLimit-Reset": str(time.time() + 10)})
+
+        assert scheduler.try_acquire() < slow_wait
+
+    def test_exhausted_budget_pauses_until_reset(self):
+        clock = FakeClock()
+        scheduler = RequestScheduler(max_rate=5.0, clock=clock)
+
+        scheduler.observe(200, {"RateLimit-Remaining": "0", "RateLimit-Reset": str(time.time() + 4)})
+
+        assert scheduler.try_acquire() == pytest.approx(4.0, abs=0.1)
+        assert scheduler.current_rate == 5.0
+        clock.now = 4.0
+        assert scheduler.try_acquire() == pytest.approx(0.0, abs=0.5)
+
+    def test_rate_follows_rate_limit_headers(self):
+        scheduler = RequestScheduler()
+        headers = {"RateLimit-Remaining": "100", "RateLimit-Reset": str(time.time() + 50)}
+
+        scheduler.observe(200, headers)
+
+        assert scheduler.current_rate == pytest.approx(2.0, rel=0.01)
+
+    def test_rate_never_exceeds_max_rate(self):
+        scheduler = RequestScheduler(max_rate=1.0)
+        headers = {"RateLimit-Remaining": "1000", "RateLimit-Reset": str(time.time() + 10)}
+
+        scheduler.observe(200, headers)
+
+        assert scheduler.current_rate == 1.0
+
+    def test_throttling_halves_rate_and_requests_retry(self):
+        scheduler = RequestScheduler(max_rate=10.0)
+
+        delay = scheduler.observe(429, {"Retry-After": "3"})
+
+        assert delay == 3.0
+        assert scheduler.current_rate == 5.0
+        assert scheduler.metrics().throttled == 1
+        assert scheduler.metrics().retries == 1
+
+    def test_retry_after_is_capped(self):
+        scheduler = RequestScheduler()
+
+        assert scheduler.observe(429, {"Retry-After": "86400"}) == RequestScheduler.BACKOFF_MAX
+
+    def test_server_errors_back_off_with_jitter(self):
+        scheduler = RequestScheduler()
+
+        delay = scheduler.observe(503, {}, attempt=3)
+
+        assert 0 <= delay <= RequestScheduler.BACKOFF_BASE * 2 ** 3
+
+    def test_no_retry_after_max_retries(self):
+        scheduler = RequestScheduler(max_retries=2)
+
+        assert scheduler.observe(503, {}, attempt=2) is None
+
+    def test_client_errors_are_not_retried(self):
+        scheduler = RequestScheduler()
+
+        assert scheduler.observe(404, {}) is None
+
+    def test_successes_recover_rate_after_throttling(self):
+        scheduler = RequestScheduler(max_rate=10.0)
+        scheduler.observe(429, {"Retry-After": "0"})
+
+        scheduler.observe(200, {})
+
+        assert 5.0 < scheduler.current_rate <= 10.0
+
+    def test_shared_scheduler_is_per_host(self):
+        first = shared_scheduler("https://shared-a.example.com/api/v4")
+        again = shared_scheduler("https://shared-a.example.com")
+        other = shared_scheduler("https://shared-b.example.com")
+
+        assert first is again
+        assert first is not other
+
+    def test_shared_scheduler_merges_later_limits(self):
+        first = shared_scheduler("https://shared-c.example.com", max_rate=10.0, max_retries=2)
+        again = shared_scheduler("https://shared-c.example.com", max_rate=4.0, max_retries=5)
+        unbounded = shared_scheduler("https://shared-c.example.com")
+
+        assert first is again is unbounded
+        assert first.max_rate == 4.0
+        assert first.current_rate == 4.0
+        assert first.max_retries == 5
+
+
+class TestApiHTTPAdapterScheduling:
+    @patch("dataextractor.infrastructure.http.adapter.time.sleep")
+    def test_retries_throttled_requests(self, mock_sleep):
+        scheduler = RequestScheduler()
+        adapter = ApiHTTPAdapter(scheduler=scheduler)
+        request = requests.Request("GET", "https://gitlab.example.com/api/v4/projects").prepare()
+        responses = [_response(429, {"Retry-After": "2"}), _response(200)]
+
+        with patch.object(HTTPAdapter, "send", side_effect=responses) as send:
+            response = adapter.send(request)
+
+        assert response.status_code == 200
+        assert send.call_count == 2
+        assert mock_sleep.call_args_list[0].args == (2.0,)
+        assert scheduler.metrics().requests == 2
@@ -17,6 +17,21 @@ class TestGitSettings:
         assert git.type == ""
         assert git.token == ""
         assert not git.projects
+        assert git.concurrency == 1
+        assert git.per_page == 100
+        assert git.backend == "rest"
+        assert git.graphql_extras is False
+        assert git.incremental is False
+        assert git.lean is False
+        assert git.max_rate == 0.0
+        assert git.max_retries == 5
+        assert git.skip_auth is False
+        assert git.http2 is False
+        assert git.state_dir == ""
+        assert git.http_cache is False
+        assert git.http_cache_max_mb == 256
+        assert git.mirror is False
+        assert git.mirror_dir == ""
 
 
 class TestJiraSettings:
@@ -26,6 +41,12 @@ class TestJiraSettings:
         assert jira.url == ""
         assert jira.version == ""
         assert jira.token == ""
+        assert jira.page_size == 100
+        assert jira.concurrency == 1
+        assert jira.incremental is False
+        assert jira.overlap_minutes == 5
+        assert not jira.fields
+        assert jira.field_cache_ttl_hours == 24.0
 
 
 class TestOutputSettings:
@@ -83,6 +104,47 @@ outputs:
         assert settings.outputs.logs_git_table_name == "git_logs"
         assert settings.outputs.logs_jira_table_name == "jira_logs"
 
+    def test_git_sources_inherit_shared_git_settings(self, tmp_path):
+        config_file = tmp_path / "sources.yaml"
+        config_file.write_text("""
+inputs:
+  git_token: shared-token
+  git_concurrency: 8
+  git_sources:
+    - name: eu
+      git_url: https://gitlab-eu.example.com
+      git_token: eu-token
+    - git_url: https://gitlab-us.example.com
+      git_projects: [group/app]
+""")
+
+        eu, us = Settings.load(config_file).for_each_git_source()
+
+        assert (eu.git.source, eu.git.url, eu.git.token) == ("eu", "https://gitlab-eu.example.com", "eu-token")
+        assert (us.git.source, us.git.token) == ("gitlab-us.example.com", "shared-token")
+        assert us.git.projects == ["group/app"]
+        assert eu.git.concurrency == us.git.concurrency == 8
+
+    def test_cli_projects_replace_every_source_allowlist(self, tmp_path):
+        config_file = tmp_path / "sources.yaml"
+        config_file.write_text("""
+inputs:
+  git_sources:
+    - git_url: https://gitlab-eu.example.com
+    - git_url: https://gitlab-us.example.com
+      git_projects: [group/app]
+""")
+
+        settings = Settings.load(config_file, cli_args=Namespace(git_projects=["group/lib"]))
+
+        assert [s.git.projects for s in settings.for_each_git_source()] == [["group/lib"], ["group/lib"]]
+
+    def test_without_sources_the_git_settings_are_the_only_source(self):
+        settings = Settings()
+
+        assert settings.for_each_git_source() == [settings]
+        assert settings.git.source == ""
+
     def test_default_factory_creates_empty_settings(self):
         settings = Settings()
 
@@ -180,6 +242,67 @@ outputs:
 
         assert settings.git.projects == ["cli-project1", "cli-project2"]
 
+    def test_cli_overrides_git_concurrency(self, tmp_path):
+        config_file = self._create_config_file(tmp_path)
+        args = self._create_cli_args(git_concurrency=8, git_per_page=50)
+
+        settings = Settings.load(config_file, cli_args=args)
+
+        assert settings.git.concurrency == 8
+        assert settings.git.per_page == 50
+
+    def test_per_page_is_clamped_to_gitlab_maximum(self, tmp_path):
+        config_file = self._create_config_file(tmp_path)
+        args = self._create_cli_args(git_per_page=200)
+
+        settings = Settings.load(config_file, cli_args=args)
+
+        assert settings.git.per_page == 100
+
+    def test_cli_overrides_git_backend(self, tmp_path):
+        config_file = self._create_config_file(tmp_path)
+        args = self._create_cli_args(git_backend="graphql", graphql_extras=True)
+
+        settings = Settings.load(config_file, cli_args=args)
+
+        assert settings.git.backend == "graphql"
+        assert settings.git.graphql_extras is True
+
+    def test_cli_enables_lean(self, tmp_path):
+        config_file = self._create_config_file(tmp_path)
+        args = self._create_cli_args(lean=True)
+
+        settings = Settings.load(config_file, cli_args=args)
+
+        assert settings.git.lean is True
+
+    def test_cli_enables_incremental(self, tmp_path):
+        config_file = self._create_config_file(tmp_path)
+        args = self._create_cli_args(incremental=True, git_state_dir="/tmp/state")
+
+        settings = Settings.load(config_file, cli_args=args)
+
+        assert settings.git.incremental is True
+        assert settings.git.state_dir == "/tmp/state"
+
+    def test_cli_overrides_http_cache_size(self, tmp_path):
+        config_file = self._create_config_file(tmp_path)
+        args = self._create_cli_args(http_cache=True, http_cache_max_mb=512)
+
+        settings = Settings.load(config_file, cli_args=args)
+
+        assert settings.git.http_cache is True
+        assert settings.git.http_cache_max_mb == 512
+
+    def test_cli_enables_mirror(self, tmp_path):
+        config_file = self._create_config_file(tmp_path)
+        args = self._create_cli_args(mirror=True, git_mirror_dir="/tmp/mirrors")
+
+        settings = Settings.load(config_file, cli_args=args)
+
+        assert settings.git.mirror is True
+        assert settings.git.mirror_dir == "/tmp/mirrors"
+
     def test_cli_overrides_jira_url(self, tmp_path):
         config_file = self._create_config_file(tmp_path)
         args = self._create_cli_args(jira_url="https://cli-jira.com")
@@ -188,6 +311,16 @@ outputs:
 
         assert settings.jira.url == "https://cli-jira.com"
 
+    def test_cli_overrides_jira_paging(self, tmp_path):
+        config_file = self._create_config_file(tmp_path)
+        args = self._create_cli_args(jira_page_size=50, jira_concurrency=8, jira_incremental=True)
+
+        settings = Settings.load(config_file, cli_args=args)
+
+        assert settings.jira.page_size == 50
+        assert settings.jira.concurrency == 8
+        assert settings.jira.incremental is True
+
     def test_cli_overrides_output_type(self, tmp_path):
         config_file = self._create_config_file(tmp_path)
         args = self._create_cli_args(output_type="mysql")
@@ -196,6 +329,23 @@ outputs:
 
         assert settings.outputs.type == "mysql"
 
+    def test_cli_git_url_replaces_configured_sources(self, tmp_path):
+        config_file = tmp_path / "sources.yaml"
+        config_file.write_text("inputs:\n  git_sources:\n    - git_url: https://gitlab-eu.example.com\n")
+        args = self._create_cli_args(git_url="https://cli-gitlab.com")
+
+        settings = Settings.load(config_file, cli_args=args)
+
+        assert [s.git.url for s in settings.for_each_git_source()] == ["https://cli-gitlab.com"]
+
+    def test_cli_overrides_output_compression(self, tmp_path):
+        config_file = self._create_config_file(tmp_path)
+        args = self._create_cli_args(output_compression="gzip")
+
+        settings = Settings.load(config_file, cli_args=args)
+
+        assert settings.outputs.compression == "gzip"
+
     def test_cli_overrides_db_url(self, tmp_path):
         config_file = self._create_config_file(tmp_path)
         args = self._create_cli_args(db_url="mysql://cli/db")
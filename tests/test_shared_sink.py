@@ -0,0 +1,86 @@
+import threading
+import time
+
+import pytest
+
+from dataextractor.core.interfaces import RowSink
+from dataextractor.infrastructure.output import SharedSink
+
+
+class RecordingSink(RowSink):
+    """Fails the test if two threads are ever inside it at once."""
+
+    def __init__(self):
+        self.rows: dict[str, list] = {}
+        self.inside = 0
+        self.overlapped = False
+        self.closed = False
+        self._guard = threading.Lock()
+
+    def write(self, table, rows):
+        with self._guard:
+            self.inside += 1
+            self.overlapped |= self.inside > 1
+        time.sleep(0.001)
+        self.rows.setdefault(table, []).extend(rows)
+        with self._guard:
+            self.inside -= 1
+
+    def close(self):
+        self.closed = True
+
+
+def _slow(rows, delay):
+    for row in rows:
+        time.sleep(delay)
+        yield row
+
+
+class TestSharedSink:
+    def test_syncs_from_two_threads_overlap_their_fetching(self):
+        inner = RecordingSink()
+        sink = SharedSink(inner)
+        threads = [
+            threading.Thread(target=sink.sync, args=(name, _slow(range(20), 0.01)))
+            for name in ("git_data", "jira_data")
+        ]
+
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        assert inner.rows == {"git_data": list(range(20)), "jira_data": list(range(20))}
+        assert not inner.overlapped
+        # Serial fetching would take 2 x 20 x 10 ms
+        assert elapsed < 0.35
+
+    def test_writes_are_serialized(self):
+        inner = RecordingSink()
+        sink = SharedSink(inner)
+        threads = [
+            threading.Thread(target=lambda n=n: [sink.write(f"t{n}", [i]) for i in range(50)]) for n in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not inner.overlapped
+        assert all(len(rows) == 50 for rows in inner.rows.values())
+
+    def test_failing_listing_releases_the_lock(self):
+        sink = SharedSink(RecordingSink())
+
+        def broken():
+            yield 1
+            raise ConnectionError("lost")
+
+        with pytest.raises(ConnectionError):
+            sink.sync("t", broken())
+
+        sink.write("t", [2])  # would deadlock if the lock were still held
+        sink.close()
+        assert sink.sink.closed
@@ -0,0 +1,147 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from dataextractor.core.entities import IssueInfo, ProjectInfo
+from dataextractor.core.interfaces import IssueRepository, RowSink, WatermarkStore
+from dataextractor.core.use_cases import SyncIssuesUseCase
+
+
+def _project(key):
+    return ProjectInfo(id=len(key), name=key, path_with_namespace=key, http_url="")
+
+
+def _issue(key, number, updated):
+    return IssueInfo(
+        id=number,
+        key=f"{key}-{number}",
+        project_key=key,
+        summary="",
+        issue_type="Bug",
+        status="Open",
+        created="2024-01-01T00:00:00.000+0000",
+        updated=updated,
+    )
+
+
+class MockIssueRepository(IssueRepository):
+    def __init__(self, issues):
+        self.issues = issues
+        self.calls = []
+
+    def iter_issues(self, projects, since=None):
+        self.calls.append(dict(since or {}))
+        keys = {p.path_with_namespace for p in projects}
+        yield from (i for i in self.issues if i.project_key in keys)
+
+
+class MemorySink(RowSink):
+    def __init__(self):
+        self.writes = []
+        self.synced = []
+
+    def write(self, table, rows):
+        self.writes.append((table, list(rows)))
+
+    def sync(self, table, rows, prune=True, sources=None):
+        rows = list(rows)
+        self.synced.append((table, rows))
+        return super().sync(table, rows, prune, sources)
+
+
+class MemoryWatermarkStore(WatermarkStore):
+    def __init__(self, watermarks=None):
+        self.watermarks = dict(watermarks or {})
+        self.saves = 0
+
+    def load(self):
+        return dict(self.watermarks)
+
+    def save(self, watermarks):
+        self.saves += 1
+        self.watermarks = dict(watermarks)
+
+
+class TestSyncIssuesUseCase:
+    def test_first_run_syncs_the_complete_listing(self):
+        repository = MockIssueRepository([
+            _issue("APP", 1, "2024-01-02T10:00:00.000+0000"),
+            _issue("APP", 2, "2024-01-05T10:00:00.000+0000"),
+            _issue("WEB", 3, "2024-01-03T10:00:00.000+0000"),
+        ])
+        sink = MemorySink()
+        store = MemoryWatermarkStore()
+
+        result = SyncIssuesUseCase(repository, sink, store, "issues").execute([_project("APP"), _project("WEB")])
+
+        assert repository.calls == [{}]
+        assert [t for t, _ in sink.synced] == ["issues"]
+        assert not result.incremental
+        assert result.rows == 3
+        assert result.changes.inserted == 3
+        assert store.watermarks == {
+            "APP": "2024-01-05T10:00:00+00:00",
+            "WEB": "2024-01-03T10:00:00+00:00",
+        }
+
+    def test_searches_from_watermark_minus_overlap_and_only_writes(self):
+        repository = MockIssueRepository([_issue("APP", 2, "2024-01-06T10:00:00.000+0000")])
+        sink = MemorySink()
+        store = MemoryWatermarkStore({"APP": "2024-01-05T10:00:00+00:00"})
+
+        result = SyncIssuesUseCase(
+            repository, sink, store, "issues", overlap=timedelta(minutes=10)
+        ).execute([_project("APP"), _project("NEW")])
+
+        assert repository.calls == [{"APP": "2024-01-05T09:50:00+00:00"}]
+        assert not sink.synced  # a partial listing must not delete anything
+        assert sink.writes == [("issues", repository.issues)]
+        assert result.incremental
+        assert result.rows == 1
+        assert result.changes is None
+        assert store.watermarks == {"APP": "2024-01-06T10:00:00+00:00"}
+
+    def test_quiet_project_keeps_its_watermark(self):
+        store = MemoryWatermarkStore({"APP": "2024-01-05T10:00:00+00:00", "GONE": "2024-01-01T00:00:00+00:00"})
+
+        SyncIssuesUseCase(MockIssueRepository([]), MemorySink(), store, "issues").execute([_project("APP")])
+
+        assert store.watermarks == {"APP": "2024-01-05T10:00:00+00:00"}
+
+    def test_watermark_never_passes_the_start_of_the_run(self):
+        # An issue stamped in the future (server clock ahead of ours)
+        future = (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat()
+        store = MemoryWatermarkStore()
+        before = datetime.now(timezone.utc)
+
+        SyncIssuesUseCase(MockIssueRepository([_issue("APP", 1, future)]), MemorySink(), store, "issues").execute(
+            [_project("APP")]
+        )
+
+        mark = datetime.fromisoformat(store.watermarks["APP"])
+        assert before <= mark <= datetime.now(timezone.utc)
+
+    def test_full_refresh_ignores_watermarks(self):
+        repository = MockIssueRepository([_issue("APP", 1, "2024-01-02T10:00:00.000+0000")])
+        sink = MemorySink()
+        store = MemoryWatermarkStore({"APP": "2024-01-05T10:00:00+00:00"})
+
+        SyncIssuesUseCase(repository, sink, store, "issues").execute([_project("APP")], full_refresh=True)
+
+        assert repository.calls == [{}]
+        assert len(sink.synced) == 1
+        assert store.watermarks == {"APP": "2024-01-02T10:00:00+00:00"}
+
+    def test_failed_search_keeps_previous_watermarks(self):
+        class FailingRepository(IssueRepository):
+            def iter_issues(self, projects, since=None):
+                yield _issue("APP", 1, "2024-01-09T10:00:00.000+0000")
+                raise ConnectionError("lost")
+
+        store = MemoryWatermarkStore({"APP": "2024-01-05T10:00:00+00:00"})
+
+        with pytest.raises(ConnectionError):
+            SyncIssuesUseCase(FailingRepository(), MemorySink(), store, "issues").execute([_project("APP")])
+
+        assert store.saves == 0
+        assert store.watermarks == {"APP": "2024-01-05T10:00:00+00:00"}
@@ -0,0 +1,90 @@
+from dataextractor.core.entities import ProjectInfo, ProjectSnapshot
+from dataextractor.core.interfaces import ProjectRepository, ProjectStateStore
+from dataextractor.core.use_cases import SyncProjectsUseCase
+from tests.conftest import make_project
+
+
+def _project(project_id, last_activity_at, access_level=30):
+    return make_project(project_id, last_activity_at=last_activity_at, access_level=access_level)
+
+
+class MockProjectRepository(ProjectRepository):
+    def __init__(self, projects: list[ProjectInfo], changed: list[ProjectInfo] | None = None):
+        self._projects = projects
+        self._changed = changed or []
+        self.changed_since: list[str] = []
+
+    def get_all_projects(self) -> list[ProjectInfo]:
+        return self._projects
+
+    def get_projects_changed_since(self, since: str) -> list[ProjectInfo]:
+        self.changed_since.append(since)
+        return self._changed
+
+
+class MemoryStateStore(ProjectStateStore):
+    def __init__(self, snapshot: ProjectSnapshot | None = None):
+        self.snapshot = snapshot
+
+    def load(self) -> ProjectSnapshot | None:
+        return self.snapshot
+
+    def save(self, snapshot: ProjectSnapshot) -> None:
+        self.snapshot = snapshot
+
+
+class TestSyncProjectsUseCase:
+    def test_first_run_lists_everything_and_stores_watermark(self):
+        projects = [
+            _project(1, "2024-01-01T10:00:00.000Z"),
+            _project(2, "2024-01-03T10:00:00.000Z"),
+        ]
+        repository = MockProjectRepository(projects)
+        store = MemoryStateStore()
+
+        result = SyncProjectsUseCase(repository, store).execute()
+
+        assert result == projects
+        assert not repository.changed_since
+        assert store.snapshot.watermark == "2024-01-03T10:00:00.000Z"
+        assert store.snapshot.projects == projects
+
+    def test_incremental_run_merges_changes_into_snapshot(self):
+        previous = [
+            _project(1, "2024-01-01T10:00:00.000Z"),
+            _project(2, "2024-01-02T10:00:00.000Z"),
+        ]
+        changed = [
+            _project(2, "2024-01-05T10:00:00.000Z", access_level=40),
+            _project(3, "2024-01-04T10:00:00.000Z"),
+        ]
+        repository = MockProjectRepository([], changed)
+        store = MemoryStateStore(ProjectSnapshot("2024-01-02T10:00:00.000Z", previous))
+
+        result = SyncProjectsUseCase(repository, store).execute()
+
+        assert repository.changed_since == ["2024-01-02T10:00:00.000Z"]
+        assert [p.id for p in result] == [1, 2, 3]
+        assert result[1].access_level == 40
+        assert store.snapshot.watermark == "2024-01-05T10:00:00.000Z"
+
+    def test_full_refresh_ignores_snapshot(self):
+        previous = [_project(1, "2024-01-01T10:00:00.000Z")]
+        current = [_project(2, "2024-01-02T10:00:00.000Z")]
+        repository = MockProjectRepository(current)
+        store = MemoryStateStore(ProjectSnapshot("2024-01-01T10:00:00.000Z", previous))
+
+        result = SyncProjectsUseCase(repository, store).execute(full_refresh=True)
+
+        assert result == current
+        assert not repository.changed_since
+        assert store.snapshot.projects == current
+
+    def test_watermark_kept_when_no_activity_timestamps(self):
+        previous = [_project(1, None)]
+        repository = MockProjectRepository([], [])
+        store = MemoryStateStore(ProjectSnapshot("2024-01-01T10:00:00.000Z", previous))
+
+        SyncProjectsUseCase(repository, store).execute()
+
+        assert store.snapshot.watermark == "2024-01-01T10:00:00.000Z"
@@ -0,0 +1,75 @@
+import asyncio
+import threading
+import time
+from contextlib import aclosing
+
+from dataextractor.infrastructure.windowed import async_windowed_map, windowed_map
+
+
+class TestWindowedMap:
+    def test_results_keep_item_order(self):
+        def slow_first(n):
+            time.sleep(0.02 if n == 0 else 0)
+            return n * 2
+
+        assert list(windowed_map(slow_first, range(6), window=3)) == [0, 2, 4, 6, 8, 10]
+
+    def test_never_runs_more_than_window_calls(self):
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def track(n):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.005)
+            with lock:
+                running -= 1
+            return n
+
+        assert list(windowed_map(track, range(20), window=3)) == list(range(20))
+        assert peak <= 3
+
+    def test_items_are_pulled_as_slots_free_up(self):
+        pulled = []
+
+        def items():
+            for n in range(100):
+                pulled.append(n)
+                yield n
+
+        results = windowed_map(lambda n: n, items(), window=2)
+        next(results)
+        results.close()
+
+        assert len(pulled) <= 3
+
+
+class TestAsyncWindowedMap:
+    def test_results_keep_item_order(self):
+        async def slow_first(n):
+            await asyncio.sleep(0.02 if n == 0 else 0)
+            return n * 2
+
+        async def collect():
+            return [r async for r in async_windowed_map(slow_first, range(6), window=3)]
+
+        assert asyncio.run(collect()) == [0, 2, 4, 6, 8, 10]
+
+    def test_closing_cancels_calls_in_flight(self):
+        async def wait(n):
+            await asyncio.sleep(0 if n == 0 else 5)
+            return n
+
+        async def first_only():
+            async with aclosing(async_windowed_map(wait, range(10), window=3)) as results:
+                first = await anext(results)
+            await asyncio.sleep(0)  # let the cancellations land
+            return first, asyncio.all_tasks() - {asyncio.current_task()}
+
+        first, leftover = asyncio.run(first_only())
+
+        assert first == 0
+        assert not leftover